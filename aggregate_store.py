@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+from money import parse_brl
+
+APPROVED_STATUSES = ('APROVADO', 'VERIFICADO')
+LEGACY_CONTRACT_PATTERN = r'^[12]\d{5,6}$'
+# Bytes hashed at the start and at the old end of the file to confirm an append
+BOUNDARY_BLOCK_SIZE = 64 * 1024
+
+
+def clean_currency(series):
+    """Convert 'R$ 1.234,56' strings to floats (unparseable values become 0)"""
+    return parse_brl(series, lenient=True).fillna(0)
+
+
+def grouped_kpis(df, by, values=None, value_column='VALOR DO CLIENTE'):
+    """Total, approved, success rate and value per distinct value of `by` in one grouped pass.
+
+    `by` can be any column (NEGOCIAÇÃO, BANCO, CAMPANHA, CONTATO...). Pass
+    `values` to reuse an already cleaned value series aligned with df.
+    Rows where `by` is missing are left out. Keys keep first-appearance order.
+    """
+    if values is None:
+        values = clean_currency(df[value_column])
+
+    frame = pd.DataFrame({
+        'key': df[by],
+        'approved': df['SITUAÇÃO'].isin(APPROVED_STATUSES),
+        'value': values
+    })
+    kpis = frame.groupby('key', sort=False, dropna=True, observed=True).agg(
+        total=('approved', 'size'),
+        approved=('approved', 'sum'),
+        value=('value', 'sum')
+    )
+    kpis['success_rate'] = kpis['approved'] / kpis['total'] * 100
+    kpis.index.name = by
+    return kpis
+
+
+def _value_counts(series):
+    """value_counts without the zero rows categoricals report for unused categories"""
+    counts = series.value_counts()
+    return counts[counts > 0].to_dict()
+
+
+def legacy_contract_mask(contracts):
+    """Contracts numbered 1xxxxx(x) or 2xxxxx(x), the pre-migration portfolio"""
+    if pd.api.types.is_integer_dtype(contracts):
+        mask = contracts.between(100000, 299999) | contracts.between(1000000, 2999999)
+        return mask.fillna(False).astype(bool)
+    return contracts.astype(str).str.match(LEGACY_CONTRACT_PATTERN)
+
+
+class ContractAggregates:
+    """Mergeable partial aggregates behind the dashboard statistics.
+
+    Every field is a sum, count, min, max or per-key counter, so the
+    aggregates of two disjoint sets of rows can be merged without looking
+    at the rows again.
+    """
+
+    def __init__(self):
+        self.total_contracts = 0
+        self.legacy_contracts = 0
+        self.value_sum = 0.0
+        self.value_count = 0
+        self.value_min = None
+        self.value_max = None
+        self.sem_sucesso = 0
+        self.dias_sum = 0.0
+        self.dias_count = 0
+        self.status_counts = Counter()
+        self.bank_counts = Counter()
+        self.campaign_counts = Counter()
+        self.negotiators = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the aggregates of a cleaned contracts frame"""
+        agg = cls()
+        agg.total_contracts = len(df)
+        if df.empty:
+            return agg
+
+        legacy = df[legacy_contract_mask(df['CONTRATO'])]
+        agg.legacy_contracts = len(legacy)
+        if legacy.empty:
+            return agg
+
+        values = clean_currency(legacy['VALOR DO CLIENTE'])
+        agg.value_sum = float(values.sum())
+        agg.value_count = len(values)
+        agg.value_min = float(values.min())
+        agg.value_max = float(values.max())
+        agg.sem_sucesso = int((legacy['CONTATO'] == 'SEM SUCESSO').sum())
+
+        dias = (legacy['RESOLUÇÃO'] - legacy['DATA']).dt.days.dropna()
+        agg.dias_sum = float(dias.sum())
+        agg.dias_count = len(dias)
+
+        agg.status_counts.update(_value_counts(legacy['SITUAÇÃO']))
+        agg.bank_counts.update(_value_counts(legacy['CONTATO']))
+        agg.campaign_counts.update(_value_counts(legacy['CAMPANHA']))
+
+        kpis = grouped_kpis(legacy, 'NEGOCIAÇÃO', values=values)
+        for negotiator, total, approved, value in zip(
+            kpis.index, kpis['total'], kpis['approved'], kpis['value']
+        ):
+            agg.negotiators[negotiator] = {
+                "total": int(total),
+                "approved": int(approved),
+                "value": float(value)
+            }
+
+        return agg
+
+    def merge(self, other):
+        """Fold another set of aggregates into this one"""
+        self.total_contracts += other.total_contracts
+        self.legacy_contracts += other.legacy_contracts
+        self.value_sum += other.value_sum
+        self.value_count += other.value_count
+        if other.value_count:
+            self.value_min = other.value_min if self.value_min is None else min(self.value_min, other.value_min)
+            self.value_max = other.value_max if self.value_max is None else max(self.value_max, other.value_max)
+        self.sem_sucesso += other.sem_sucesso
+        self.dias_sum += other.dias_sum
+        self.dias_count += other.dias_count
+        self.status_counts.update(other.status_counts)
+        self.bank_counts.update(other.bank_counts)
+        self.campaign_counts.update(other.campaign_counts)
+        for negotiator, partial in other.negotiators.items():
+            current = self.negotiators.setdefault(negotiator, {"total": 0, "approved": 0, "value": 0.0})
+            current["total"] += partial["total"]
+            current["approved"] += partial["approved"]
+            current["value"] += partial["value"]
+        return self
+
+    def to_stats(self):
+        """Render the aggregates in the dict shape expected by dashboard.html"""
+        num_legacy = self.legacy_contracts
+        approved_count = sum(self.status_counts.get(status, 0) for status in APPROVED_STATUSES)
+
+        negotiator_stats = {}
+        for negotiator, partial in self.negotiators.items():
+            negotiator_stats[negotiator] = {
+                "total_contratos": partial["total"],
+                "aprovados": partial["approved"],
+                "taxa_sucesso": (partial["approved"] / partial["total"] * 100) if partial["total"] > 0 else 0,
+                "valor_total": partial["value"]
+            }
+
+        return {
+            "total_contracts": self.total_contracts,
+            "legacy_contracts": num_legacy,
+            "percent_legacy": round((num_legacy / self.total_contracts) * 100, 2) if self.total_contracts else 0,
+            "status_counts": dict(self.status_counts.most_common()),
+            "financial": {
+                "total_value": self.value_sum,
+                "average_value": self.value_sum / self.value_count if self.value_count else 0,
+                "max_value": self.value_max if self.value_max is not None else 0,
+                "min_value": self.value_min if self.value_min is not None else 0,
+                "sem_sucesso": self.sem_sucesso
+            },
+            "performance": {
+                "taxa_aprovacao": (approved_count / num_legacy * 100) if num_legacy > 0 else 0,
+                "media_dias_resolucao": self.dias_sum / self.dias_count if self.dias_count else 0,
+                "contratos_sim": self.campaign_counts.get('SIM', 0),
+                "contratos_nao": self.campaign_counts.get('NÃO', 0)
+            },
+            "negotiators": negotiator_stats,
+            "bank_distribution": dict(self.bank_counts.most_common()),
+            "campaign_distribution": dict(self.campaign_counts.most_common())
+        }
+
+
+class IncrementalContractStats:
+    """Keeps ContractAggregates in sync with a CSV that mostly grows by appends.
+
+    When the file only gained rows since the last refresh, just the new bytes
+    are parsed and merged into the stored aggregates. Any other change
+    (rewrite, truncation, edit near the old end) triggers a full rebuild.
+    With `chunksize` set, full rebuilds stream the file in chunks of that many
+    rows instead of loading it whole, so memory stays bounded on large exports.
+    """
+
+    def __init__(self, data_loader, chunksize=None):
+        self.data_loader = data_loader
+        self.chunksize = chunksize
+        self.file_path = Path(data_loader.file_path)
+        self.aggregates = None
+        self.columns = None
+        self._offset = 0
+        self._mtime_ns = None
+        self._boundary = None
+        self._stats = None
+        self._lock = threading.Lock()
+
+    def _boundary_digest(self, f, offset):
+        """Hash the head of the file and the block just before offset"""
+        digest = hashlib.sha256()
+        f.seek(0)
+        digest.update(f.read(min(BOUNDARY_BLOCK_SIZE, offset)))
+        start = max(0, offset - BOUNDARY_BLOCK_SIZE)
+        f.seek(start)
+        digest.update(f.read(offset - start))
+        return digest.hexdigest()
+
+    def _rebuild(self):
+        stat = self.file_path.stat()
+        if self.chunksize:
+            self.aggregates = ContractAggregates()
+            for chunk in self.data_loader.iter_chunks(self.chunksize):
+                self.aggregates.merge(ContractAggregates.from_frame(chunk))
+                self.columns = list(chunk.columns)
+        else:
+            df = self.data_loader.load_csv()
+            self.aggregates = ContractAggregates.from_frame(df)
+            self.columns = list(df.columns)
+
+        with open(self.file_path, 'rb') as f:
+            f.seek(max(0, stat.st_size - 1))
+            ends_with_newline = f.read(1) == b'\n'
+            self._offset = stat.st_size
+            self._boundary = self._boundary_digest(f, self._offset) if ends_with_newline else None
+        self._mtime_ns = stat.st_mtime_ns
+
+        # Written to while we were loading: the frame may hold rows past the offset
+        after = self.file_path.stat()
+        if after.st_size != stat.st_size or after.st_mtime_ns != stat.st_mtime_ns:
+            self._boundary = None
+            self._mtime_ns = None
+        logging.info(f"Agregados reconstruídos: {self.aggregates.total_contracts} linhas")
+
+    def _apply_appended_rows(self, size):
+        """Merge rows appended after the stored offset; False if the file was not just appended"""
+        if self._boundary is None or self.columns is None or size <= self._offset:
+            return False
+
+        with open(self.file_path, 'rb') as f:
+            if self._boundary_digest(f, self._offset) != self._boundary:
+                return False
+            f.seek(self._offset)
+            appended = f.read(size - self._offset)
+
+        # Leave a half-written trailing row for the next refresh
+        complete = appended[:appended.rfind(b'\n') + 1]
+        if complete:
+            delta = self.data_loader.parse_rows(complete, self.columns)
+            self.aggregates.merge(ContractAggregates.from_frame(delta))
+            self._offset += len(complete)
+            with open(self.file_path, 'rb') as f:
+                self._boundary = self._boundary_digest(f, self._offset)
+            logging.info(f"Agregados atualizados com {len(delta)} novas linhas")
+        return True
+
+    def refresh(self):
+        """Bring the aggregates up to date with the file and return the stats dict"""
+        with self._lock:
+            stat = self.file_path.stat()
+            if self.aggregates is not None and stat.st_size == self._offset and stat.st_mtime_ns == self._mtime_ns:
+                return self._stats
+
+            if self.aggregates is None or not self._apply_appended_rows(stat.st_size):
+                self._rebuild()
+            else:
+                self._mtime_ns = stat.st_mtime_ns
+
+            self._stats = self.aggregates.to_stats()
+            return self._stats
@@ -1,207 +1,313 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime
-
-def prepare_features(df):
-    """Prepare features with proper column name handling"""
-    try:
-        # Create copy and clean column names
-        df = df.copy()
-        
-        # Show original column names for debugging
-        print("Original columns:", df.columns.tolist())
-        
-        # Clean column names - remove trailing/leading spaces
-        df.columns = df.columns.str.strip()
-        
-        # Handle PRAZO columns specifically
-        prazo_b_col = [col for col in df.columns if 'PRAZO B' in col][0]
-        prazo_7_col = [col for col in df.columns if 'PRAZO 7' in col][0]
-        
-        # Rename columns without spaces
-        df = df.rename(columns={
-            prazo_b_col: 'PRAZOB',
-            prazo_7_col: 'PRAZO7'
-        })
-        
-        # Convert PRAZO values to numeric
-        df['PRAZOB'] = pd.to_numeric(df['PRAZOB'].astype(str).str.replace(',','.'), errors='coerce')
-        df['PRAZO7'] = pd.to_numeric(df['PRAZO7'].astype(str).str.replace(',','.'), errors='coerce')
-        
-        # Convert dates safely
-        date_cols = ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA']
-        for col in date_cols:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
-        
-        # Create temporal features
-        current_date = pd.Timestamp.now()
-        df['dias_desde_ultimo_pagamento'] = (current_date - df['ÚLTIMO PAGAMENTO']).dt.days
-        df['dias_ate_resolucao'] = (df['RESOLUÇÃO'] - current_date).dt.days
-        df['dias_ate_entrada'] = (df['ENTRADA'] - current_date).dt.days
-        
-        # Extract numeric values from monetary columns
-        if 'VALOR DO CLIENTE' in df.columns:
-            df['VALOR_CLIENTE'] = df['VALOR DO CLIENTE'].str.extract(r'R\$\s*([\d,.]+)', expand=False)
-            df['VALOR_CLIENTE'] = pd.to_numeric(
-                df['VALOR_CLIENTE'].str.replace('.','').str.replace(',','.'), 
-                errors='coerce'
-            )
-        
-        # Create derived features
-        df['tem_contato'] = df['CONTATO'].notna().astype(int)
-        df['tem_negociacao'] = df['NEGOCIAÇÃO'].notna().astype(int)
-        df['tem_campanha'] = df['CAMPANHA'].fillna('NAO').map({'SIM': 1, 'NAO': 0})
-        
-        # Encode categorical variables
-        for col in ['ESCRITÓRIO', 'BANCO', 'SITUAÇÃO']:
-            if col in df.columns:
-                df[f'{col}_encoded'] = pd.Categorical(df[col]).codes
-        
-        # Select final features
-        feature_cols = [
-            'PRAZOB', 'PRAZO7',
-            'dias_desde_ultimo_pagamento', 'dias_ate_resolucao', 
-            'dias_ate_entrada', 'tem_contato', 'tem_negociacao',
-            'tem_campanha'
-        ] + [col for col in df.columns if '_encoded' in col]
-        
-        print("\nProcessed features:", feature_cols)
-        return df[feature_cols].fillna(-1)
-        
-    except Exception as e:
-        print(f"Error in prepare_features: {str(e)}")
-        print("Available columns:", df.columns.tolist())
-        raise
-
-def analyze_deadlines(df):
-    """Analyze relationship between PRAZO 7 and PRAZO B"""
-    try:
-        # Clean and prepare data
-        prazo_data = prepare_features(df)
-        
-        # Calculate correlations
-        correlation = prazo_data[['PRAZOB', 'PRAZO7']].corr()
-        
-        # Analyze distributions
-        prazo_stats = {
-            'PRAZO B': prazo_data['PRAZOB'].describe(),
-            'PRAZO 7': prazo_data['PRAZO7'].describe()
-        }
-        
-        # Create priority categories
-        prazo_data['prioridade'] = pd.cut(
-            prazo_data['PRAZOB'],
-            bins=[-np.inf, 0, 5, 10, 15, np.inf],
-            labels=['VENCIDO', 'URGENTE', 'ALTA', 'MÉDIA', 'NORMAL']
-        )
-        
-        print("\n=== Análise de Prazos ===")
-        print("\nCorrelação entre PRAZO B e PRAZO 7:")
-        print(correlation)
-        
-        print("\nEstatísticas PRAZO B:")
-        print(prazo_stats['PRAZO B'])
-        
-        print("\nEstatísticas PRAZO 7:")
-        print(prazo_stats['PRAZO 7'])
-        
-        print("\nDistribuição de Prioridades:")
-        print(prazo_data['prioridade'].value_counts())
-        
-        return prazo_data
-        
-    except Exception as e:
-        print(f"Error in analyze_deadlines: {str(e)}")
-        raise
-
-def analyze_quitado_journey(df):
-    """Analyze the journey towards QUITADO status"""
-    try:
-        # Create copy and clean data
-        df = df.copy()
-        
-        # Convert dates
-        df['ENTRADA'] = pd.to_datetime(df['ENTRADA'], format='%d/%m/%Y', errors='coerce')
-        df['RESOLUÇÃO'] = pd.to_datetime(df['RESOLUÇÃO'], format='%d/%m/%Y', errors='coerce')
-        
-        # Calculate days between ENTRADA and RESOLUÇÃO
-        df['dias_processo'] = (df['RESOLUÇÃO'] - df['ENTRADA']).dt.days
-        
-        # Group by SITUAÇÃO and analyze
-        situacao_analysis = df.groupby('SITUAÇÃO').agg({
-            'dias_processo': ['count', 'mean', 'min', 'max'],
-            'PRAZO B': 'mean',
-            'PRAZO 7': 'mean'
-        }).round(2)
-        
-        # Calculate conversion rates
-        total_cases = len(df)
-        status_flow = {
-            'PENDENTE': len(df[df['SITUAÇÃO'] == 'PENDENTE']),
-            'ANÁLISE': len(df[df['SITUAÇÃO'] == 'ANÁLISE']),
-            'APROVADO': len(df[df['SITUAÇÃO'] == 'APROVADO']),
-            'QUITADO': len(df[df['SITUAÇÃO'] == 'QUITADO'])
-        }
-        
-        conversion_rates = {
-            'pendente_to_analise': (status_flow['ANÁLISE'] / status_flow['PENDENTE'] * 100),
-            'analise_to_aprovado': (status_flow['APROVADO'] / status_flow['ANÁLISE'] * 100),
-            'aprovado_to_quitado': (status_flow['QUITADO'] / status_flow['APROVADO'] * 100) if status_flow['APROVADO'] > 0 else 0
-        }
-        
-        print("\n=== Análise de Jornada para QUITADO ===")
-        print("\nEstatísticas por Situação:")
-        print(situacao_analysis)
-        
-        print("\nMétricas de Conversão:")
-        print(f"Pendente → Análise: {conversion_rates['pendente_to_analise']:.1f}%")
-        print(f"Análise → Aprovado: {conversion_rates['analise_to_aprovado']:.1f}%")
-        print(f"Aprovado → Quitado: {conversion_rates['aprovado_to_quitado']:.1f}%")
-        
-        # Calculate goals and projections
-        avg_days_to_quitado = df[df['SITUAÇÃO'].isin(['APROVADO', 'QUITADO'])]['dias_processo'].mean()
-        success_rate = status_flow['QUITADO'] / total_cases * 100 if total_cases > 0 else 0
-        
-        print("\nMetas e Projeções:")
-        print(f"Tempo Médio até Quitação: {avg_days_to_quitado:.1f} dias")
-        print(f"Taxa de Sucesso Atual: {success_rate:.1f}%")
-        
-        # Identify high-potential cases
-        high_potential = df[
-            (df['SITUAÇÃO'] == 'ANÁLISE') & 
-            (df['PRAZO B'] <= df['PRAZO B'].median()) &
-            (df['dias_processo'] <= df['dias_processo'].median())
-        ]
-        
-        print(f"\nCasos com Alto Potencial de Quitação: {len(high_potential)}")
-        if len(high_potential) > 0:
-            print("\nTop 5 Casos Prioritários:")
-            priority_cols = ['CONTRATO', 'BANCO', 'PRAZO B', 'dias_processo']
-            print(high_potential[priority_cols].head())
-        
-        return {
-            'situacao_analysis': situacao_analysis,
-            'conversion_rates': conversion_rates,
-            'high_potential_cases': high_potential
-        }
-        
-    except Exception as e:
-        print(f"Error in analyze_quitado_journey: {str(e)}")
-        raise
-
-# Main execution
-if __name__ == "__main__":
-    try:
-        file_path = r"C:\Users\igor de jesus\zaptest\(JULIO) LISTAS INDIVIDUAIS - IGOR.csv"
-        df = pd.read_csv(file_path, encoding='utf-8')
-        
-        # Run both analyses
-        deadline_results = analyze_deadlines(df)
-        journey_results = analyze_quitado_journey(df)
-        
-        # Export results
-        pd.DataFrame(journey_results['high_potential_cases']).to_csv('priority_cases.csv', index=False)
-        
-    except Exception as e:
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import sys
+from collections import Counter
+from csv_loader import iter_csv_chunks, read_csv
+from money import parse_brl
+
+PRIORITY_BINS = [-np.inf, 0, 5, 10, 15, np.inf]
+PRIORITY_LABELS = ['VENCIDO', 'URGENTE', 'ALTA', 'MÉDIA', 'NORMAL']
+
+def prepare_features(df):
+    """Prepare features with proper column name handling"""
+    try:
+        # Create copy and clean column names
+        df = df.copy()
+        
+        # Show original column names for debugging
+        print("Original columns:", df.columns.tolist())
+        
+        # Clean column names - remove trailing/leading spaces
+        df.columns = df.columns.str.strip()
+        
+        # Handle PRAZO columns specifically
+        prazo_b_col = [col for col in df.columns if 'PRAZO B' in col][0]
+        prazo_7_col = [col for col in df.columns if 'PRAZO 7' in col][0]
+        
+        # Rename columns without spaces
+        df = df.rename(columns={
+            prazo_b_col: 'PRAZOB',
+            prazo_7_col: 'PRAZO7'
+        })
+        
+        # Convert PRAZO values to numeric
+        df['PRAZOB'] = pd.to_numeric(df['PRAZOB'].astype(str).str.replace(',','.'), errors='coerce')
+        df['PRAZO7'] = pd.to_numeric(df['PRAZO7'].astype(str).str.replace(',','.'), errors='coerce')
+        
+        # Convert dates safely
+        date_cols = ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA']
+        for col in date_cols:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
+        
+        # Create temporal features
+        current_date = pd.Timestamp.now()
+        df['dias_desde_ultimo_pagamento'] = (current_date - df['ÚLTIMO PAGAMENTO']).dt.days
+        df['dias_ate_resolucao'] = (df['RESOLUÇÃO'] - current_date).dt.days
+        df['dias_ate_entrada'] = (df['ENTRADA'] - current_date).dt.days
+        
+        # Extract numeric values from monetary columns
+        if 'VALOR DO CLIENTE' in df.columns:
+            df['VALOR_CLIENTE'] = parse_brl(df['VALOR DO CLIENTE'], lenient=True)
+        
+        # Create derived features
+        df['tem_contato'] = df['CONTATO'].notna().astype(int)
+        df['tem_negociacao'] = df['NEGOCIAÇÃO'].notna().astype(int)
+        df['tem_campanha'] = df['CAMPANHA'].fillna('NAO').map({'SIM': 1, 'NAO': 0})
+        
+        # Encode categorical variables
+        for col in ['ESCRITÓRIO', 'BANCO', 'SITUAÇÃO']:
+            if col in df.columns:
+                df[f'{col}_encoded'] = pd.Categorical(df[col]).codes
+        
+        # Select final features
+        feature_cols = [
+            'PRAZOB', 'PRAZO7',
+            'dias_desde_ultimo_pagamento', 'dias_ate_resolucao', 
+            'dias_ate_entrada', 'tem_contato', 'tem_negociacao',
+            'tem_campanha'
+        ] + [col for col in df.columns if '_encoded' in col]
+        
+        print("\nProcessed features:", feature_cols)
+        return df[feature_cols].fillna(-1)
+        
+    except Exception as e:
+        print(f"Error in prepare_features: {str(e)}")
+        print("Available columns:", df.columns.tolist())
+        raise
+
+def analyze_deadlines(df):
+    """Analyze relationship between PRAZO 7 and PRAZO B"""
+    try:
+        # Clean and prepare data
+        prazo_data = prepare_features(df)
+        
+        # Calculate correlations
+        correlation = prazo_data[['PRAZOB', 'PRAZO7']].corr()
+        
+        # Analyze distributions
+        prazo_stats = {
+            'PRAZO B': prazo_data['PRAZOB'].describe(),
+            'PRAZO 7': prazo_data['PRAZO7'].describe()
+        }
+        
+        # Create priority categories
+        prazo_data['prioridade'] = pd.cut(
+            prazo_data['PRAZOB'],
+            bins=PRIORITY_BINS,
+            labels=PRIORITY_LABELS
+        )
+        
+        print("\n=== Análise de Prazos ===")
+        print("\nCorrelação entre PRAZO B e PRAZO 7:")
+        print(correlation)
+        
+        print("\nEstatísticas PRAZO B:")
+        print(prazo_stats['PRAZO B'])
+        
+        print("\nEstatísticas PRAZO 7:")
+        print(prazo_stats['PRAZO 7'])
+        
+        print("\nDistribuição de Prioridades:")
+        print(prazo_data['prioridade'].value_counts())
+        
+        return prazo_data
+        
+    except Exception as e:
+        print(f"Error in analyze_deadlines: {str(e)}")
+        raise
+
+def analyze_quitado_journey(df):
+    """Analyze the journey towards QUITADO status"""
+    try:
+        # Create copy and clean data
+        df = df.copy()
+        
+        # Convert dates
+        df['ENTRADA'] = pd.to_datetime(df['ENTRADA'], format='%d/%m/%Y', errors='coerce')
+        df['RESOLUÇÃO'] = pd.to_datetime(df['RESOLUÇÃO'], format='%d/%m/%Y', errors='coerce')
+        
+        # Calculate days between ENTRADA and RESOLUÇÃO
+        df['dias_processo'] = (df['RESOLUÇÃO'] - df['ENTRADA']).dt.days
+        
+        # Group by SITUAÇÃO and analyze
+        situacao_analysis = df.groupby('SITUAÇÃO').agg({
+            'dias_processo': ['count', 'mean', 'min', 'max'],
+            'PRAZO B': 'mean',
+            'PRAZO 7': 'mean'
+        }).round(2)
+        
+        # Calculate conversion rates
+        total_cases = len(df)
+        status_flow = {
+            'PENDENTE': len(df[df['SITUAÇÃO'] == 'PENDENTE']),
+            'ANÁLISE': len(df[df['SITUAÇÃO'] == 'ANÁLISE']),
+            'APROVADO': len(df[df['SITUAÇÃO'] == 'APROVADO']),
+            'QUITADO': len(df[df['SITUAÇÃO'] == 'QUITADO'])
+        }
+        
+        conversion_rates = {
+            'pendente_to_analise': (status_flow['ANÁLISE'] / status_flow['PENDENTE'] * 100),
+            'analise_to_aprovado': (status_flow['APROVADO'] / status_flow['ANÁLISE'] * 100),
+            'aprovado_to_quitado': (status_flow['QUITADO'] / status_flow['APROVADO'] * 100) if status_flow['APROVADO'] > 0 else 0
+        }
+        
+        print("\n=== Análise de Jornada para QUITADO ===")
+        print("\nEstatísticas por Situação:")
+        print(situacao_analysis)
+        
+        print("\nMétricas de Conversão:")
+        print(f"Pendente → Análise: {conversion_rates['pendente_to_analise']:.1f}%")
+        print(f"Análise → Aprovado: {conversion_rates['analise_to_aprovado']:.1f}%")
+        print(f"Aprovado → Quitado: {conversion_rates['aprovado_to_quitado']:.1f}%")
+        
+        # Calculate goals and projections
+        avg_days_to_quitado = df[df['SITUAÇÃO'].isin(['APROVADO', 'QUITADO'])]['dias_processo'].mean()
+        success_rate = status_flow['QUITADO'] / total_cases * 100 if total_cases > 0 else 0
+        
+        print("\nMetas e Projeções:")
+        print(f"Tempo Médio até Quitação: {avg_days_to_quitado:.1f} dias")
+        print(f"Taxa de Sucesso Atual: {success_rate:.1f}%")
+        
+        # Identify high-potential cases
+        high_potential = df[
+            (df['SITUAÇÃO'] == 'ANÁLISE') & 
+            (df['PRAZO B'] <= df['PRAZO B'].median()) &
+            (df['dias_processo'] <= df['dias_processo'].median())
+        ]
+        
+        print(f"\nCasos com Alto Potencial de Quitação: {len(high_potential)}")
+        if len(high_potential) > 0:
+            print("\nTop 5 Casos Prioritários:")
+            priority_cols = ['CONTRATO', 'BANCO', 'PRAZO B', 'dias_processo']
+            print(high_potential[priority_cols].head())
+        
+        return {
+            'situacao_analysis': situacao_analysis,
+            'conversion_rates': conversion_rates,
+            'high_potential_cases': high_potential
+        }
+        
+    except Exception as e:
+        print(f"Error in analyze_quitado_journey: {str(e)}")
+        raise
+
+class DeadlineAggregates:
+    """Mergeable moments of PRAZO B / PRAZO 7 for analyzing exports chunk by chunk"""
+
+    def __init__(self):
+        self.count = 0
+        self.sums = {'PRAZOB': 0.0, 'PRAZO7': 0.0}
+        self.squares = {'PRAZOB': 0.0, 'PRAZO7': 0.0}
+        self.minimum = {'PRAZOB': np.inf, 'PRAZO7': np.inf}
+        self.maximum = {'PRAZOB': -np.inf, 'PRAZO7': -np.inf}
+        self.cross = 0.0
+        self.priorities = Counter()
+
+    @classmethod
+    def from_chunk(cls, chunk):
+        """Aggregate one raw chunk, cleaned the same way as prepare_features"""
+        chunk = chunk.rename(columns=lambda col: col.strip())
+        prazo_b_col = [col for col in chunk.columns if 'PRAZO B' in col][0]
+        prazo_7_col = [col for col in chunk.columns if 'PRAZO 7' in col][0]
+        values = {
+            'PRAZOB': pd.to_numeric(chunk[prazo_b_col].astype(str).str.replace(',', '.'), errors='coerce').fillna(-1),
+            'PRAZO7': pd.to_numeric(chunk[prazo_7_col].astype(str).str.replace(',', '.'), errors='coerce').fillna(-1)
+        }
+
+        agg = cls()
+        agg.count = len(chunk)
+        if agg.count == 0:
+            return agg
+        for col, series in values.items():
+            agg.sums[col] = float(series.sum())
+            agg.squares[col] = float((series ** 2).sum())
+            agg.minimum[col] = float(series.min())
+            agg.maximum[col] = float(series.max())
+        agg.cross = float((values['PRAZOB'] * values['PRAZO7']).sum())
+        agg.priorities.update(
+            pd.cut(values['PRAZOB'], bins=PRIORITY_BINS, labels=PRIORITY_LABELS).value_counts().to_dict()
+        )
+        return agg
+
+    def merge(self, other):
+        self.count += other.count
+        for col in self.sums:
+            self.sums[col] += other.sums[col]
+            self.squares[col] += other.squares[col]
+            self.minimum[col] = min(self.minimum[col], other.minimum[col])
+            self.maximum[col] = max(self.maximum[col], other.maximum[col])
+        self.cross += other.cross
+        self.priorities.update(other.priorities)
+        return self
+
+    def describe(self, col):
+        """count/mean/std/min/max as in Series.describe (quantiles need the full column)"""
+        n = self.count
+        mean = self.sums[col] / n if n else np.nan
+        variance = (self.squares[col] - n * mean ** 2) / (n - 1) if n > 1 else np.nan
+        return pd.Series({
+            'count': n,
+            'mean': mean,
+            'std': np.sqrt(max(variance, 0.0)) if n > 1 else np.nan,
+            'min': self.minimum[col] if n else np.nan,
+            'max': self.maximum[col] if n else np.nan
+        })
+
+    def correlation(self):
+        n = self.count
+        if n < 2:
+            return np.nan
+        cov = self.cross - self.sums['PRAZOB'] * self.sums['PRAZO7'] / n
+        var_b = self.squares['PRAZOB'] - self.sums['PRAZOB'] ** 2 / n
+        var_7 = self.squares['PRAZO7'] - self.sums['PRAZO7'] ** 2 / n
+        if var_b <= 0 or var_7 <= 0:
+            return np.nan
+        return cov / np.sqrt(var_b * var_7)
+
+def analyze_deadlines_streaming(file_path, chunksize=100_000):
+    """analyze_deadlines over a CSV read in fixed-size chunks, for exports too large to load whole"""
+    try:
+        aggregates = DeadlineAggregates()
+        for chunk in iter_csv_chunks(file_path, chunksize):
+            aggregates.merge(DeadlineAggregates.from_chunk(chunk))
+
+        print("\n=== Análise de Prazos ===")
+        print(f"\nCorrelação entre PRAZO B e PRAZO 7: {aggregates.correlation():.4f}")
+
+        print("\nEstatísticas PRAZO B:")
+        print(aggregates.describe('PRAZOB'))
+
+        print("\nEstatísticas PRAZO 7:")
+        print(aggregates.describe('PRAZO7'))
+
+        print("\nDistribuição de Prioridades:")
+        print(pd.Series(aggregates.priorities).reindex(PRIORITY_LABELS, fill_value=0))
+
+        return aggregates
+
+    except Exception as e:
+        print(f"Error in analyze_deadlines_streaming: {str(e)}")
+        raise
+
+# Main execution
+if __name__ == "__main__":
+    try:
+        file_path = r"C:\Users\igor de jesus\zaptest\(JULIO) LISTAS INDIVIDUAIS - IGOR.csv"
+        if '--stream' in sys.argv:
+            # Bounded memory: only the deadline aggregates, one chunk at a time
+            analyze_deadlines_streaming(file_path)
+            sys.exit(0)
+
+        df = read_csv(file_path)
+        
+        # Run both analyses
+        deadline_results = analyze_deadlines(df)
+        journey_results = analyze_quitado_journey(df)
+        
+        # Export results
+        pd.DataFrame(journey_results['high_potential_cases']).to_csv('priority_cases.csv', index=False)
+        
+    except Exception as e:
         print(f"Error: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,376 @@
+import atexit
+import csv
+import io
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+
+AUDIT_COLUMNS = ["timestamp", "username", "action", "details"]
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+_ROTATED_SUFFIX = re.compile(r"-(\d{8})(?:-(\d+))?$")
+
+
+def _rotation_order(path):
+    # <stem>-YYYYMMDD is the day's first rotation, then -1, -2 ... -10: sort by (day, number)
+    match = _ROTATED_SUFFIX.search(path.stem)
+    if match is None:
+        return "", 0, path.name
+    return match.group(1), int(match.group(2) or 0), path.name
+
+
+def audit_files(path):
+    """Rotated audit files followed by the live one, oldest first"""
+    path = Path(path)
+    rotated = sorted(path.parent.glob(f"{path.stem}-*{path.suffix}"), key=_rotation_order)
+    return rotated + ([path] if path.exists() else [])
+
+
+class AuditLogger:
+    """Queue-backed audit writer for calculator.log_event.
+
+    log() only timestamps the event and puts it on a queue. A daemon thread
+    writes events in batches of up to `batch_size`, or whatever arrived
+    within `flush_interval` seconds, as one append to the CSV. The live
+    file is rotated to <stem>-YYYYMMDD[-N].csv when the day changes or it
+    grows past `max_bytes`. flush() waits until everything logged so far
+    is on disk; close() is registered with atexit.
+    """
+
+    def __init__(self, path, batch_size=200, flush_interval=1.0, max_bytes=5 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.written = 0
+        self.batches = 0
+        self.rotations = 0
+        atexit.register(self.close)
+
+    def log(self, username, action, details=""):
+        self._queue.put((datetime.now().strftime(TIMESTAMP_FORMAT), username, action, details))
+        self._start()
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if (self._thread is None or not self._thread.is_alive()) and not self._closed:
+                    self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                    self._thread.start()
+
+    def flush(self, timeout=5.0):
+        """Block until every event logged before this call has been written"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            batch, waiters, stop = [], [], False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    logging.error(f"Erro ao gravar {len(batch)} eventos de auditoria: {str(e)}")
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                # Drain whatever raced the shutdown sentinel
+                rest = []
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    elif item is not None:
+                        rest.append(item)
+                if rest:
+                    self._write(rest)
+                return
+
+    def _rotation_target(self, day):
+        target = self.path.with_name(f"{self.path.stem}-{day:%Y%m%d}{self.path.suffix}")
+        n = 1
+        while target.exists():
+            target = self.path.with_name(f"{self.path.stem}-{day:%Y%m%d}-{n}{self.path.suffix}")
+            n += 1
+        return target
+
+    def _rotate_if_needed(self, first_timestamp):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+        file_day = date.fromtimestamp(stat.st_mtime)
+        batch_day = datetime.strptime(first_timestamp, TIMESTAMP_FORMAT).date()
+        if batch_day != file_day or stat.st_size >= self.max_bytes:
+            os.replace(self.path, self._rotation_target(file_day))
+            self.rotations += 1
+
+    def _write(self, batch):
+        self._rotate_if_needed(batch[0][0])
+        new_file = not self.path.exists()
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if new_file:
+            writer.writerow(AUDIT_COLUMNS)
+        writer.writerows(batch)
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write(buffer.getvalue())
+        self.written += len(batch)
+        self.batches += 1
+
+
+# Sparse index granularity: each block of about this many bytes keeps its
+# time range and per-user/per-action counts
+INDEX_BLOCK_BYTES = 64 * 1024
+
+
+class AuditPage:
+    def __init__(self, rows, total, page, pages, blocks_read):
+        self.rows = rows
+        self.total = total
+        self.page = page
+        self.pages = pages
+        self.blocks_read = blocks_read
+
+
+class _FileIndex:
+    """Record-aligned blocks of one audit file: byte range, row count, min/max timestamp,
+    action counts and action counts per user"""
+
+    def __init__(self):
+        self.blocks = []
+        self.indexed_to = 0
+
+    def update(self, path, size):
+        if size < self.indexed_to:
+            self.blocks, self.indexed_to = [], 0
+        if size == self.indexed_to:
+            return
+        # Only the bytes appended since the last update are scanned; the last,
+        # possibly short, block is reopened so blocks keep their size
+        start = self.indexed_to
+        if self.blocks and self.blocks[-1]["length"] < INDEX_BLOCK_BYTES:
+            start = self.blocks.pop()["offset"]
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read(size - start)
+        self._scan(data, start)
+
+    def _scan(self, data, base):
+        pos = 0
+        if base == 0:
+            # Skip the header record
+            pos = data.find(b"\n") + 1
+            if pos == 0:
+                return
+            self.indexed_to = pos
+        block = None
+        record_start = pos
+        quotes = 0
+        end = len(data)
+        while pos < end:
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                break  # Partial record still being written
+            quotes += data.count(b'"', pos, newline)
+            pos = newline + 1
+            if quotes % 2:
+                continue  # Newline inside a quoted field
+            quotes = 0
+            record = data[record_start:pos]
+            timestamp, username, action = self._fields(record)
+            if block is None:
+                block = {"offset": base + record_start, "length": 0, "rows": 0,
+                         "first": timestamp, "last": timestamp, "users": {}, "actions": {}}
+            block["length"] = base + pos - block["offset"]
+            block["rows"] += 1
+            block["first"] = min(block["first"], timestamp)
+            block["last"] = max(block["last"], timestamp)
+            per_user = block["users"].setdefault(username, {})
+            per_user[action] = per_user.get(action, 0) + 1
+            block["actions"][action] = block["actions"].get(action, 0) + 1
+            record_start = pos
+            if block["length"] >= INDEX_BLOCK_BYTES:
+                self.blocks.append(block)
+                block = None
+        if block is not None:
+            self.blocks.append(block)
+        self.indexed_to = base + record_start
+
+    @staticmethod
+    def _fields(record):
+        # Timestamps are never quoted; the csv module is only needed for quoted users/actions
+        if record[20:21] != b'"':
+            user_end = record.find(b",", 20)
+            if user_end > 0 and record[user_end + 1:user_end + 2] != b'"':
+                action_end = record.find(b",", user_end + 1)
+                if action_end < 0:
+                    action_end = len(record.rstrip(b"\r\n"))
+                return (record[:19].decode("utf-8", "replace"),
+                        record[20:user_end].decode("utf-8", "replace"),
+                        record[user_end + 1:action_end].decode("utf-8", "replace"))
+        row = next(csv.reader([record.decode("utf-8", "replace")]), [])
+        row += [""] * (3 - len(row))
+        return row[0], row[1], row[2]
+
+
+class AuditReader:
+    """Newest-first, paginated reads of the audit files through a sparse per-block index.
+
+    Each file is indexed once in blocks of about INDEX_BLOCK_BYTES, keyed by
+    inode so a rotated file keeps its index; afterwards only the bytes
+    appended to the live file are scanned. A query walks the blocks from
+    the end of the newest file, skips blocks whose time range or user and
+    action counts can't match, counts fully matching blocks from the index,
+    and decodes only the blocks of the requested page (plus the edge
+    blocks of a date range).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """(path, index) for every audit file, newest first"""
+        files = []
+        live = {}
+        for path in reversed(audit_files(self.path)):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Rotated away between the listing and the stat
+            key = (stat.st_dev, stat.st_ino)
+            index = self._indexes.get(key) or _FileIndex()
+            index.update(path, stat.st_size)
+            live[key] = index
+            files.append((path, index))
+        self._indexes = live
+        return files
+
+    def _values(self, field):
+        with self._lock:
+            files = self._refresh()
+        return sorted({value for _, index in files for block in index.blocks for value in block[field]})
+
+    def users(self):
+        return self._values("users")
+
+    def actions(self):
+        return self._values("actions")
+
+    @staticmethod
+    def _read_block(path, block):
+        with open(path, "rb") as f:
+            f.seek(block["offset"])
+            data = f.read(block["length"])
+        return list(csv.reader(io.StringIO(data.decode("utf-8", "replace"))))
+
+    def query(self, username=None, actions=None, start=None, end=None, page=1, page_size=50):
+        """One page of events, newest first; start/end are inclusive dates"""
+        lo = f"{start:%Y-%m-%d} 00:00:00" if start else None
+        hi = f"{end:%Y-%m-%d} 23:59:59" if end else None
+        actions = set(actions) if actions is not None else None
+
+        def block_matches(block):
+            if (lo and block["last"] < lo) or (hi and block["first"] > hi):
+                return False
+            if username is not None and username not in block["users"]:
+                return False
+            present = block["users"][username] if username is not None else block["actions"]
+            return actions is None or any(a in present for a in actions)
+
+        def row_matches(row):
+            row = row + [""] * (len(AUDIT_COLUMNS) - len(row))
+            return ((lo is None or row[0] >= lo) and (hi is None or row[0] <= hi)
+                    and (username is None or row[1] == username)
+                    and (actions is None or row[2] in actions))
+
+        def exact_count(block):
+            # From the index alone when the block lies inside the time range
+            if (lo and block["first"] < lo) or (hi and block["last"] > hi):
+                return None
+            counts = block["users"][username] if username is not None else block["actions"]
+            if actions is None:
+                return sum(counts.values())
+            return sum(counts.get(a, 0) for a in actions)
+
+        with self._lock:
+            files = self._refresh()
+
+        decoded = {}
+        candidates = []
+        blocks_read = 0
+        for path, index in files:
+            for block in reversed(index.blocks):
+                if not block_matches(block):
+                    continue
+                count = exact_count(block)
+                if count is None:
+                    rows = [row for row in reversed(self._read_block(path, block)) if row_matches(row)]
+                    decoded[(path, block["offset"])] = rows
+                    blocks_read += 1
+                    count = len(rows)
+                if count:
+                    candidates.append((path, block, count))
+
+        total = sum(count for _, _, count in candidates)
+        pages = max(1, -(-total // page_size))
+        page = min(max(1, page), pages)
+        skip = (page - 1) * page_size
+        rows = []
+        for path, block, count in candidates:
+            if skip >= count:
+                skip -= count
+                continue
+            block_rows = decoded.get((path, block["offset"]))
+            if block_rows is None:
+                block_rows = [row for row in reversed(self._read_block(path, block)) if row_matches(row)]
+                blocks_read += 1
+            rows.extend(block_rows[skip:skip + page_size - len(rows)])
+            skip = 0
+            if len(rows) >= page_size:
+                break
+
+        rows = [row + [""] * (len(AUDIT_COLUMNS) - len(row)) for row in rows]
+        return AuditPage(pd.DataFrame(rows, columns=AUDIT_COLUMNS), total, page, pages, blocks_read)
@@ -0,0 +1,140 @@
+import io
+import unicodedata
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from money import parse_brl
+
+BATCH_COLUMNS = ['valor_original', 'valor_proposto', 'banco', 'contrato']
+# Header spellings seen in bank proposal sheets, after accent/case normalization
+COLUMN_ALIASES = {
+    'valor original': 'valor_original',
+    'valor da divida': 'valor_original',
+    'valor divida': 'valor_original',
+    'valor proposto': 'valor_proposto',
+    'valor da proposta': 'valor_proposto',
+    'proposta': 'valor_proposto',
+    'banco': 'banco',
+    'contrato': 'contrato',
+    'numero do contrato': 'contrato'
+}
+
+
+def _normalize_header(name):
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii')
+    text = text.strip().lower().replace('_', ' ')
+    return COLUMN_ALIASES.get(text, text.replace(' ', '_'))
+
+
+def _sniff_separator(raw):
+    first_line = raw.split(b'\n', 1)[0]
+    return ';' if first_line.count(b';') > first_line.count(b',') else ','
+
+
+def read_proposals(data, filename):
+    """Bank proposal sheet (CSV or XLSX bytes) as a frame with BATCH_COLUMNS"""
+    if filename.lower().endswith(('.xlsx', '.xls')):
+        try:
+            df = pd.read_excel(io.BytesIO(data))
+        except ImportError:
+            raise ValueError("Leitura de planilhas Excel requer o pacote openpyxl")
+    else:
+        try:
+            text = data.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            text = data.decode('latin1')
+        df = pd.read_csv(io.StringIO(text), sep=_sniff_separator(data), dtype=str, keep_default_na=False)
+
+    df.columns = [_normalize_header(c) for c in df.columns]
+    missing = [c for c in ('valor_original', 'valor_proposto') if c not in df.columns]
+    if missing:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(missing)}")
+    for col in ('banco', 'contrato'):
+        if col not in df.columns:
+            df[col] = ''
+    return df[BATCH_COLUMNS]
+
+
+def _amounts(series):
+    # Excel cells may be numbers; text follows the calculator's '1.234,56' format
+    return parse_brl(series).to_numpy()
+
+
+def compute_discounts(df):
+    """Add original, proposed, discount % and savings for every row in one vectorized pass.
+
+    Rows with a non-positive original or a negative proposal are kept,
+    flagged valido=False, with NaN results, like the single calculator
+    which refuses them.
+    """
+    result = df.copy()
+    original = _amounts(df['valor_original'])
+    proposed = _amounts(df['valor_proposto'])
+    valid = (original > 0) & (proposed >= 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        savings = np.where(valid, original - proposed, np.nan)
+        discount = np.where(valid, savings / original * 100, np.nan)
+
+    result['original'] = original
+    result['proposto'] = proposed
+    result['desconto_percentual'] = np.round(discount, 2)
+    result['economia'] = np.round(savings, 2)
+    result['valido'] = valid
+    return result
+
+
+def summarize(result):
+    """Overall figures plus a per-bank table for a compute_discounts() frame"""
+    valid = result[result['valido']]
+    total_original = valid['original'].sum()
+    summary = {
+        'linhas': len(result),
+        'validas': len(valid),
+        'invalidas': int((~result['valido']).sum()),
+        'total_original': total_original,
+        'total_proposto': valid['proposto'].sum(),
+        'economia_total': valid['economia'].sum(),
+        # Weighted by debt size: what the whole sheet saves, not the mean of the rows
+        'desconto_ponderado': valid['economia'].sum() / total_original * 100 if total_original else 0.0,
+        'desconto_medio': valid['desconto_percentual'].mean() if len(valid) else 0.0,
+        'desconto_mediano': valid['desconto_percentual'].median() if len(valid) else 0.0,
+        'desconto_maximo': valid['desconto_percentual'].max() if len(valid) else 0.0
+    }
+
+    by_bank = valid.groupby('banco', sort=False).agg(
+        contratos=('contrato', 'size'),
+        total_original=('original', 'sum'),
+        economia=('economia', 'sum'),
+        desconto_medio=('desconto_percentual', 'mean')
+    )
+    by_bank['desconto_ponderado'] = (by_bank['economia'] / by_bank['total_original'] * 100).round(2)
+    return summary, by_bank.sort_values('economia', ascending=False)
+
+
+def to_csv_bytes(result):
+    """Results as a ';'-separated CSV with decimal commas, ready for Excel pt-BR"""
+    columns = BATCH_COLUMNS + ['desconto_percentual', 'economia', 'valido']
+    return result[columns].to_csv(index=False, sep=';', decimal=',', float_format='%.2f').encode('utf-8-sig')
+
+
+def history_records(result, format_currency):
+    """History rows for the valid results, in HistoryLog.append_many's format"""
+    valid = result[result['valido']]
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Amounts are stored the way the single calculator's inputs are typed: '47.687,85'
+    return [
+        {
+            'data_calculo': now,
+            'valor_original': format_currency(original).replace('R$ ', ''),
+            'valor_proposto': format_currency(proposed).replace('R$ ', ''),
+            'desconto_percentual': f"{discount:.2f}",
+            'economia': format_currency(savings)
+        }
+        for original, proposed, discount, savings in zip(
+            valid['original'], valid['proposto'],
+            valid['desconto_percentual'], valid['economia']
+        )
+    ]
@@ -0,0 +1,59 @@
+"""Per-event cost of calculator.log_event: one-row pandas to_csv vs. the queued AuditLogger
+
+Usage: python benchmarks/bench_audit_log.py [events]
+"""
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audit_log import AuditLogger, audit_files
+
+
+def pandas_log_event(path, username, action, details=""):
+    # The previous calculator.log_event
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_entry = pd.DataFrame([{
+        "timestamp": now,
+        "username": username,
+        "action": action,
+        "details": details
+    }])
+    if path.exists():
+        log_entry.to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
+    else:
+        log_entry.to_csv(path, index=False, encoding="utf-8")
+
+
+def run(n_events):
+    with tempfile.TemporaryDirectory() as tmp:
+        pandas_path = Path(tmp) / "pandas_audit.csv"
+        start = time.perf_counter()
+        for i in range(n_events):
+            pandas_log_event(pandas_path, f"user{i % 20}", "login")
+        pandas_cost = (time.perf_counter() - start) / n_events * 1e6
+
+        logger = AuditLogger(Path(tmp) / "audit_log.csv", max_bytes=64 * 1024)
+        start = time.perf_counter()
+        for i in range(n_events):
+            logger.log(f"user{i % 20}", "login")
+        enqueue_cost = (time.perf_counter() - start) / n_events * 1e6
+        logger.flush()
+        total = time.perf_counter() - start
+
+        files = audit_files(logger.path)
+        rows = sum(len(pd.read_csv(f)) for f in files)
+        assert rows == n_events, f"{rows} de {n_events} eventos gravados"
+        print(f"{n_events} eventos: pandas {pandas_cost:8.1f} us/evento | "
+              f"fila {enqueue_cost:6.2f} us/evento ({total * 1000:.0f} ms até o flush, "
+              f"{logger.batches} lotes, {len(files)} arquivos após rotação)")
+        logger.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
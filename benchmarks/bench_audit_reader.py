@@ -0,0 +1,129 @@
+"""Audit viewer: full pandas read of every audit file vs. AuditReader's indexed newest-first pages
+
+Results are checked against pandas for every query before timing. The
+files are rotated the way AuditLogger names them (<stem>-YYYYMMDD, then
+-1, -2 ... -10 on the same day), and pandas reads them in the order they
+were written, so a wrong rotation order in audit_files shows up as a
+mismatch; a second pass with small files forces many same-day rotations.
+
+Usage: python benchmarks/bench_audit_reader.py [rows ...]
+"""
+import csv
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audit_log import AUDIT_COLUMNS, AuditLogger, AuditReader
+
+ACTIONS = ["login", "logout", "calculo", "criar_usuario", "exportar"]
+# Rows per rotated file, like AuditLogger's 5 MB rotation
+ROWS_PER_FILE = 80_000
+
+
+def write_audit_files(directory, n_rows, rows_per_file=ROWS_PER_FILE, step_seconds=20, seed=11):
+    """Write the events into the live file, rotating it like AuditLogger; returns (path, files oldest first)"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    users = [f"user{i}" for i in range(60)]
+    path = Path(directory) / "audit_log.csv"
+    logger = AuditLogger(path)
+    written = []
+    for first in range(0, n_rows, rows_per_file):
+        count = min(rows_per_file, n_rows - first)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(AUDIT_COLUMNS)
+            for i in range(first, first + count):
+                stamp = start + timedelta(seconds=i * step_seconds)
+                writer.writerow([
+                    stamp.strftime("%Y-%m-%d %H:%M:%S"),
+                    users[rng.integers(len(users))],
+                    ACTIONS[rng.integers(len(ACTIONS))],
+                    f"Valor: R$ {rng.integers(100, 90000)},00"
+                ])
+        if first + count < n_rows:
+            # Rotated under the day of its last write, as AuditLogger does with the file's mtime
+            target = logger._rotation_target(stamp.date())
+            path.replace(target)
+            written.append(target)
+    logger.close()
+    return path, written + [path]
+
+
+def pandas_query(files, username=None, actions=None, start=None, end=None, page=1, page_size=50):
+    # What show_audit_log did: read everything, filter, sort, then show
+    df = pd.concat([pd.read_csv(f, dtype=str, keep_default_na=False) for f in files], ignore_index=True)
+    df = df.iloc[::-1]
+    if username:
+        df = df[df["username"] == username]
+    if actions:
+        df = df[df["action"].isin(actions)]
+    if start:
+        df = df[df["timestamp"] >= f"{start:%Y-%m-%d} 00:00:00"]
+    if end:
+        df = df[df["timestamp"] <= f"{end:%Y-%m-%d} 23:59:59"]
+    return len(df), df.iloc[(page - 1) * page_size:page * page_size].reset_index(drop=True)
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def check_same_day_rotations(n_rows=30_000, rows_per_file=2_000):
+    # One event per second: ~43 files per day, so suffixes go past -10
+    with tempfile.TemporaryDirectory() as tmp:
+        path, files = write_audit_files(tmp, n_rows, rows_per_file=rows_per_file, step_seconds=1)
+        reader = AuditReader(path)
+        for params in [{}, {"page": 7, "page_size": 1_000}, {"username": "user7", "page_size": n_rows}]:
+            expected_total, expected_rows = pandas_query(files, **params)
+            result = reader.query(**params)
+            assert result.total == expected_total, params
+            assert result.rows.equals(expected_rows), params
+        print(f"Rotação no mesmo dia OK: {len(files)} arquivos ({files[0].name} ... {files[-2].name})")
+
+
+def run(n_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path, files = write_audit_files(tmp, n_rows)
+        last_day = (datetime(2024, 1, 1) + timedelta(seconds=(n_rows - 1) * 20)).date()
+        queries = [
+            ("página 1", {}),
+            ("página 20", {"page": 20}),
+            ("usuário", {"username": "user7"}),
+            ("usuário + ação", {"username": "user7", "actions": ["login", "logout"]}),
+            ("um dia", {"start": last_day - timedelta(days=3), "end": last_day - timedelta(days=3)}),
+            ("usuário + semana", {"username": "user7", "start": date(2024, 1, 8), "end": date(2024, 1, 14)}),
+        ]
+
+        reader = AuditReader(path)
+        start = time.perf_counter()
+        reader.users()
+        build = time.perf_counter() - start
+        blocks = sum(len(index.blocks) for index in reader._indexes.values())
+        print(f"{n_rows:>8} eventos: índice {build * 1000:7.1f} ms (uma vez por processo, {blocks} blocos)")
+
+        for name, params in queries:
+            old, (expected_total, expected_rows) = timed(lambda: pandas_query(files, **params), repeat=1)
+            new, result = timed(lambda: reader.query(**params))
+            assert result.total == expected_total, (name, result.total, expected_total)
+            assert result.rows.equals(expected_rows), name
+            print(f"{name:>20}: pandas {old * 1000:8.1f} ms | índice {new * 1000:7.2f} ms "
+                  f"({result.blocks_read}/{blocks} blocos lidos, {result.total} eventos)")
+
+
+if __name__ == "__main__":
+    check_same_day_rotations()
+    for n in [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]:
+        run(n)
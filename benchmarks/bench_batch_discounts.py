@@ -0,0 +1,66 @@
+"""Batch discount mode: vectorized compute_discounts vs. the single calculator's formula row by row
+
+Usage: python benchmarks/bench_batch_discounts.py [rows ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batch_discounts import compute_discounts, read_proposals, summarize, to_csv_bytes
+
+
+def brl(x):
+    return f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def make_sheet(n_rows, seed=3):
+    rng = np.random.default_rng(seed)
+    original = rng.uniform(500, 150000, n_rows)
+    proposed = original * rng.uniform(0.2, 0.95, n_rows)
+    banks = rng.choice(['BRADESCO', 'ITAÚ', 'SANTANDER', 'CAIXA', 'PAN', 'BMG'], n_rows)
+    lines = ["Valor Original;Valor Proposto;Banco;Contrato"]
+    lines += [f"{brl(o)};{brl(p)};{b};{100000 + i}" for i, (o, p, b) in enumerate(zip(original, proposed, banks))]
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+def row_by_row(df):
+    # calculator_ui's formula applied once per row
+    out = []
+    for original_str, proposed_str in zip(df['valor_original'], df['valor_proposto']):
+        original = float(original_str.replace(".", "").replace(",", "."))
+        proposed = float(proposed_str.replace(".", "").replace(",", "."))
+        out.append(((original - proposed) / original) * 100)
+    return out
+
+
+def run(n_rows):
+    data = make_sheet(n_rows)
+    start = time.perf_counter()
+    df = read_proposals(data, 'propostas.csv')
+    read = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = row_by_row(df)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = compute_discounts(df)
+    summarize(result)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    to_csv_bytes(result)
+    export = time.perf_counter() - start
+
+    assert np.allclose(result['desconto_percentual'], np.round(expected, 2))
+    print(f"{n_rows:>8} linhas: leitura {read * 1000:7.1f} ms | linha a linha {loop * 1000:7.1f} ms | "
+          f"vetorizado + resumo {vectorized * 1000:7.1f} ms | CSV {export * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    for n in [int(a) for a in sys.argv[1:]] or [10_000, 100_000]:
+        run(n)
@@ -0,0 +1,81 @@
+"""calculator.py rerun latency (Streamlit AppTest) as the history and audit files grow
+
+Logs in as the default admin, opens the history and the audit tab, and
+times warm reruns: the rerun an admin triggers by touching any widget.
+The per-phase breakdown comes from the app's own RerunProfile.
+
+Usage: python benchmarks/bench_calculator_rerun.py [rows ...]
+"""
+import csv
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_history_browser import write_history_csv
+
+ACTIONS = ["login", "calculo", "logout", "exportar"]
+
+
+def write_audit_csv(path, n_rows):
+    start = datetime(2024, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "username", "action", "details"])
+        for i in range(n_rows):
+            stamp = (start + timedelta(seconds=i * 37)).strftime("%Y-%m-%d %H:%M:%S")
+            writer.writerow([stamp, f"user{i % 40}", ACTIONS[i % len(ACTIONS)], f"Valor: R$ {i % 9000},00"])
+
+
+def login(at):
+    at.run()
+    at.text_input(key="username").input("admin")
+    at.text_input(key="password").input(os.environ.get('ADMIN_PASSWORD', 'admin123'))
+    next(b for b in at.button if b.label == "Entrar").click()
+    at.run()
+    assert at.session_state.user, "login falhou"
+
+
+def run(n_rows, reruns=10):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        # Process-wide resources (UserManager, history index...) point at the previous data dir
+        st.cache_resource.clear()
+        try:
+            Path("data").mkdir()
+            write_history_csv(Path("data/historico_descontos.csv"), n_rows)
+            write_audit_csv(Path("data/audit_log.csv"), n_rows)
+
+            at = AppTest.from_file(str(ROOT / "calculator.py"), default_timeout=120)
+            login(at)
+            next(c for c in at.checkbox if c.label == "📋 Mostrar Histórico").check()
+
+            timings = []
+            for _ in range(reruns + 1):
+                start = time.perf_counter()
+                at.run()
+                timings.append(time.perf_counter() - start)
+            assert not at.exception, [e.value for e in at.exception]
+
+            warm = statistics.median(timings[1:])
+            print(f"{n_rows:>8} linhas: 1º rerun {timings[0] * 1000:8.1f} ms | rerun típico {warm * 1000:8.1f} ms")
+            profile = at.session_state["rerun_profile"] if "rerun_profile" in at.session_state else None
+            if profile:
+                print("          " + " | ".join(f"{name} {ms:.1f} ms" for name, ms in profile.items()))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    for n in [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]:
+        run(n)
@@ -0,0 +1,57 @@
+"""Memory and groupby/value_counts cost of object columns vs. the categorical contract schema
+
+Usage: python benchmarks/bench_categorical_schema.py [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from benchmarks.synthetic_data import write_contracts_csv
+from contract_schema import read_contracts, memory_report
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_load(path):
+    """What the loaders did before: object columns, upper/strip on every load"""
+    df = pd.read_csv(path, encoding='utf-8', parse_dates=['DATA', 'RESOLUÇÃO'], dayfirst=True)
+    df['CONTRATO'] = df['CONTRATO'].astype(str).str.strip()
+    for col in ('SITUAÇÃO', 'CAMPANHA'):
+        df[col] = df[col].astype(str).str.upper().str.strip()
+    return df
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "contratos.csv"
+        write_contracts_csv(path, rows)
+
+        load_before = timed(lambda: legacy_load(path), repeat=2)
+        load_after = timed(lambda: read_contracts(path), repeat=2)
+        before = legacy_load(path)
+        after = read_contracts(path)
+
+    pd.set_option('display.width', 160)
+    print(memory_report(before, after))
+    print(f"\nload: {load_before:.3f}s -> {load_after:.3f}s")
+
+    for col in ('SITUAÇÃO', 'BANCO', 'NEGOCIAÇÃO'):
+        vc_before = timed(lambda: before[col].value_counts())
+        vc_after = timed(lambda: after[col].value_counts())
+        gb_before = timed(lambda: before.groupby(col)['CONTRATO'].count())
+        gb_after = timed(lambda: after.groupby(col, observed=True)['CONTRATO'].count())
+        print(f"{col:<12} value_counts {vc_before * 1e3:7.2f}ms -> {vc_after * 1e3:6.2f}ms | "
+              f"groupby {gb_before * 1e3:7.2f}ms -> {gb_after * 1e3:6.2f}ms")
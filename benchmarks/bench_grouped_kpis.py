@@ -0,0 +1,71 @@
+"""Per-negotiator filter loop vs. grouped_kpis as the negotiator count grows
+
+Usage: python benchmarks/bench_grouped_kpis.py [rows]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from aggregate_store import APPROVED_STATUSES, clean_currency, grouped_kpis
+from benchmarks.synthetic_data import make_contracts_frame
+
+
+def filter_loop(df, values):
+    """The loop analyze_contracts used before grouped_kpis"""
+    stats = {}
+    for negotiator in df['NEGOCIAÇÃO'].unique():
+        if pd.isna(negotiator):
+            continue
+        mask = df['NEGOCIAÇÃO'] == negotiator
+        negotiator_data = df[mask]
+        approved = len(negotiator_data[negotiator_data['SITUAÇÃO'].isin(APPROVED_STATUSES)])
+        stats[negotiator] = {
+            "total_contratos": len(negotiator_data),
+            "aprovados": approved,
+            "taxa_sucesso": approved / len(negotiator_data) * 100,
+            "valor_total": float(values[mask].sum())
+        }
+    return stats
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def cleaned_frame(n_rows, n_negotiators=25):
+    df = make_contracts_frame(n_rows, n_negotiators=n_negotiators)
+    df['SITUAÇÃO'] = df['SITUAÇÃO'].str.upper().str.strip()
+    df['CAMPANHA'] = df['CAMPANHA'].str.upper().str.strip()
+    return df
+
+
+def run(n_rows, n_negotiators):
+    df = cleaned_frame(n_rows, n_negotiators)
+    values = clean_currency(df['VALOR DO CLIENTE'])
+
+    loop_time, loop_stats = timed(lambda: filter_loop(df, values))
+    grouped_time, kpis = timed(lambda: grouped_kpis(df, 'NEGOCIAÇÃO', values=values))
+
+    # Same numbers either way
+    for negotiator, expected in loop_stats.items():
+        row = kpis.loc[negotiator]
+        assert row['total'] == expected['total_contratos']
+        assert row['approved'] == expected['aprovados']
+        assert abs(row['value'] - expected['valor_total']) < 1e-6 * max(1.0, expected['valor_total'])
+
+    print(f"{n_rows:>9,} rows | {n_negotiators:>6,} negotiators | loop {loop_time:8.3f}s | "
+          f"grouped {grouped_time:7.4f}s | {loop_time / grouped_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for n_negotiators in (10, 100, 1_000, 5_000):
+        run(rows, n_negotiators)
+    for column in ('BANCO', 'CAMPANHA', 'CONTATO'):
+        print(grouped_kpis(cleaned_frame(10_000), column))
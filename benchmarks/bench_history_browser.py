@@ -0,0 +1,100 @@
+"""show_history on a large historico_descontos.csv: full read + iterrows vs. indexed page query,
+and the cost of one edit: full to_csv rewrite vs. an appended op picked up by the browser
+
+Usage: python benchmarks/bench_history_browser.py [rows ...]
+"""
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from history_store import HistoryBrowser, HistoryLog, new_row_id
+
+
+def brl(values):
+    return [f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".") for x in values]
+
+
+def write_history_csv(path, n_rows, seed=7):
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365 * 86400, n_rows), unit='s')
+    original = rng.uniform(500, 150000, n_rows)
+    discount = rng.uniform(5, 70, n_rows)
+    proposed = original * (1 - discount / 100)
+    pd.DataFrame({
+        'id': [new_row_id() for _ in range(n_rows)],
+        'data_calculo': dates.strftime('%Y-%m-%d %H:%M:%S'),
+        'valor_original': brl(original),
+        'valor_proposto': brl(proposed),
+        'desconto_percentual': [f"{d:.2f}" for d in discount],
+        'economia': ["R$ " + s for s in brl(original - proposed)]
+    }).to_csv(path, index=False, encoding='utf-8')
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'historico_descontos.csv'
+        write_history_csv(path, n_rows)
+
+        def full_render():
+            # What the old show_history did per rerun, minus the widgets
+            df = pd.read_csv(path)
+            for _, row in df.iterrows():
+                f"{row['data_calculo']} | {row['valor_original']} | {row['valor_proposto']}"
+
+        browser = HistoryBrowser(path)
+        start = time.perf_counter()
+        browser.refresh()
+        build = time.perf_counter() - start
+
+        full = timed(full_render, repeat=1)
+        unfiltered = timed(lambda: browser.query(page=3))
+        by_day = timed(lambda: browser.query(day=date(2024, 6, 14)))
+        by_value = timed(lambda: browser.query(min_value=100000, page=2))
+
+        print(f"{n_rows:>8} linhas: antes {full * 1000:8.1f} ms | índice {build * 1000:7.1f} ms (uma vez) | "
+              f"página {unfiltered * 1000:5.2f} ms, por dia {by_day * 1000:5.2f} ms, "
+              f"valor mínimo {by_value * 1000:5.2f} ms")
+
+        def rewrite_edit():
+            # The old save button: mutate one cell and rewrite the whole file
+            df = pd.read_csv(path)
+            df.at[10, 'valor_proposto'] = '1.000,00'
+            df.to_csv(path, index=False, encoding='utf-8')
+
+        rewrite = timed(rewrite_edit, repeat=1)
+
+        log = HistoryLog(path, compact_interval=3600)
+        browser = HistoryBrowser(path, log=log)
+        browser.refresh()
+        edits = 200
+        start = time.perf_counter()
+        for row_id in browser.frame['id'].iloc[:edits]:
+            log.edit(row_id, {'valor_original': '1.000,00', 'economia': 'R$ 10,00'})
+            browser.refresh()
+        appended = (time.perf_counter() - start) / edits
+        start = time.perf_counter()
+        log.compact()
+        compact = time.perf_counter() - start
+        print(f"{'':>8} edição: reescrita {rewrite * 1000:8.1f} ms | append + refresh {appended * 1000:5.2f} ms | "
+              f"compactação de {edits} operações {compact * 1000:7.1f} ms (em segundo plano)")
+
+
+if __name__ == '__main__':
+    for n in [int(a) for a in sys.argv[1:]] or [10_000, 100_000]:
+        run(n)
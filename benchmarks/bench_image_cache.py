@@ -0,0 +1,100 @@
+"""Wallpaper preview per rerun: download from a (local) image server vs. ImageCache.thumbnail,
+plus checks for LRU eviction and the offline fallback
+
+A local HTTP server stands in for Unsplash, so the "antes" numbers are a
+lower bound: the real service adds internet latency on every rerun.
+
+Usage: python benchmarks/bench_image_cache.py [reruns]
+"""
+import itertools
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from image_cache import ImageCache, gradient_png
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    # Each path gets its own 1600x900 image, like a search query
+    def do_GET(self):
+        seed = sum(self.path.encode())
+        body = gradient_png(1600, 900, top=(seed % 256, 40, 80), bottom=(20, seed * 7 % 256, 200))
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(reruns):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"{base}/1600x900/?abstract"
+
+        start = time.perf_counter()
+        for _ in range(reruns):
+            # What the browser did for st.image(url) on every rerun
+            urllib.request.urlopen(url).read()
+        before = (time.perf_counter() - start) / reruns
+
+        cache = ImageCache(tmp, max_bytes=1 << 30)
+        assert cache.fetch(url)
+        start = time.perf_counter()
+        for _ in range(reruns):
+            preview = cache.thumbnail(url)
+        after = (time.perf_counter() - start) / reruns
+
+        # A new process finds the image on disk
+        cold = ImageCache(tmp)
+        start = time.perf_counter()
+        assert cold.thumbnail(url) == preview
+        disk = time.perf_counter() - start
+
+        print(f"{reruns} reruns: download {before * 1000:7.2f} ms | cache (memória) {after * 1000:7.4f} ms | "
+              f"cache (disco, 1ª vez) {disk * 1000:6.2f} ms | preview {len(preview) / 1024:.0f} KB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A tick per access keeps the LRU order deterministic
+        cache = ImageCache(tmp, clock=itertools.count().__next__)
+        urls = [f"{base}/1600x900/?q{i}" for i in range(5)]
+        for u in urls[:3]:
+            assert cache.fetch(u)
+        # Room for these three (sizes vary a little); the least recently shown go first
+        cache.max_bytes = int(cache.metrics()["bytes"] * 1.1)
+        cache.thumbnail(urls[0])
+        for u in urls[3:]:
+            assert cache.fetch(u)
+        metrics = cache.metrics()
+        assert metrics["bytes"] <= cache.max_bytes, metrics
+        assert cache.image(urls[0]) is not None, "imagem usada recentemente foi removida"
+        assert cache.image(urls[1]) is None, "imagem menos usada não foi removida"
+        assert cache.image(urls[4]) is not None
+        print(f"Eviction OK: {metrics['images']} imagens, {metrics['bytes'] / 1024:.0f} KB, "
+              f"{metrics['evicted']} removidas")
+
+    server.shutdown()
+    server.server_close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ImageCache(tmp, timeout=1.0)
+        # The server is gone: fetch fails and the preview is the offline fallback
+        assert not cache.fetch(f"{base}/1600x900/?offline")
+        assert cache.thumbnail(f"{base}/1600x900/?offline") == cache.fallback()
+        assert cache.thumbnail(None).startswith(b'\x89PNG')
+        print("Fallback offline OK")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,88 @@
+"""Login throughput and latency of other routes during a login burst
+
+Compares pbkdf2 verification inline on the request thread (PASSWORD_WORKERS=0)
+with the bounded password pool.
+
+Usage: python benchmarks/bench_login_throughput.py [concurrent_logins] [seconds]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# dashboard.py creates its user store relative to the working directory
+os.chdir(tempfile.mkdtemp())
+
+from werkzeug.security import generate_password_hash
+
+import password_pool
+from dashboard import app, dashboard
+
+USERNAME = 'bench'
+PASSWORD = 'bench-password'
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(p / 100 * len(samples)))]
+
+
+def run(concurrency, seconds, max_workers, max_pending):
+    password_pool.configure(max_workers, max_pending)
+    stop = threading.Event()
+    logins = []
+    rejected = []
+    latencies = []
+
+    def login_worker():
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.post('/login', json={'username': USERNAME, 'password': PASSWORD})
+            (logins if response.status_code == 200 else rejected).append(1)
+
+    def cheap_route_worker():
+        client = app.test_client()
+        client.post('/login', json={'username': USERNAME, 'password': PASSWORD})
+        while not stop.is_set():
+            start = time.perf_counter()
+            client.get('/api/stats/refresh-metrics')
+            latencies.append(time.perf_counter() - start)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=login_worker) for _ in range(concurrency)]
+    threads.append(threading.Thread(target=cheap_route_worker))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    label = 'inline' if max_workers == 0 else f'pool({max_workers}, pending={max_pending})'
+    print(f"{label:>24}: {len(logins) / seconds:7.1f} logins/s  "
+          f"503: {len(rejected):5d}  "
+          f"outra rota p95: {percentile(latencies, 95) * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    dashboard.user_store.add_user({
+        'username': USERNAME,
+        'password': generate_password_hash(PASSWORD, method='pbkdf2:sha256:260000'),
+        'name': 'Benchmark',
+        'role': 'user'
+    })
+
+    print(f"{concurrency} logins simultâneos por {seconds:.0f}s")
+    run(concurrency, seconds, 0, concurrency)
+    run(concurrency, seconds, 2, 32)
+    run(concurrency, seconds, os.cpu_count() or 2, 32)
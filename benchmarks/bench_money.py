@@ -0,0 +1,76 @@
+"""money.parse_brl / format_currency: correctness corpus, then speed against the old cleaning chains
+
+The corpus from tests/test_money.py runs first (with and without pyarrow)
+and the script stops on any mismatch.
+
+Usage: python benchmarks/bench_money.py [rows]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'tests'))
+
+from money import format_currency, parse_brl
+from test_money import check_corpus, without_pyarrow
+
+
+def old_replace_chain(s):
+    # analyze_contracts.py / analyze_quitados.py
+    return pd.to_numeric(s.str.replace('R$', '').str.replace('.', '').str.replace(',', '.'), errors='coerce')
+
+
+def old_extract_chain(s):
+    # aggregate_store.clean_currency / streamlit_analyzer.py / data_processor.py
+    return pd.to_numeric(
+        s.str.replace('R$', '').str.replace('.', '').str.replace(',', '.').str.extract(r'(\d+\.?\d*)', expand=False),
+        errors='coerce'
+    )
+
+
+def old_newdashboard_chain(s):
+    # newdashboard.py / analyze_newone.py: stops at the thousands dot
+    return s.str.extract(r'(\d+(?:\.\d+)?)', expand=False).astype(float)
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(n_rows):
+    rng = np.random.default_rng(1)
+    values = np.round(rng.uniform(0, 500000, n_rows), 2)
+    texts = format_currency(pd.Series(values))
+
+    for name, fn in [
+        ('replace + to_numeric', lambda: old_replace_chain(texts)),
+        ('replace + extract', lambda: old_extract_chain(texts)),
+        ('extract (newdashboard)', lambda: old_newdashboard_chain(texts)),
+        ('parse_brl', lambda: parse_brl(texts)),
+        ('parse_brl lenient', lambda: parse_brl(texts, lenient=True)),
+    ]:
+        elapsed, result = timed(fn)
+        correct = np.isclose(result.to_numpy(dtype='float64'), values).mean() * 100
+        print(f"{name:>24}: {elapsed * 1000:8.1f} ms  ({correct:5.1f}% corretos)")
+
+    old_format, _ = timed(lambda: texts.index.map(lambda i: f"R$ {values[i]:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")))
+    new_format, _ = timed(lambda: format_currency(pd.Series(values)))
+    print(f"{'format_currency':>24}: {new_format * 1000:8.1f} ms  (antes, por valor: {old_format * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    check_corpus()
+    with without_pyarrow():
+        check_corpus()
+    print("Corpus OK")
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
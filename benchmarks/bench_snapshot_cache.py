@@ -0,0 +1,61 @@
+"""Cold CSV parse vs. warm Arrow snapshot vs. invalidation for DataLoader.load_csv
+
+Usage: python benchmarks/bench_snapshot_cache.py [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_data import write_contracts_csv
+from dashboard import DataLoader
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "contratos.csv"
+        write_contracts_csv(csv_path, n_rows)
+
+        cold_loader = DataLoader(csv_path, use_snapshot=False)
+        cold = timed(cold_loader.load_csv)
+
+        loader = DataLoader(csv_path)
+        loader.load_csv()  # builds the snapshot
+        warm = timed(loader.load_csv)
+
+        def touch_and_load():
+            # New mtime, same bytes: rehash only, snapshot survives
+            os.utime(csv_path)
+            loader.load_csv()
+
+        touched = timed(touch_and_load)
+
+        def change_and_load():
+            # Appending a row changes size, so the snapshot is rebuilt
+            with open(csv_path, 'a', encoding='utf-8') as f:
+                f.write('01/01/2025,01/02/2025,123456,"R$ 1,00",X,Y,APROVADO,,SIM,X,Y,1,1\n')
+            loader.load_csv()
+
+        invalidated = timed(change_and_load)
+
+        size_mb = csv_path.stat().st_size / 1e6
+        print(f"{n_rows:>10,} rows ({size_mb:7.1f} MB) | cold {cold:7.3f}s | warm {warm:7.3f}s "
+              f"({cold / warm:5.1f}x) | touch {touched:7.3f}s | invalidate+rebuild {invalidated:7.3f}s")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        run(n)
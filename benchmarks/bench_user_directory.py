@@ -0,0 +1,58 @@
+"""Per-lookup cost of the cached user directory and how long another process takes to see a new user
+
+Usage: python benchmarks/bench_user_directory.py [users] [reload_interval]
+"""
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from user_store import UserStore
+
+WRITER = """
+import sys
+sys.path.insert(0, {root!r})
+from user_store import UserStore
+store = UserStore({db!r}, legacy_files=[])
+store.add_user({{'username': 'novo', 'password': 'x'}})
+"""
+
+
+def per_lookup(fn, n=20000):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def run(n_users, reload_interval):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'users.db'
+        seed = UserStore(db_path, legacy_files=[])
+        for i in range(n_users):
+            seed.add_user({'username': f'user{i}', 'password': 'x', 'name': f'Usuário {i}'})
+
+        store = UserStore(db_path, legacy_files=[], reload_interval=reload_interval)
+        uncached = per_lookup(lambda i: store._query("SELECT * FROM users WHERE username = ?", (f'user{i % n_users}',)))
+        stat_every_call = UserStore(db_path, legacy_files=[], reload_interval=0)
+        stat_cost = per_lookup(lambda i: stat_every_call.get_by_username(f'user{i % n_users}'))
+        cached = per_lookup(lambda i: store.get_by_username(f'user{i % n_users}'))
+        print(f"{n_users} usuários: SQL {uncached:6.1f} us | stat por consulta {stat_cost:6.1f} us | "
+              f"cache ({reload_interval}s) {cached:6.1f} us")
+
+        subprocess.run([sys.executable, '-c', WRITER.format(root=str(ROOT), db=str(db_path))], check=True)
+        start = time.perf_counter()
+        while store.get_by_username('novo') is None:
+            time.sleep(0.005)
+        print(f"usuário criado em outro processo visível após {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"(limite {reload_interval * 1000:.0f} ms), recargas: {store.reloads}")
+
+
+if __name__ == '__main__':
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    reload_interval = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    run(n_users, reload_interval)
@@ -0,0 +1,36 @@
+"""Cost of an admin burst of user mutations, per-mutation commit vs. one batch()
+
+Crash safety (every mutation that returned is durable, an open batch is
+dropped as a whole) is covered by tests/test_user_store.py.
+
+Usage: python benchmarks/bench_user_writes.py [mutations]
+"""
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_store import UserStore
+
+
+def burst(db_path, n, batched):
+    store = UserStore(db_path, legacy_files=[])
+    start = time.perf_counter()
+    with store.batch() if batched else nullcontext():
+        for i in range(n):
+            store.add_user({'username': f'user{i}', 'password': 'x', 'name': f'Usuário {i}'})
+        for i in range(n):
+            store.update_user(i + 1, name=f'Renomeado {i}')
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as tmp:
+        immediate = burst(Path(tmp) / 'immediate.db', n, False)
+        batched = burst(Path(tmp) / 'batched.db', n, True)
+        print(f"{2 * n} mutações: commit a cada uma {immediate * 1000:8.1f} ms | "
+              f"um batch() {batched * 1000:8.1f} ms ({immediate / batched:.1f}x)")
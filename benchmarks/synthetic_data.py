@@ -0,0 +1,48 @@
+"""Synthetic contract lists shaped like "(JULIO) LISTAS INDIVIDUAIS - IGOR.csv" for benchmarks"""
+import numpy as np
+import pandas as pd
+
+SITUACOES = ['APROVADO', 'VERIFICADO', 'PENDENTE', 'ANÁLISE', 'QUITADO', 'RECUSADO']
+CONTATOS = ['SEM SUCESSO', 'BRADESCO', 'ITAÚ', 'SANTANDER', 'CAIXA', 'BANCO DO BRASIL']
+BANCOS = ['BRADESCO', 'ITAÚ', 'SANTANDER', 'CAIXA', 'BANCO DO BRASIL', 'PAN', 'BMG']
+ESCRITORIOS = ['MATRIZ', 'FILIAL SP', 'FILIAL RJ', 'FILIAL BH']
+
+
+def make_contracts_frame(n_rows, n_negotiators=25, seed=42):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2024-01-01')
+    data = start + pd.to_timedelta(rng.integers(0, 365, n_rows), unit='D')
+    resolucao = data + pd.to_timedelta(rng.integers(0, 90, n_rows), unit='D')
+    valores = rng.uniform(500, 150000, n_rows)
+    legacy = rng.random(n_rows) < 0.7
+
+    contratos = np.where(
+        legacy,
+        rng.integers(100000, 2999999, n_rows),
+        rng.integers(30000000, 99999999, n_rows)
+    )
+
+    return pd.DataFrame({
+        'DATA': data.strftime('%d/%m/%Y'),
+        'RESOLUÇÃO': resolucao.strftime('%d/%m/%Y'),
+        'CONTRATO': contratos.astype(str),
+        'VALOR DO CLIENTE': [
+            f"R$ {v:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+            for v in valores
+        ],
+        'CONTATO': rng.choice(CONTATOS, n_rows),
+        'NEGOCIAÇÃO': [f"NEGOCIADOR {i:04d}" for i in rng.integers(0, n_negotiators, n_rows)],
+        'SITUAÇÃO': rng.choice([s.lower() + ' ' for s in SITUACOES], n_rows),
+        'OBSERVAÇÃO': rng.choice(['', 'RETORNAR', 'CLIENTE AUSENTE', 'PROPOSTA ENVIADA'], n_rows),
+        'CAMPANHA': rng.choice(['sim', 'NÃO', ' SIM'], n_rows),
+        'BANCO': rng.choice(BANCOS, n_rows),
+        'ESCRITÓRIO': rng.choice(ESCRITORIOS, n_rows),
+        'PRAZO B': rng.integers(-10, 30, n_rows).astype(str),
+        'PRAZO 7': rng.integers(-10, 30, n_rows).astype(str),
+    })
+
+
+def write_contracts_csv(path, n_rows, n_negotiators=25, seed=42, encoding='utf-8'):
+    df = make_contracts_frame(n_rows, n_negotiators=n_negotiators, seed=seed)
+    df.to_csv(path, index=False, encoding=encoding)
+    return path
@@ -0,0 +1,107 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from csv_loader import read_csv
+
+# Low-cardinality text columns of the contract lists, loaded as categoricals
+CATEGORICAL_COLUMNS = ['SITUAÇÃO', 'CAMPANHA', 'CONTATO', 'NEGOCIAÇÃO', 'BANCO', 'ESCRITÓRIO']
+DATE_COLUMNS = ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA']
+DATE_FORMAT = '%d/%m/%Y'
+CONTRACT_COLUMN = 'CONTRATO'
+
+
+def read_options(date_columns=('DATA', 'RESOLUÇÃO')):
+    """read_csv kwargs that type the contract columns at parse time.
+
+    `date_columns` must exist in the file (pandas rejects missing
+    parse_dates columns); dtypes for absent columns are simply ignored.
+    """
+    return {
+        'dtype': {col: 'category' for col in CATEGORICAL_COLUMNS},
+        'parse_dates': list(date_columns),
+        'date_format': DATE_FORMAT
+    }
+
+
+def normalize_categories(series):
+    """Upper-case and strip a categorical by rewriting its categories, not its rows.
+
+    Categories that collapse to the same label (e.g. 'sim' and ' SIM') are
+    merged by remapping the integer codes.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+
+    normalized = series.cat.categories.astype(str).str.upper().str.strip()
+    unique = pd.Index(normalized).unique()
+    if len(unique) == len(normalized):
+        return series.cat.rename_categories(normalized)
+
+    mapping = unique.get_indexer(normalized)
+    codes = series.cat.codes.to_numpy()
+    new_codes = np.where(codes >= 0, mapping[codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=unique),
+        index=series.index,
+        name=series.name
+    )
+
+
+def to_contract_numbers(series):
+    """Contract numbers as nullable Int64 when every non-empty value is an integer.
+
+    Lists mixing in free-text contract ids are kept as stripped strings so
+    no id is lost.
+    """
+    if pd.api.types.is_integer_dtype(series):
+        return series.astype('Int64')
+
+    text = series.astype('string').str.strip()
+    numbers = pd.to_numeric(text, errors='coerce')
+    present = text.notna() & (text != '')
+    valid = numbers.notna() & (numbers % 1 == 0)
+    if bool((valid | ~present).all()):
+        return numbers.astype('Int64')
+    return series.astype(str).str.strip()
+
+
+def apply_schema(df):
+    """Bring a contract frame to the declared dtypes, converting only what the reader didn't"""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = normalize_categories(df[col])
+
+    for col in DATE_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
+
+    if CONTRACT_COLUMN in df.columns:
+        df[CONTRACT_COLUMN] = to_contract_numbers(df[CONTRACT_COLUMN])
+    return df
+
+
+def read_contracts(path, date_columns=('DATA', 'RESOLUÇÃO'), **kwargs):
+    """Load a contract list with categoricals, Int64 contracts and datetime64 dates"""
+    options = read_options(date_columns)
+    options.update(kwargs)
+    df = read_csv(path, **options)
+    df.columns = df.columns.str.strip()
+    return apply_schema(df)
+
+
+def memory_report(before, after):
+    """Bytes per column before and after applying the schema"""
+    report = pd.DataFrame({
+        'bytes_before': before.memory_usage(deep=True, index=False),
+        'bytes_after': after.memory_usage(deep=True, index=False).reindex(before.columns)
+    })
+    report['dtype_before'] = before.dtypes.astype(str)
+    report['dtype_after'] = after.dtypes.reindex(before.columns).astype(str)
+    report['ratio'] = (report['bytes_after'] / report['bytes_before']).round(3)
+    totals = report[['bytes_before', 'bytes_after']].sum()
+    logging.info(
+        f"Memória: {totals['bytes_before'] / 1e6:.1f} MB -> {totals['bytes_after'] / 1e6:.1f} MB"
+    )
+    return report
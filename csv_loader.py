@@ -0,0 +1,130 @@
+import codecs
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# Only this many leading bytes are inspected to pick the codec
+SNIFF_BYTES = 64 * 1024
+# latin1 maps every byte, so it is the last resort that always decodes
+FALLBACK_ENCODING = 'latin1'
+
+_memory_lock = threading.Lock()
+
+
+def detect_encoding(path, sample_size=SNIFF_BYTES):
+    """Guess the codec of a CSV from a bounded prefix of its bytes"""
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    try:
+        # final=False tolerates a multi-byte character cut off by the sample boundary
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+
+def _memory_file(path):
+    return Path(path).parent / ".cache" / "encodings.json"
+
+
+def _read_memory(memory_file):
+    try:
+        with open(memory_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def remember_encoding(path, encoding):
+    """Persist the codec that successfully decoded path, with the size and mtime it was seen at"""
+    memory_file = _memory_file(path)
+    with _memory_lock:
+        try:
+            memory = _read_memory(memory_file)
+            memory[Path(path).name] = {"encoding": encoding, **_file_signature(path)}
+            memory_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = memory_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(memory, f, indent=4)
+            os.replace(tmp_path, memory_file)
+        except OSError as e:
+            logging.warning(f"Não foi possível registrar encoding de {path}: {str(e)}")
+
+
+def resolve_encoding(path):
+    """Return the remembered codec for path, sniffing and recording it on first use.
+
+    A new export under the same name (different size or mtime) is sniffed
+    again, so a file once recorded as latin1 isn't decoded as mojibake forever.
+    """
+    entry = _read_memory(_memory_file(path)).get(Path(path).name)
+    # Entries written before the size/mtime were recorded are plain strings: sniff again
+    if isinstance(entry, dict) and {k: entry.get(k) for k in ("size", "mtime_ns")} == _file_signature(path):
+        return entry["encoding"]
+    encoding = detect_encoding(path)
+    remember_encoding(path, encoding)
+    return encoding
+
+
+def read_csv(path, **kwargs):
+    """pd.read_csv with the file's remembered (or sniffed) encoding.
+
+    Shared by the dashboard and the analysis scripts so every file is
+    parsed once with the right codec instead of trying encodings in turn.
+    """
+    encoding = resolve_encoding(path)
+    try:
+        return pd.read_csv(path, encoding=encoding, **kwargs)
+    except UnicodeDecodeError:
+        if encoding == FALLBACK_ENCODING:
+            raise
+        # The prefix looked like UTF-8 but a later byte wasn't
+        logging.warning(f"{path} não é {encoding}, relendo como {FALLBACK_ENCODING}")
+        remember_encoding(path, FALLBACK_ENCODING)
+        return pd.read_csv(path, encoding=FALLBACK_ENCODING, **kwargs)
+
+
+def iter_csv_chunks(path, chunksize, **kwargs):
+    """Yield DataFrames of at most `chunksize` rows, so memory stays bounded by the chunk size.
+
+    If a byte deep in the file turns out not to be valid in the sniffed
+    codec, the file is reopened as latin1 and the rows already yielded are
+    skipped, so every row is produced exactly once.
+    """
+    encoding = resolve_encoding(path)
+    rows_yielded = 0
+    try:
+        with pd.read_csv(path, encoding=encoding, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                rows_yielded += len(chunk)
+                yield chunk
+        return
+    except UnicodeDecodeError:
+        if encoding == FALLBACK_ENCODING:
+            raise
+        logging.warning(f"{path} não é {encoding}, continuando como {FALLBACK_ENCODING}")
+        remember_encoding(path, FALLBACK_ENCODING)
+
+    to_skip = rows_yielded
+    with pd.read_csv(path, encoding=FALLBACK_ENCODING, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            if to_skip >= len(chunk):
+                to_skip -= len(chunk)
+                continue
+            if to_skip:
+                chunk = chunk.iloc[to_skip:]
+                to_skip = 0
+            yield chunk
@@ -1,383 +1,471 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, send_from_directory
-import pandas as pd
-import json
-from pathlib import Path
-import base64
-import logging
-import traceback
-import numpy as np
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user
-from datetime import datetime
-import os
-
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'your-secret-key-here'  # Required for sessions
-app.config['SESSION_TYPE'] = 'filesystem'
-
-# Initialize Flask-Login
-login_manager = LoginManager()
-login_manager.init_app(app)
-login_manager.login_view = 'login'
-
-class User(UserMixin):
-    def __init__(self, user_data):
-        self.id = user_data['id']
-        self.username = user_data['username']
-        self.name = user_data['name']
-        self.role = user_data['role']
-        self.password_hash = user_data['password']
-
-class DataLoader:
-    def __init__(self, file_path):
-        self.file_path = Path(file_path)
-        
-    def load_csv(self):
-        try:
-            if not self.file_path.exists():
-                raise FileNotFoundError(f"Arquivo não encontrado: {self.file_path}")
-            
-            # Try different encodings
-            encodings = ['utf-8', 'latin1', 'iso-8859-1']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(
-                        self.file_path,
-                        encoding=encoding,
-                        parse_dates=['DATA', 'RESOLUÇÃO'],
-                        dayfirst=True  # Brazilian date format
-                    )
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    logging.error(f"Erro ao tentar encoding {encoding}: {str(e)}")
-            
-            if df is None:
-                raise ValueError("Não foi possível ler o arquivo CSV com nenhuma codificação")
-                
-            return self._validate_and_clean_data(df)
-            
-        except Exception as e:
-            logging.error(f"Erro ao carregar CSV: {str(e)}\n{traceback.format_exc()}")
-            raise
-
-    def _validate_and_clean_data(self, df):
-        required_columns = {
-            'DATA': datetime,
-            'RESOLUÇÃO': datetime,
-            'CONTRATO': str,
-            'VALOR DO CLIENTE': str,
-            'CONTATO': str,
-            'NEGOCIAÇÃO': str,
-            'SITUAÇÃO': str,
-            'OBSERVAÇÃO': str,
-            'CAMPANHA': str
-        }
-        
-        # Validate columns
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Colunas obrigatórias faltando: {', '.join(missing)}")
-
-        # Clean data
-        df['CONTRATO'] = df['CONTRATO'].astype(str).str.strip()
-        df['SITUAÇÃO'] = df['SITUAÇÃO'].astype(str).str.upper().str.strip()
-        df['CAMPANHA'] = df['CAMPANHA'].astype(str).str.upper().str.strip()
-        
-        return df
-
-class DashboardManager:
-    def __init__(self):
-        self.users_file = Path("users.json")
-        self.setup_logging()
-        self.load_users()
-        self.data_loader = DataLoader("(JULIO) LISTAS INDIVIDUAIS - IGOR.csv")
-        
-    def setup_logging(self):
-        logging.basicConfig(
-            filename='dashboard.log',
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-    
-    def load_users(self):
-        if self.users_file.exists():
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                self.users = json.load(f)
-        else:
-            # Default credentials
-            self.users = [
-                {
-                    "id": 1,
-                    "username": "admin",
-                    "password": generate_password_hash("admin123"),
-                    "name": "Administrador",
-                    "role": "admin"
-                }
-            ]
-            self.save_users()
-
-    def save_users(self):
-        with open(self.users_file, 'w', encoding='utf-8') as f:
-            json.dump(self.users, f, ensure_ascii=False, indent=4)
-
-    def analyze_contracts(self):
-        """
-        Analisa o arquivo CSV de contratos e retorna estatísticas para o dashboard.
-        """
-        try:
-            df = self.data_loader.load_csv()
-            if df.empty:
-                return self._get_empty_stats()
-            
-            # Clean and convert financial values
-            df['VALOR_CLEANED'] = pd.to_numeric(
-                df['VALOR DO CLIENTE'].astype(str)
-                .str.replace('R$', '')
-                .str.replace('.', '')
-                .str.replace(',', '.')
-                .str.extract(r'(\d+\.?\d*)', expand=False),
-                errors='coerce'
-            ).fillna(0)
-
-            # Calculate basic stats
-            total_contracts = len(df)
-            legacy_mask = df['CONTRATO'].astype(str).str.match(r'^[12]\d{5,6}$')
-            legacy_contracts = df[legacy_mask]
-            num_legacy = len(legacy_contracts)
-            percent_legacy = round((num_legacy / total_contracts) * 100, 2) if total_contracts else 0
-
-            # Calculate situation distribution
-            status_counts = legacy_contracts['SITUAÇÃO'].value_counts().to_dict()
-            approved_count = status_counts.get('APROVADO', 0) + status_counts.get('VERIFICADO', 0)
-            
-            # Calculate financial metrics
-            financial_stats = {
-                "total_value": float(legacy_contracts['VALOR_CLEANED'].sum()),
-                "average_value": float(legacy_contracts['VALOR_CLEANED'].mean()),
-                "max_value": float(legacy_contracts['VALOR_CLEANED'].max()),
-                "min_value": float(legacy_contracts['VALOR_CLEANED'].min()),
-                "sem_sucesso": len(legacy_contracts[legacy_contracts['CONTATO'] == 'SEM SUCESSO'])
-            }
-
-            # Calculate performance metrics
-            performance_stats = {
-                "taxa_aprovacao": (approved_count / num_legacy * 100) if num_legacy > 0 else 0,
-                "media_dias_resolucao": (legacy_contracts['RESOLUÇÃO'] - legacy_contracts['DATA']).dt.days.mean(),
-                "contratos_sim": len(legacy_contracts[legacy_contracts['CAMPANHA'] == 'SIM']),
-                "contratos_nao": len(legacy_contracts[legacy_contracts['CAMPANHA'] == 'NÃO'])
-            }
-
-            # Calculate negotiator performance
-            negotiator_stats = {}
-            for negotiator in legacy_contracts['NEGOCIAÇÃO'].unique():
-                if pd.isna(negotiator):
-                    continue
-                
-                negotiator_data = legacy_contracts[legacy_contracts['NEGOCIAÇÃO'] == negotiator]
-                approved = len(negotiator_data[negotiator_data['SITUAÇÃO'].isin(['APROVADO', 'VERIFICADO'])])
-                
-                negotiator_stats[negotiator] = {
-                    "total_contratos": len(negotiator_data),
-                    "aprovados": approved,
-                    "taxa_sucesso": (approved / len(negotiator_data) * 100) if len(negotiator_data) > 0 else 0,
-                    "valor_total": float(negotiator_data['VALOR_CLEANED'].sum())
-                }
-
-            return {
-                "total_contracts": total_contracts,
-                "legacy_contracts": num_legacy,
-                "percent_legacy": percent_legacy,
-                "status_counts": status_counts,
-                "financial": financial_stats,
-                "performance": performance_stats,
-                "negotiators": negotiator_stats,
-                "bank_distribution": legacy_contracts['CONTATO'].value_counts().to_dict(),
-                "campaign_distribution": legacy_contracts['CAMPANHA'].value_counts().to_dict()
-            }
-
-        except Exception as e:
-            logging.error(f"Error in analyze_contracts: {str(e)}\n{traceback.format_exc()}")
-            return self._get_empty_stats()
-
-    def _get_empty_stats(self):
-        """Helper method to return empty statistics structure"""
-        return {
-            "total_contracts": 0,
-            "legacy_contracts": 0,
-            "percent_legacy": 0,
-            "status_counts": {},
-            "financial": {
-                "total_value": 0,
-                "average_value": 0,
-                "max_value": 0,
-                "min_value": 0,
-                "sem_sucesso": 0
-            },
-            "performance": {
-                "taxa_aprovacao": 0,
-                "media_dias_resolucao": 0,
-                "contratos_sim": 0,
-                "contratos_nao": 0
-            },
-            "negotiators": {},
-            "bank_distribution": {},
-            "campaign_distribution": {}
-        }
-
-dashboard = DashboardManager()
-
-@login_manager.user_loader
-def load_user(user_id):
-    user_data = next((u for u in dashboard.users if u['id'] == int(user_id)), None)
-    return User(user_data) if user_data else None
-
-@app.route('/')
-@login_required
-def home():
-    try:
-        stats = dashboard.analyze_contracts()
-        return render_template('dashboard.html', stats=stats)
-    except Exception as e:
-        logging.error(f"Error in home route: {str(e)}\n{traceback.format_exc()}")
-        return render_template('error.html', error=str(e)), 500
-
-@app.route('/login', methods=['GET', 'POST'])
-def login():
-    if request.method == 'POST':
-        data = request.json
-        username = data.get('username')
-        password = data.get('password')
-        
-        try:
-            user = next(
-                (u for u in dashboard.users if u['username'] == username),
-                None
-            )
-            
-            if user and check_password_hash(user['password'], password):
-                login_user(User(user))
-                return jsonify({
-                    'success': True,
-                    'user': {
-                        'id': user['id'],
-                        'name': user['name'],
-                        'role': user['role']
-                    }
-                })
-            
-            return jsonify({
-                'success': False,
-                'message': 'Usuário ou senha inválidos'
-            }), 401
-            
-        except Exception as e:
-            logging.error(f"Erro no login: {str(e)}")
-            return jsonify({
-                'success': False,
-                'message': 'Erro no servidor'
-            }), 500
-    
-    return render_template('login.html')
-
-@app.route('/logout')
-@login_required
-def logout():
-    logout_user()
-    return redirect(url_for('login'))
-
-@app.route('/favicon.ico')
-def favicon():
-    return send_from_directory(
-        os.path.join(app.root_path, 'static'),
-        'favicon.ico',
-        mimetype='image/vnd.microsoft.icon'
-    )
-
-@app.route('/api/auth', methods=['POST'])
-def authenticate():
-    data = request.json
-    username = data.get('username')
-    password = data.get('password')
-    
-    try:
-        user_data = next(
-            (u for u in dashboard.users if u['username'] == username),
-            None
-        )
-        
-        if user_data and check_password_hash(user_data['password'], password):
-            return jsonify({
-                'success': True,
-                'user': {
-                    'id': user_data['id'],
-                    'name': user_data['name'],
-                    'role': user_data['role']
-                }
-            })
-        return jsonify({'success': False, 'message': 'Credenciais inválidas'})
-    
-    except Exception as e:
-        logging.error(f"Erro na autenticação: {str(e)}")
-        return jsonify({'success': False, 'message': 'Erro no servidor'})
-
-@app.route('/api/users', methods=['GET', 'POST', 'PUT', 'DELETE'])
-def manage_users():
-    if request.method == 'GET':
-        return jsonify(dashboard.users)
-    
-    if request.method == 'POST':
-        data = request.json
-        try:
-            new_user = {
-                'id': max(u['id'] for u in dashboard.users) + 1,
-                'username': data['username'],
-                'password': generate_password_hash(data['password']),
-                'name': data['name'],
-                'role': data['role']
-            }
-            dashboard.users.append(new_user)
-            dashboard.save_users()
-            return jsonify({'success': True, 'message': 'Usuário criado com sucesso'})
-        except Exception as e:
-            return jsonify({'success': False, 'message': str(e)})
-
-@app.errorhandler(404)
-def not_found_error(error):
-    return render_template('error.html', error='Página não encontrada'), 404
-
-@app.errorhandler(500)
-def internal_error(error):
-    logging.error(f"Internal error: {str(error)}\n{traceback.format_exc()}")
-    return render_template('error.html', error='Erro interno do servidor'), 500
-
-if __name__ == '__main__':
-    try:
-        # Create required directories
-        os.makedirs('static', exist_ok=True)
-        os.makedirs('templates', exist_ok=True)
-        
-        # Install required packages if not present
-        try:
-            import flask
-            import pandas
-            import flask_login
-        except ImportError:
-            subprocess.check_call([
-                "pip", "install", 
-                "flask", "pandas", "flask-login",
-                "werkzeug", "jinja2"
-            ])
-        
-        # Initialize the dashboard
-        dashboard = DashboardManager()
-        
-        # Run the application
-        app.run(debug=True, port=5000, host='0.0.0.0')
-        
-    except Exception as e:
-        logging.error(f"Startup error: {str(e)}\n{traceback.format_exc()}")
+from flask import Flask, render_template, request, jsonify, redirect, url_for, send_from_directory, session
+import pandas as pd
+from pathlib import Path
+import base64
+import io
+import logging
+import traceback
+import numpy as np
+from werkzeug.security import generate_password_hash
+from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user
+from datetime import datetime
+import os
+from snapshot_cache import SnapshotCache, file_fingerprint
+from csv_loader import FALLBACK_ENCODING, iter_csv_chunks, read_csv, resolve_encoding
+from contract_schema import apply_schema, read_options
+from user_store import UserStore
+from rate_limiter import LoginRateLimiter
+import password_pool
+from password_pool import PoolBusyError
+from aggregate_store import ContractAggregates, IncrementalContractStats
+from stats_refresher import StatsRefresher
+from response_cache import CachedBody, ResponseCache, make_etag, matching_etag, representation_etag, supported_encodings
+from session_store import ServerSideSessionInterface, make_backend
+
+app = Flask(__name__)
+app.config['SECRET_KEY'] = 'your-secret-key-here'  # Required for sessions
+# 'memory' for a single worker, 'sqlite' (data/sessions.db) when several workers share sessions
+app.config['SESSION_TYPE'] = os.environ.get('SESSION_TYPE', 'sqlite')
+app.config['SESSION_TTL'] = int(os.environ.get('SESSION_TTL', 900))
+app.session_interface = ServerSideSessionInterface(
+    make_backend(app.config['SESSION_TYPE'], ttl=app.config['SESSION_TTL'])
+)
+# Background stats refresh: poll the CSV every N seconds, recompute at least every M seconds
+app.config['STATS_POLL_INTERVAL'] = float(os.environ.get('STATS_POLL_INTERVAL', 2))
+app.config['STATS_REFRESH_INTERVAL'] = float(os.environ.get('STATS_REFRESH_INTERVAL', 300))
+# Rows per chunk for streaming ingestion of large exports (0 loads the whole file at once)
+app.config['STATS_CHUNK_ROWS'] = int(os.environ.get('STATS_CHUNK_ROWS', 0))
+
+# Initialize Flask-Login
+login_manager = LoginManager()
+login_manager.init_app(app)
+login_manager.login_view = 'login'
+
+class User(UserMixin):
+    def __init__(self, user_data):
+        self.id = user_data['id']
+        self.username = user_data['username']
+        self.name = user_data['name']
+        self.role = user_data['role']
+        self.password_hash = user_data['password']
+
+class DataLoader:
+    def __init__(self, file_path, use_snapshot=True):
+        self.file_path = Path(file_path)
+        self.snapshot = SnapshotCache(self.file_path) if use_snapshot else None
+        
+    def load_csv(self):
+        try:
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"Arquivo não encontrado: {self.file_path}")
+
+            # Reuse the typed snapshot when the file hasn't changed since the last parse
+            use_snapshot = self.snapshot is not None and self.snapshot.enabled
+            if use_snapshot:
+                df = self.snapshot.load()
+                if df is not None:
+                    return df
+                # Fingerprint before parsing so a concurrent write invalidates the snapshot
+                fingerprint = file_fingerprint(self.file_path)
+            
+            # Categoricals and dd/mm/yyyy dates are typed by the reader itself
+            df = read_csv(self.file_path, **read_options())
+            df = self._validate_and_clean_data(df)
+            if use_snapshot:
+                self.snapshot.store(df, fingerprint)
+            return df
+            
+        except Exception as e:
+            logging.error(f"Erro ao carregar CSV: {str(e)}\n{traceback.format_exc()}")
+            raise
+
+    def iter_chunks(self, chunksize):
+        """Stream the CSV as cleaned frames of at most `chunksize` rows"""
+        for chunk in iter_csv_chunks(self.file_path, chunksize, **read_options()):
+            yield self._validate_and_clean_data(chunk)
+
+    def parse_rows(self, raw_bytes, columns):
+        """Parse headerless CSV rows (e.g. bytes appended to the file) with the same cleaning"""
+        encoding = resolve_encoding(self.file_path)
+        try:
+            text = raw_bytes.decode(encoding)
+        except UnicodeDecodeError:
+            text = raw_bytes.decode(FALLBACK_ENCODING)
+
+        df = pd.read_csv(io.StringIO(text), header=None, names=columns, **read_options())
+        return self._validate_and_clean_data(df)
+
+    def _validate_and_clean_data(self, df):
+        required_columns = {
+            'DATA': datetime,
+            'RESOLUÇÃO': datetime,
+            'CONTRATO': str,
+            'VALOR DO CLIENTE': str,
+            'CONTATO': str,
+            'NEGOCIAÇÃO': str,
+            'SITUAÇÃO': str,
+            'OBSERVAÇÃO': str,
+            'CAMPANHA': str
+        }
+        
+        # Validate columns
+        missing = [col for col in required_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Colunas obrigatórias faltando: {', '.join(missing)}")
+
+        # Normalize categories (upper/strip), contract numbers and dates
+        return apply_schema(df)
+
+class DashboardManager:
+    def __init__(self):
+        # Same SQLite store as UserManager; users.json is migrated on first use
+        self.user_store = UserStore()
+        # Same data/login_attempts.db as calculator.py's UserManager
+        self.login_limiter = LoginRateLimiter()
+        self.setup_logging()
+        self.load_users()
+        self.data_loader = DataLoader("(JULIO) LISTAS INDIVIDUAIS - IGOR.csv")
+        self.stats_engine = IncrementalContractStats(
+            self.data_loader,
+            chunksize=app.config['STATS_CHUNK_ROWS'] or None
+        )
+        self.stats_refresher = StatsRefresher(
+            self.stats_engine.refresh,
+            self.data_loader.file_path,
+            poll_interval=app.config['STATS_POLL_INTERVAL'],
+            refresh_interval=app.config['STATS_REFRESH_INTERVAL'],
+            fallback=self._get_empty_stats()
+        )
+        # Serialized /api/stats bodies, one per dataset fingerprint and filter set
+        self.stats_responses = ResponseCache(max_entries=64)
+        
+    def setup_logging(self):
+        logging.basicConfig(
+            filename='dashboard.log',
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s'
+        )
+    
+    def load_users(self):
+        if self.user_store.count() == 0:
+            # Default credentials
+            self.user_store.add_user({
+                "id": 1,
+                "username": "admin",
+                "password": generate_password_hash("admin123"),
+                "name": "Administrador",
+                "role": "admin"
+            })
+
+    @property
+    def users(self):
+        return self.user_store.list_users()
+
+    def analyze_contracts(self):
+        """
+        Analisa o arquivo CSV de contratos e retorna estatísticas para o dashboard.
+
+        As estatísticas vêm de agregados incrementais: se o CSV só recebeu
+        novas linhas desde a última chamada, apenas essas linhas são processadas.
+        """
+        try:
+            return self.stats_engine.refresh()
+
+        except Exception as e:
+            logging.error(f"Error in analyze_contracts: {str(e)}\n{traceback.format_exc()}")
+            return self._get_empty_stats()
+
+    def _get_empty_stats(self):
+        """Helper method to return empty statistics structure"""
+        return {
+            "total_contracts": 0,
+            "legacy_contracts": 0,
+            "percent_legacy": 0,
+            "status_counts": {},
+            "financial": {
+                "total_value": 0,
+                "average_value": 0,
+                "max_value": 0,
+                "min_value": 0,
+                "sem_sucesso": 0
+            },
+            "performance": {
+                "taxa_aprovacao": 0,
+                "media_dias_resolucao": 0,
+                "contratos_sim": 0,
+                "contratos_nao": 0
+            },
+            "negotiators": {},
+            "bank_distribution": {},
+            "campaign_distribution": {}
+        }
+
+dashboard = DashboardManager()
+
+@login_manager.user_loader
+def load_user(user_id):
+    user_data = dashboard.user_store.get_by_id(int(user_id))
+    return User(user_data) if user_data else None
+
+@app.route('/')
+@login_required
+def home():
+    try:
+        # Last good stats, recomputed in the background when the CSV changes
+        stats, generated_at = dashboard.stats_refresher.get()
+        return render_template('dashboard.html', stats=stats, stats_generated_at=generated_at)
+    except Exception as e:
+        logging.error(f"Error in home route: {str(e)}\n{traceback.format_exc()}")
+        return render_template('error.html', error=str(e)), 500
+
+def _parse_stats_filters(args):
+    """Read the optional bank/negotiator/date-window filters of /api/stats"""
+    filters = {}
+    for name in ('banco', 'negociador'):
+        value = args.get(name, '').strip().upper()
+        if value:
+            filters[name] = value
+    for name in ('data_inicio', 'data_fim'):
+        value = args.get(name, '').strip()
+        if value:
+            filters[name] = datetime.strptime(value, '%Y-%m-%d').date().isoformat()
+    return filters
+
+def _filtered_aggregates(df, filters):
+    mask = pd.Series(True, index=df.index)
+    if 'banco' in filters:
+        bank_column = 'BANCO' if 'BANCO' in df.columns else 'CONTATO'
+        mask &= df[bank_column] == filters['banco']
+    if 'negociador' in filters:
+        mask &= df['NEGOCIAÇÃO'] == filters['negociador']
+    if 'data_inicio' in filters:
+        mask &= df['DATA'] >= pd.Timestamp(filters['data_inicio'])
+    if 'data_fim' in filters:
+        mask &= df['DATA'] < pd.Timestamp(filters['data_fim']) + pd.Timedelta(days=1)
+    return ContractAggregates.from_frame(df[mask])
+
+def _filtered_stats(filters):
+    chunksize = dashboard.stats_engine.chunksize
+    if not chunksize:
+        return _filtered_aggregates(dashboard.data_loader.load_csv(), filters).to_stats()
+
+    aggregates = ContractAggregates()
+    for chunk in dashboard.data_loader.iter_chunks(chunksize):
+        aggregates.merge(_filtered_aggregates(chunk, filters))
+    return aggregates.to_stats()
+
+def _source_signature():
+    stat = dashboard.data_loader.file_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+@app.route('/api/stats')
+@login_required
+def api_stats():
+    """analyze_contracts as JSON, revalidated by ETag and compressed when large"""
+    try:
+        filters = _parse_stats_filters(request.args)
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Datas devem estar no formato AAAA-MM-DD'}), 400
+
+    try:
+        if filters:
+            signature = _source_signature()
+        else:
+            stats, generated_at, signature = dashboard.stats_refresher.get_versioned()
+
+        # The ETag depends only on the dataset fingerprint and the filters, so a
+        # matching If-None-Match is answered before any stats are computed.
+        # Each content coding gets its own suffix; any of them revalidates.
+        cache_key = (signature, tuple(sorted(filters.items())))
+        etag = make_etag(*cache_key)
+        matched = matching_etag(request.if_none_match, etag) if signature is not None else None
+        if matched:
+            response = app.response_class(status=304)
+            response.set_etag(matched)
+        else:
+            entry = dashboard.stats_responses.get(cache_key)
+            if entry is None:
+                if filters:
+                    payload = _filtered_stats(filters)
+                    generated_at = datetime.now()
+                else:
+                    payload = stats
+                entry = CachedBody(etag, {'stats': payload, 'generated_at': generated_at, 'filters': filters})
+                # Don't pin a body to a fingerprint the file moved past while we computed it
+                if signature is not None and (not filters or _source_signature() == signature):
+                    dashboard.stats_responses.put(cache_key, entry)
+
+            encoding = request.accept_encodings.best_match(supported_encodings())
+            body, content_encoding = entry.encoded(encoding)
+            response = app.response_class(body, mimetype='application/json')
+            if content_encoding:
+                response.headers['Content-Encoding'] = content_encoding
+            response.set_etag(representation_etag(etag, content_encoding))
+
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    except Exception as e:
+        logging.error(f"Error in api_stats: {str(e)}\n{traceback.format_exc()}")
+        return jsonify({'success': False, 'message': 'Erro no servidor'}), 500
+
+@app.route('/api/stats/refresh-metrics')
+@login_required
+def stats_refresh_metrics():
+    return jsonify(dashboard.stats_refresher.metrics())
+
+@app.route('/api/sessions/metrics')
+@login_required
+def session_metrics():
+    return jsonify(app.session_interface.backend.metrics())
+
+@app.route('/api/auth/pool-metrics')
+@login_required
+def password_pool_metrics():
+    return jsonify(password_pool.get_pool().metrics())
+
+@app.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        data = request.json
+        username = data.get('username')
+        password = data.get('password')
+        limiter_key = str(username).strip().lower()[:50]
+        
+        try:
+            retry_after = dashboard.login_limiter.retry_after(limiter_key)
+            if retry_after:
+                return jsonify({
+                    'success': False,
+                    'message': 'Muitas tentativas, aguarde para tentar novamente'
+                }), 429, {'Retry-After': str(int(retry_after) + 1)}
+            
+            user = dashboard.user_store.get_by_username(username)
+            
+            # pbkdf2 runs on the bounded password pool, not inline in this thread
+            if user and password_pool.get_pool().check_password(user['password'], password):
+                dashboard.login_limiter.reset(limiter_key)
+                app.session_interface.regenerate(session)
+                login_user(User(user))
+                return jsonify({
+                    'success': True,
+                    'user': {
+                        'id': user['id'],
+                        'name': user['name'],
+                        'role': user['role']
+                    }
+                })
+            
+            dashboard.login_limiter.record_failure(limiter_key)
+            return jsonify({
+                'success': False,
+                'message': 'Usuário ou senha inválidos'
+            }), 401
+            
+        except PoolBusyError as e:
+            return jsonify({'success': False, 'message': str(e)}), 503, {'Retry-After': '2'}
+        except Exception as e:
+            logging.error(f"Erro no login: {str(e)}")
+            return jsonify({
+                'success': False,
+                'message': 'Erro no servidor'
+            }), 500
+    
+    return render_template('login.html')
+
+@app.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    app.session_interface.regenerate(session)
+    return redirect(url_for('login'))
+
+@app.route('/favicon.ico')
+def favicon():
+    return send_from_directory(
+        os.path.join(app.root_path, 'static'),
+        'favicon.ico',
+        mimetype='image/vnd.microsoft.icon'
+    )
+
+@app.route('/api/auth', methods=['POST'])
+def authenticate():
+    data = request.json
+    username = data.get('username')
+    password = data.get('password')
+    
+    try:
+        user_data = dashboard.user_store.get_by_username(username)
+        
+        if user_data and password_pool.get_pool().check_password(user_data['password'], password):
+            return jsonify({
+                'success': True,
+                'user': {
+                    'id': user_data['id'],
+                    'name': user_data['name'],
+                    'role': user_data['role']
+                }
+            })
+        return jsonify({'success': False, 'message': 'Credenciais inválidas'})
+    
+    except PoolBusyError as e:
+        return jsonify({'success': False, 'message': str(e)}), 503, {'Retry-After': '2'}
+    except Exception as e:
+        logging.error(f"Erro na autenticação: {str(e)}")
+        return jsonify({'success': False, 'message': 'Erro no servidor'})
+
+@app.route('/api/users', methods=['GET', 'POST', 'PUT', 'DELETE'])
+def manage_users():
+    if request.method == 'GET':
+        return jsonify(dashboard.users)
+    
+    if request.method == 'POST':
+        data = request.json
+        try:
+            new_user = {
+                'username': data['username'],
+                'password': password_pool.get_pool().hash_password(data['password']),
+                'name': data['name'],
+                'role': data['role'],
+                'created_at': datetime.now().isoformat()
+            }
+            if not dashboard.user_store.add_user(new_user):
+                return jsonify({'success': False, 'message': 'Nome de usuário já existe'})
+            return jsonify({'success': True, 'message': 'Usuário criado com sucesso'})
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)})
+
+@app.errorhandler(404)
+def not_found_error(error):
+    return render_template('error.html', error='Página não encontrada'), 404
+
+@app.errorhandler(500)
+def internal_error(error):
+    logging.error(f"Internal error: {str(error)}\n{traceback.format_exc()}")
+    return render_template('error.html', error='Erro interno do servidor'), 500
+
+if __name__ == '__main__':
+    try:
+        # Create required directories
+        os.makedirs('static', exist_ok=True)
+        os.makedirs('templates', exist_ok=True)
+        
+        # Install required packages if not present
+        try:
+            import flask
+            import pandas
+            import flask_login
+        except ImportError:
+            subprocess.check_call([
+                "pip", "install", 
+                "flask", "pandas", "flask-login",
+                "werkzeug", "jinja2"
+            ])
+        
+        # Run the application with the module-level DashboardManager the routes use
+        app.run(debug=True, port=5000, host='0.0.0.0')
+        
+    except Exception as e:
+        logging.error(f"Startup error: {str(e)}\n{traceback.format_exc()}")
         raise
\ No newline at end of file
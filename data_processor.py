@@ -1,119 +1,193 @@
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Optional, Union
-import logging
-
-class DataPreprocessor:
-    """Professional data preprocessing and validation class"""
-    
-    def __init__(self, logging_level: int = logging.INFO):
-        """Initialize with configurable logging"""
-        self.logger = self._setup_logger(logging_level)
-        self.required_columns = {
-            'priority': ['PRAZO B', 'PRAZO 7', 'BANCO', 'SITUAÇÃO'],
-            'quitados': ['CTT', 'SALDO DEVEDOR', 'DESCONTO', 'BANCO', 'CONSULTOR'],
-            'basic': ['DATA', 'RESOLUÇÃO', 'SITUAÇÃO']
-        }
-        
-    def _setup_logger(self, level: int) -> logging.Logger:
-        """Configure logging"""
-        logger = logging.getLogger('DataPreprocessor')
-        logger.setLevel(level)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        return logger
-
-    def validate_columns(self, df: pd.DataFrame, column_set: str) -> bool:
-        """Validate required columns exist"""
-        missing = [col for col in self.required_columns[column_set] 
-                  if col not in df.columns]
-        if missing:
-            self.logger.error(f"Missing required columns for {column_set}: {missing}")
-            return False
-        return True
-
-    def clean_numeric(self, series: pd.Series) -> pd.Series:
-        """Clean and convert numeric values"""
-        try:
-            if series.dtype == object:
-                return pd.to_numeric(
-                    series.astype(str)
-                    .str.replace('R$', '')
-                    .str.replace('%', '')
-                    .str.replace('.', '')
-                    .str.replace(',', '.')
-                    .str.strip(),
-                    errors='coerce'
-                )
-            return series
-        except Exception as e:
-            self.logger.error(f"Error cleaning numeric data: {str(e)}")
-            return pd.Series([np.nan] * len(series))
-
-    def process_dataframe(self, df: pd.DataFrame, analysis_type: str) -> pd.DataFrame:
-        """Process dataframe based on analysis type"""
-        try:
-            df = df.copy()
-            df.columns = df.columns.str.strip()
-            
-            if not self.validate_columns(df, analysis_type):
-                raise ValueError(f"Missing required columns for {analysis_type}")
-            
-            # Common cleaning
-            for col in df.columns:
-                if 'PRAZO' in col or 'VALOR' in col or 'SALDO' in col:
-                    df[col] = self.clean_numeric(df[col])
-                    
-            # Specific processing
-            if analysis_type == 'priority':
-                df = self._process_priority(df)
-            elif analysis_type == 'quitados':
-                df = self._process_quitados(df)
-                
-            return df
-            
-        except Exception as e:
-            self.logger.error(f"Error processing dataframe: {str(e)}")
-            raise
-
-    def _process_priority(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Process priority-specific data"""
-        try:
-            # Handle PRAZO columns
-            if 'PRAZO B' not in df.columns and 'PRAZO 7' in df.columns:
-                df['PRAZO B'] = df['PRAZO 7']
-            
-            # Convert dates
-            date_cols = ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA']
-            for col in date_cols:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
-            
-            return df
-            
-        except Exception as e:
-            self.logger.error(f"Error in priority processing: {str(e)}")
-            raise
-
-    def _process_quitados(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Process quitados-specific data"""
-        try:
-            # Handle specific columns
-            if 'DESCONTO' in df.columns:
-                df['DESCONTO'] = self.clean_numeric(df['DESCONTO'])
-            if 'SALDO DEVEDOR' in df.columns:
-                df['SALDO_DEVEDOR'] = self.clean_numeric(df['SALDO DEVEDOR'])
-                
-            # Calculate derived metrics
-            df['VALOR_DESCONTO'] = df['SALDO_DEVEDOR'] * (df['DESCONTO'] / 100)
-            
-            return df
-            
-        except Exception as e:
-            self.logger.error(f"Error in quitados processing: {str(e)}")
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Union
+import logging
+
+from csv_loader import read_csv
+from money import parse_number
+
+DATE_FORMAT = '%d/%m/%Y'
+
+# Read-time schema per analysis type. load() parses only `required` and
+# `optional` columns: categories are typed by the reader; numeric and date
+# columns are read as plain text and converted column by column right after
+# (clean_numeric, and DATE_FORMAT for dates).
+ANALYSIS_SCHEMAS = {
+    'priority': {
+        'required': ['PRAZO B', 'PRAZO 7', 'BANCO', 'SITUAÇÃO'],
+        'optional': ['OBSERVAÇÃO', 'VALOR DO CLIENTE', 'DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA'],
+        'numeric': ['PRAZO B', 'PRAZO 7', 'VALOR DO CLIENTE'],
+        'dates': ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA'],
+        'categories': ['BANCO', 'SITUAÇÃO']
+    },
+    'quitados': {
+        'required': ['CTT', 'SALDO DEVEDOR', 'DESCONTO', 'BANCO', 'CONSULTOR'],
+        'optional': [],
+        'numeric': ['SALDO DEVEDOR', 'DESCONTO'],
+        'dates': [],
+        'categories': ['BANCO', 'CONSULTOR']
+    },
+    'basic': {
+        'required': ['DATA', 'RESOLUÇÃO', 'SITUAÇÃO'],
+        'optional': [],
+        'numeric': [],
+        'dates': ['DATA', 'RESOLUÇÃO'],
+        'categories': ['SITUAÇÃO']
+    }
+}
+
+class DataPreprocessor:
+    """Professional data preprocessing and validation class"""
+    
+    def __init__(self, logging_level: int = logging.INFO):
+        """Initialize with configurable logging"""
+        self.logger = self._setup_logger(logging_level)
+        self.required_columns = {
+            analysis_type: schema['required'] for analysis_type, schema in ANALYSIS_SCHEMAS.items()
+        }
+        
+    def _setup_logger(self, level: int) -> logging.Logger:
+        """Configure logging"""
+        logger = logging.getLogger('DataPreprocessor')
+        logger.setLevel(level)
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
+
+    def validate_columns(self, df: pd.DataFrame, column_set: str) -> bool:
+        """Validate required columns exist"""
+        missing = [col for col in self.required_columns[column_set] 
+                  if col not in df.columns]
+        if missing:
+            self.logger.error(f"Missing required columns for {column_set}: {missing}")
+            return False
+        return True
+
+    def clean_numeric(self, series: pd.Series) -> pd.Series:
+        """Clean and convert money, percentage and decimal-comma text in one pass"""
+        try:
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+                # Already converted: nothing to clean
+                return series
+            # Each distinct value is parsed once; numbers from Excel pass through unchanged
+            return parse_number(series)
+        except Exception as e:
+            self.logger.error(f"Error cleaning numeric data: {str(e)}")
+            return pd.Series([np.nan] * len(series))
+
+    def read_options(self, path: str, analysis_type: str, **kwargs) -> Dict:
+        """read_csv kwargs that parse only the schema's columns, with their dtypes.
+
+        Only the header is read here: raw header names (which may carry
+        stray spaces, e.g. 'PRAZO 7 ') are matched to the schema, and a
+        missing required column fails before the body is parsed.
+        """
+        schema = ANALYSIS_SCHEMAS[analysis_type]
+        header = read_csv(path, nrows=0, **kwargs).columns
+        raw_names = {str(col).strip(): col for col in header}
+
+        missing = [col for col in schema['required'] if col not in raw_names]
+        if missing:
+            self.logger.error(f"Missing required columns for {analysis_type}: {missing}")
+            raise ValueError(f"Missing required columns for {analysis_type}")
+
+        wanted = [col for col in schema['required'] + schema['optional'] if col in raw_names]
+        dtype = {raw_names[col]: 'category' for col in schema['categories'] if col in raw_names}
+        # Numeric text stays text for clean_numeric: no type inference, no float round trip.
+        # Dates too: combined with dtype=, the reader's own parse_dates is several times
+        # slower than one pd.to_datetime with the format afterwards
+        dtype.update({raw_names[col]: str for col in schema['numeric'] + schema['dates'] if col in raw_names})
+        return {
+            'usecols': [raw_names[col] for col in wanted],
+            'dtype': dtype
+        }
+
+    def load(self, path: str, analysis_type: str, **kwargs) -> pd.DataFrame:
+        """Read and process a file through the analysis type's schema, without a post-load copy"""
+        try:
+            options = self.read_options(path, analysis_type, **kwargs)
+            options.update(kwargs)
+            df = read_csv(path, **options)
+            df.columns = df.columns.str.strip()
+            schema = ANALYSIS_SCHEMAS[analysis_type]
+            for col in schema['dates']:
+                if col in df.columns:
+                    df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
+            return self._convert(df, analysis_type, [col for col in schema['numeric'] if col in df.columns])
+
+        except Exception as e:
+            self.logger.error(f"Error loading {path}: {str(e)}")
+            raise
+
+    def process_dataframe(self, df: pd.DataFrame, analysis_type: str) -> pd.DataFrame:
+        """Process an already loaded dataframe based on analysis type (load() avoids the copy)"""
+        try:
+            df = df.copy()
+            df.columns = df.columns.str.strip()
+            
+            if not self.validate_columns(df, analysis_type):
+                raise ValueError(f"Missing required columns for {analysis_type}")
+            
+            # Common cleaning
+            numeric = [col for col in df.columns if 'PRAZO' in col or 'VALOR' in col or 'SALDO' in col]
+            return self._convert(df, analysis_type, numeric)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing dataframe: {str(e)}")
+            raise
+
+    def _convert(self, df: pd.DataFrame, analysis_type: str, numeric_columns: List[str]) -> pd.DataFrame:
+        """Numeric cleaning plus type-specific processing, column by column in place"""
+        for col in numeric_columns:
+            df[col] = self.clean_numeric(df[col])
+
+        # Specific processing
+        if analysis_type == 'priority':
+            df = self._process_priority(df)
+        elif analysis_type == 'quitados':
+            df = self._process_quitados(df)
+        return df
+
+    def _process_priority(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process priority-specific data"""
+        try:
+            # Handle PRAZO columns
+            if 'PRAZO B' not in df.columns and 'PRAZO 7' in df.columns:
+                df['PRAZO B'] = df['PRAZO 7']
+            
+            # Convert dates
+            date_cols = ['DATA', 'RESOLUÇÃO', 'ÚLTIMO PAGAMENTO', 'ENTRADA']
+            for col in date_cols:
+                # Dates parsed by the reader are left alone; values it couldn't parse are coerced here
+                if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors='coerce')
+            
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error in priority processing: {str(e)}")
+            raise
+
+    def _process_quitados(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process quitados-specific data"""
+        try:
+            # Handle specific columns
+            if 'DESCONTO' in df.columns:
+                df['DESCONTO'] = self.clean_numeric(df['DESCONTO'])
+            if 'SALDO DEVEDOR' in df.columns:
+                # Normally already numeric from the common pass, so this is a no-op
+                df['SALDO_DEVEDOR'] = self.clean_numeric(df['SALDO DEVEDOR'])
+                
+            # Calculate derived metrics
+            df['VALOR_DESCONTO'] = df['SALDO_DEVEDOR'] * (df['DESCONTO'] / 100)
+            
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error in quitados processing: {str(e)}")
             raise
\ No newline at end of file
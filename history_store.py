@@ -0,0 +1,373 @@
+import csv
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from money import parse_brl, parse_brl_value
+
+HISTORY_COLUMNS = ['id', 'data_calculo', 'valor_original', 'valor_proposto', 'desconto_percentual', 'economia']
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Ops pending before the background compactor folds them into the CSV
+COMPACT_MIN_OPS = 200
+COMPACT_INTERVAL = 60.0
+
+
+def ops_path_for(path):
+    path = Path(path)
+    return path.with_name(path.stem + '.ops.jsonl')
+
+
+def new_row_id():
+    return uuid.uuid4().hex
+
+
+def op_positions(ids, ops):
+    """Position in the frame of the row each op refers to, -1 when the row is gone"""
+    return ids.get_indexer([op.get('id') for op in ops])
+
+
+def fold_ops(frame, ops, positions):
+    """Apply edit/delete ops to a CSV frame read as str; returns the surviving rows"""
+    deleted = np.zeros(len(frame), dtype=bool)
+    for op, row in zip(ops, positions):
+        if row < 0:
+            continue
+        if op['op'] == 'delete':
+            deleted[row] = True
+        elif op['op'] == 'edit':
+            for col, value in op['values'].items():
+                frame.at[row, col] = value
+    return frame[~deleted]
+
+
+def _amount(value):
+    try:
+        return parse_brl_value(value)
+    except ValueError:
+        return np.nan
+
+
+class HistoryPage:
+    def __init__(self, rows, total, page, pages, stats):
+        self.rows = rows
+        self.total = total
+        self.page = page
+        self.pages = pages
+        self.stats = stats
+
+
+class HistoryLog:
+    """Write side of the history: appends only.
+
+    New calculations are appended to the CSV with a random `id`. Edits
+    and deletes are appended to <stem>.ops.jsonl as {"op": "edit"|"delete",
+    "id": ..., "values": {...}}, so an edit costs one small append whatever
+    the history size. Ops refer to the row id rather than its position:
+    compaction drops deleted rows and renumbers the rest, and a page
+    rendered before it must still edit the row it showed.
+
+    A daemon thread compacts every `compact_interval` seconds once
+    `compact_min_ops` ops are pending: the folded CSV is written to
+    <name>.compact, the ops file is renamed to <stem>.ops.compacting,
+    the CSV is replaced and the old ops removed. recover() finishes or
+    discards an interrupted compaction, so ops are never applied twice
+    or lost. A CSV written before rows had ids is given them on startup,
+    folding in any position-based ops left by the old format.
+    """
+
+    def __init__(self, path, compact_min_ops=COMPACT_MIN_OPS, compact_interval=COMPACT_INTERVAL):
+        self.path = Path(path)
+        self.ops_path = ops_path_for(self.path)
+        self.compact_path = self.path.with_name(self.path.name + '.compact')
+        self.compacting_path = self.ops_path.with_suffix('.compacting')
+        self.compact_min_ops = compact_min_ops
+        self.compact_interval = compact_interval
+        # Shared with HistoryBrowser so a reader never sees a half-done compaction
+        self.lock = threading.RLock()
+        self._pending_ops = None
+        self._thread = None
+        self._stop = threading.Event()
+        self.compactions = 0
+        self.recover()
+        self._add_ids()
+
+    def recover(self):
+        with self.lock:
+            if self.compacting_path.exists():
+                if self.compact_path.exists():
+                    # Crashed after setting the ops aside: the folded CSV is complete
+                    os.replace(self.compact_path, self.path)
+                os.remove(self.compacting_path)
+            elif self.compact_path.exists():
+                # Crashed while writing the folded CSV: the ops are still live
+                os.remove(self.compact_path)
+
+    def _replace_csv(self, frame):
+        """Swap in the folded CSV and retire the ops it includes (see recover)"""
+        with open(self.compact_path, 'w', encoding='utf-8', newline='') as f:
+            frame.to_csv(f, index=False, lineterminator='\n')
+            f.flush()
+            os.fsync(f.fileno())
+        has_ops = self.ops_path.exists()
+        if has_ops:
+            os.replace(self.ops_path, self.compacting_path)
+        os.replace(self.compact_path, self.path)
+        if has_ops:
+            os.remove(self.compacting_path)
+        self._pending_ops = 0
+
+    def _add_ids(self):
+        with self.lock:
+            try:
+                with open(self.path, 'r', encoding='utf-8', newline='') as f:
+                    header = next(csv.reader(f), [])
+            except FileNotFoundError:
+                return
+            if 'id' in header:
+                return
+            frame = pd.read_csv(self.path, dtype=str, keep_default_na=False)
+            # Old ops carry the row's position, valid until this first rewrite
+            ops, _ = read_ops(self.ops_path)
+            positions = [op['row'] if 0 <= op.get('row', -1) < len(frame) else -1 for op in ops]
+            frame = fold_ops(frame, ops, positions)
+            frame.insert(0, 'id', [new_row_id() for _ in range(len(frame))])
+            self._replace_csv(frame)
+            logging.info(f"Histórico migrado para ids de linha: {len(frame)} linhas, {len(ops)} operações aplicadas")
+
+    def _count_ops(self):
+        if self._pending_ops is None:
+            try:
+                with open(self.ops_path, 'rb') as f:
+                    self._pending_ops = sum(1 for _ in f)
+            except FileNotFoundError:
+                self._pending_ops = 0
+        return self._pending_ops
+
+    def append(self, record):
+        """Append a new calculation row"""
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Append many calculation rows in a single write"""
+        with self.lock:
+            new_file = not self.path.exists()
+            with open(self.path, 'a', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=HISTORY_COLUMNS, lineterminator='\n')
+                if new_file:
+                    writer.writeheader()
+                writer.writerows({**record, 'id': new_row_id()} for record in records)
+
+    def _append_op(self, op):
+        line = json.dumps(op, ensure_ascii=False) + '\n'
+        with self.lock:
+            with open(self.ops_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self._pending_ops = self._count_ops() + 1
+        self.start()
+
+    def edit(self, row_id, values):
+        self._append_op({'op': 'edit', 'id': str(row_id), 'values': values})
+
+    def delete(self, row_id):
+        self._append_op({'op': 'delete', 'id': str(row_id)})
+
+    def start(self):
+        with self.lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='history-compactor', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.compact_interval):
+            if self._count_ops() >= self.compact_min_ops:
+                try:
+                    self.compact()
+                except Exception as e:
+                    logging.error(f"Erro ao compactar o histórico: {str(e)}")
+
+    def compact(self):
+        """Fold the pending ops into the CSV; returns the number of ops applied"""
+        with self.lock:
+            ops, _ = read_ops(self.ops_path)
+            if not ops or not self.path.exists():
+                return 0
+
+            frame = pd.read_csv(self.path, dtype=str, keep_default_na=False)
+            folded = fold_ops(frame, ops, op_positions(pd.Index(frame['id']), ops))
+            self._replace_csv(folded)
+            self.compactions += 1
+            logging.info(f"Histórico compactado: {len(ops)} operações, {len(frame) - len(folded)} linhas removidas")
+            return len(ops)
+
+
+def read_ops(path, offset=0):
+    """(ops, new offset) for the complete lines after `offset`; a torn last line is left for later"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0
+    end = data.rfind(b'\n') + 1
+    ops = []
+    for line in data[:end].splitlines():
+        try:
+            ops.append(json.loads(line))
+        except json.JSONDecodeError:
+            logging.warning(f"Operação inválida ignorada em {path}")
+    return ops, offset + end
+
+
+class HistoryBrowser:
+    """Filtered, paginated view over historico_descontos.csv.
+
+    The CSV is parsed once per file version (size, mtime) into numpy
+    columns plus two sorted indexes, one on data_calculo and one on
+    valor_original. A date filter is a searchsorted range on the date
+    index, a minimum value a searchsorted suffix of the value index, and
+    only the rows of the requested page are turned back into a frame.
+
+    Pending edit/delete ops from HistoryLog are applied lazily: only the
+    lines added since the last refresh are read, deletes become a
+    tombstone mask checked at query time, and the value index is
+    re-sorted only when an edit touched valor_original.
+    """
+
+    def __init__(self, path, log=None):
+        self.path = Path(path)
+        self.ops_path = ops_path_for(self.path)
+        self.log = log
+        self._lock = log.lock if log is not None else threading.RLock()
+        self._signature = None
+        self._ops_offset = 0
+        self.frame = None
+
+    def _file_signature(self):
+        try:
+            stat = self.path.stat()
+            return stat.st_size, stat.st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def refresh(self):
+        """Reload and reindex if the file changed; returns False when there is no history"""
+        with self._lock:
+            signature = self._file_signature()
+            if signature is None:
+                self.frame, self._signature = None, None
+                return False
+            if signature != self._signature:
+                self._build(pd.read_csv(self.path, dtype=str, keep_default_na=False))
+                self._signature = signature
+                self._ops_offset = 0
+
+            try:
+                ops_size = self.ops_path.stat().st_size
+            except FileNotFoundError:
+                ops_size = 0
+            if ops_size < self._ops_offset:
+                # The ops were compacted away but the CSV looked unchanged; start over
+                self._signature = None
+                return self.refresh()
+            if ops_size > self._ops_offset:
+                ops, self._ops_offset = read_ops(self.ops_path, self._ops_offset)
+                self._apply_ops(ops)
+            return self.frame is not None and self.n_deleted < len(self.frame)
+
+    def _apply_ops(self, ops):
+        resort = False
+        for op, row in zip(ops, op_positions(self.ids, ops)):
+            if row < 0:
+                continue
+            if op['op'] == 'delete':
+                if not self.deleted[row]:
+                    self.deleted[row] = True
+                    self.n_deleted += 1
+            elif op['op'] == 'edit':
+                for col, value in op['values'].items():
+                    self.frame.at[row, col] = value
+                values = op['values']
+                if 'valor_original' in values:
+                    self.values[row] = _amount(values['valor_original'])
+                    resort = True
+                if 'desconto_percentual' in values:
+                    self.discounts[row] = pd.to_numeric(values['desconto_percentual'], errors='coerce')
+                if 'economia' in values:
+                    self.savings[row] = _amount(values['economia'])
+        if resort:
+            self.by_value = np.argsort(self.values, kind='stable')
+            self.sorted_values = self.values[self.by_value]
+
+    def _build(self, frame):
+        self.frame = frame
+        self.ids = pd.Index(frame['id'])
+        dates = pd.to_datetime(frame['data_calculo'], format=DATE_FORMAT, errors='coerce')
+        self.dates = dates.to_numpy(dtype='datetime64[ns]')
+        self.values = parse_brl(frame['valor_original']).to_numpy(copy=True)
+        self.discounts = pd.to_numeric(frame['desconto_percentual'], errors='coerce').to_numpy(dtype='float64')
+        self.savings = parse_brl(frame['economia']).to_numpy(copy=True)
+
+        # NaT and NaN sort last, so unparseable rows fall outside every range
+        self.by_date = np.argsort(self.dates, kind='stable')
+        self.sorted_dates = self.dates[self.by_date]
+        self.date_rank = np.empty(len(frame), dtype=np.int64)
+        self.date_rank[self.by_date] = np.arange(len(frame))
+        self.by_value = np.argsort(self.values, kind='stable')
+        self.sorted_values = self.values[self.by_value]
+        self.deleted = np.zeros(len(frame), dtype=bool)
+        self.n_deleted = 0
+
+    def _matches(self, day, min_value):
+        """Row positions matching the filters, oldest first"""
+        if day is not None:
+            start = np.datetime64(pd.Timestamp(day), 'ns')
+            end = np.datetime64(pd.Timestamp(day + timedelta(days=1)), 'ns')
+            lo, hi = np.searchsorted(self.sorted_dates, [start, end], side='left')
+            rows = self.by_date[lo:hi]
+            if min_value:
+                rows = rows[self.values[rows] >= min_value]
+            return rows
+
+        if min_value:
+            lo = np.searchsorted(self.sorted_values, min_value, side='left')
+            hi = np.searchsorted(self.sorted_values, np.inf, side='right')
+            rows = self.by_value[lo:hi]
+            return rows[np.argsort(self.date_rank[rows], kind='stable')]
+
+        return self.by_date
+
+    def query(self, day=None, min_value=None, page=1, page_size=20, newest_first=True):
+        """One page of history rows, indexed by row id, plus totals for the filter"""
+        with self._lock:
+            rows = self._matches(day, min_value)
+            if self.n_deleted:
+                rows = rows[~self.deleted[rows]]
+            if newest_first:
+                rows = rows[::-1]
+
+            total = len(rows)
+            pages = max(1, -(-total // page_size))
+            page = min(max(1, page), pages)
+            visible = rows[(page - 1) * page_size:page * page_size]
+
+            stats = None
+            if total:
+                discounts = self.discounts[rows]
+                savings = self.savings[rows]
+                best = rows[np.nanargmax(savings)] if not np.isnan(savings).all() else None
+                stats = {
+                    'mean_discount': float(np.nanmean(discounts)) if not np.isnan(discounts).all() else 0.0,
+                    'max_saving': self.frame['economia'].iat[best] if best is not None else '-'
+                }
+            return HistoryPage(self.frame.iloc[visible].set_index('id'), total, page, pages, stats)
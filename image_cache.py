@@ -0,0 +1,229 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import urllib.request
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow the preview shows the full image, scaled by the browser
+    Image = None
+
+DEFAULT_CACHE_DIR = Path("data/.cache/images")
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+THUMBNAIL_SIZE = (480, 270)
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+# Same gradient as the app background (#2C3E50 -> #3498DB)
+FALLBACK_COLORS = ((0x2C, 0x3E, 0x50), (0x34, 0x98, 0xDB))
+
+
+def gradient_png(width, height, top=FALLBACK_COLORS[0], bottom=FALLBACK_COLORS[1]):
+    """Vertical gradient as PNG bytes, built with zlib alone so the offline fallback needs no files or Pillow"""
+    rows = []
+    for y in range(height):
+        t = y / max(height - 1, 1)
+        pixel = bytes(round(a + (b - a) * t) for a, b in zip(top, bottom))
+        rows.append(b'\x00' + pixel * width)
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(b''.join(rows), 9)) + chunk(b'IEND', b''))
+
+
+class ImageCache:
+    """Content-addressed wallpaper cache for the calculator sidebar.
+
+    Images are stored on disk under their SHA-256 (<sha>.img, plus a
+    downscaled <sha>.thumb.jpg for the preview) and an index maps each
+    source URL to the content it last returned. Only fetch() touches the
+    network; thumbnail() serves from memory, then disk, then the generated
+    fallback, so Streamlit reruns never wait on a download. When the files
+    exceed `max_bytes` the least recently shown images are evicted.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, memory_items=8,
+                 thumbnail_size=THUMBNAIL_SIZE, timeout=10.0, clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.thumbnail_size = thumbnail_size
+        self.timeout = timeout
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._fallback = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.evicted = 0
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self._urls = index["urls"]
+            self._blobs = index["blobs"]
+        except (OSError, ValueError, KeyError):
+            self._urls, self._blobs = {}, {}
+        # Drop entries whose files were removed behind our back
+        for sha in [s for s in self._blobs if not self._blob_path(s).exists()]:
+            del self._blobs[sha]
+        self._urls = {url: sha for url, sha in self._urls.items() if sha in self._blobs}
+
+    def _save_index(self):
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"urls": self._urls, "blobs": self._blobs}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _blob_path(self, sha):
+        return self.cache_dir / f"{sha}.img"
+
+    def _thumb_path(self, sha):
+        return self.cache_dir / f"{sha}.thumb.jpg"
+
+    def _download(self, url):
+        request = urllib.request.Request(url, headers={"User-Agent": "calculadora-descontos/1.0"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if not content_type.startswith("image/"):
+                raise ValueError(f"Resposta não é uma imagem: {content_type or 'sem Content-Type'}")
+            data = response.read(MAX_DOWNLOAD_BYTES + 1)
+        if len(data) > MAX_DOWNLOAD_BYTES:
+            raise ValueError("Imagem maior que o limite do cache")
+        return data
+
+    def _make_thumbnail(self, data):
+        if Image is None:
+            return data
+        with Image.open(io.BytesIO(data)) as img:
+            img = img.convert('RGB')
+            img.thumbnail(self.thumbnail_size)
+            out = io.BytesIO()
+            img.save(out, format='JPEG', quality=85, optimize=True)
+            return out.getvalue()
+
+    def _remember(self, sha, thumb):
+        self._memory[sha] = thumb
+        self._memory.move_to_end(sha)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _drop(self, sha):
+        for path in (self._blob_path(sha), self._thumb_path(sha)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._blobs.pop(sha, None)
+        self._memory.pop(sha, None)
+        self._urls = {url: s for url, s in self._urls.items() if s != sha}
+
+    def _evict(self, keep):
+        total = sum(blob["size"] for blob in self._blobs.values())
+        for sha in sorted(self._blobs, key=lambda s: self._blobs[s]["used"]):
+            if total <= self.max_bytes:
+                break
+            if sha == keep:
+                continue
+            total -= self._blobs[sha]["size"]
+            self._drop(sha)
+            self.evicted += 1
+
+    def fetch(self, url):
+        """Download `url` into the cache; True on success, False (logged) when offline or invalid"""
+        try:
+            data = self._download(url)
+            thumb = self._make_thumbnail(data)
+        except Exception as e:
+            self.logger.warning(f"Falha ao baixar imagem {url}: {e}")
+            return False
+
+        sha = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if sha not in self._blobs:
+                # Write thumbnail first: a blob on disk always has its thumbnail
+                for path, content in ((self._thumb_path(sha), thumb), (self._blob_path(sha), data)):
+                    tmp_path = path.with_name(path.name + '.tmp')
+                    tmp_path.write_bytes(content)
+                    os.replace(tmp_path, path)
+                self._blobs[sha] = {"size": len(data) + len(thumb), "used": self.clock()}
+            previous = self._urls.get(url)
+            self._urls[url] = sha
+            # Random-image URLs return new content each time; drop what nothing points to anymore
+            if previous and previous != sha and previous not in self._urls.values():
+                self._drop(previous)
+            self._blobs[sha]["used"] = self.clock()
+            self._remember(sha, thumb)
+            self._evict(keep=sha)
+            self._save_index()
+            self.downloads += 1
+        return True
+
+    def fallback(self):
+        """Offline wallpaper preview, generated once per process"""
+        if self._fallback is None:
+            self._fallback = gradient_png(*self.thumbnail_size)
+        return self._fallback
+
+    def thumbnail(self, url):
+        """Preview bytes for `url` without touching the network (the fallback when not cached)"""
+        with self._lock:
+            sha = self._urls.get(url) if url else None
+            if sha is None:
+                self.misses += 1
+                return self.fallback()
+            # Access time is kept in memory; the index is rewritten on the next fetch
+            self._blobs[sha]["used"] = self.clock()
+            thumb = self._memory.get(sha)
+            if thumb is not None:
+                self._memory.move_to_end(sha)
+                self.hits += 1
+                return thumb
+            try:
+                thumb = self._thumb_path(sha).read_bytes()
+            except OSError:
+                self._drop(sha)
+                self.misses += 1
+                return self.fallback()
+            self._remember(sha, thumb)
+            self.disk_hits += 1
+            return thumb
+
+    def image(self, url):
+        """Full-size cached bytes for `url`, or None when not cached"""
+        with self._lock:
+            sha = self._urls.get(url) if url else None
+        if sha is None:
+            return None
+        try:
+            return self._blob_path(sha).read_bytes()
+        except OSError:
+            return None
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "images": len(self._blobs),
+                "bytes": sum(blob["size"] for blob in self._blobs.values()),
+                "memory_hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "downloads": self.downloads,
+                "evicted": self.evicted
+            }
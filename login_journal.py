@@ -0,0 +1,163 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_JOURNAL_PATH = Path("data/logins.jsonl")
+# Entries appended since the last compaction before the journal is folded again
+COMPACT_EVERY = 1000
+
+
+class LoginJournal:
+    """Append-only log of login metadata (last_login and login count).
+
+    A login appends one small JSON line instead of rewriting the user
+    directory. The journal is replayed on startup and compacted every
+    `compact_every` entries (and at exit): last_login values are written
+    to the user store in one transaction and the file is replaced by a
+    one-line-per-user summary via a temp file and os.replace.
+
+    Several processes may share one journal. Appends take a shared lock
+    and compaction an exclusive one on a sidecar ".lock" file, and the
+    summary is folded from the file itself, so lines appended by other
+    processes are kept rather than overwritten by this process's view.
+
+    Event lines are {"t": iso time, "u": username, "e": "ok", "id": user id};
+    summary lines have "e": "state". Failed attempts are tracked by
+    rate_limiter.LoginRateLimiter; "fail"/"reset" lines written by earlier
+    versions are ignored.
+    """
+
+    def __init__(self, store, path=DEFAULT_JOURNAL_PATH, compact_every=COMPACT_EVERY):
+        self.store = store
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.Lock()
+        self._state = {}
+        self._appended = 0
+        self._replay()
+        atexit.register(self.compact)
+
+    @contextmanager
+    def _file_lock(self, exclusive):
+        """Cross-process lock on the sidecar file; shared for appends, exclusive for compaction"""
+        with open(self.lock_path, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    @staticmethod
+    def _apply(state_by_user, entry):
+        state = state_by_user.setdefault(entry["u"], {
+            "id": None, "last_login": None, "login_count": 0
+        })
+        event = entry["e"]
+        if event == "ok":
+            state["id"] = entry.get("id", state["id"])
+            state["last_login"] = entry["t"]
+            state["login_count"] += 1
+        elif event == "state":
+            state.update({k: entry[k] for k in ("id", "last_login", "login_count") if k in entry})
+
+    def _fold(self):
+        """(per-user state, number of event lines) read from the journal file"""
+        state_by_user = {}
+        events = 0
+        if not self.path.exists():
+            return state_by_user, events
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._apply(state_by_user, entry)
+                except (json.JSONDecodeError, KeyError):
+                    # A torn last line from a crash mid-append; everything before it is intact
+                    logging.warning(f"Linha inválida ignorada em {self.path}")
+                    continue
+                if entry["e"] == "ok":
+                    events += 1
+        return state_by_user, events
+
+    def _replay(self):
+        with self._file_lock(exclusive=False):
+            self._state, self._appended = self._fold()
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with self._file_lock(exclusive=False):
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            self._apply(self._state, entry)
+            self._appended += 1
+            due = self._appended >= self.compact_every
+        if due:
+            self.compact()
+
+    def record_success(self, user):
+        """Append a successful login; returns its timestamp"""
+        now = datetime.now().isoformat()
+        self._append({"t": now, "u": user["username"].lower(), "e": "ok", "id": user["id"]})
+        return now
+
+    def login_info(self, username):
+        """{'last_login', 'login_count'} recorded for a user, or None"""
+        with self._lock:
+            state = self._state.get(username.lower())
+            if not state or not state["login_count"]:
+                return None
+            return {"last_login": state["last_login"], "login_count": state["login_count"]}
+
+    def compact(self):
+        """Fold the journal into the user store and a per-user summary file"""
+        with self._lock:
+            if not self._appended:
+                return
+            tmp_path = None
+            try:
+                with self._file_lock(exclusive=True):
+                    # Other processes' appends are only in the file, so fold from there
+                    self._state, _ = self._fold()
+                    last_logins = {
+                        s["id"]: s["last_login"] for s in self._state.values()
+                        if s["id"] is not None and s["last_login"]
+                    }
+                    self.store.update_last_logins(last_logins)
+
+                    fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".logins-", suffix=".tmp")
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        for username, state in self._state.items():
+                            f.write(json.dumps({"e": "state", "u": username, **state}, ensure_ascii=False) + "\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.path)
+            except Exception as e:
+                # The journal is still complete; compaction is retried on the next threshold
+                logging.error(f"Erro ao compactar {self.path}: {str(e)}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._appended = 0
@@ -0,0 +1,148 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # the join/translate path needs only the standard library
+    pa = None
+
+# After stripping 'R$', whitespace and thousands dots, with ',' turned into '.'
+PLAIN_NUMBER = r'^-?\d+(\.\d+)?$'
+# parse_number factorizes unless this many leading values are mostly distinct
+FACTORIZE_SAMPLE = 16384
+# First amount-like token of free text, e.g. 'R$ 1.234,56 (parcelado)'
+AMOUNT_TOKEN = r'(-?\d[\d.]*(?:,\d+)?)'
+
+_CLEAN = str.maketrans({',': '.', '.': None, ' ': None, '\xa0': None, '\t': None})
+_CLEAN_PERCENT = str.maketrans({',': '.', '.': None, ' ': None, '\xa0': None, '\t': None, '%': None})
+_TO_BRL = str.maketrans({',': '.', '.': ','})
+_PLAIN_RE = re.compile(PLAIN_NUMBER)
+
+
+def parse_brl_value(text):
+    """One 'R$ 1.234,56' / '1.234,56' amount as float; raises ValueError when invalid"""
+    if isinstance(text, (int, float, np.number)) and not isinstance(text, bool):
+        return float(text)
+    cleaned = str(text).replace('R$', '').translate(_CLEAN)
+    if not _PLAIN_RE.match(cleaned):
+        raise ValueError(f"Valor inválido: {text!r}")
+    return float(cleaned)
+
+
+def _parse_arrow(array, percent=False):
+    text = pc.replace_substring(array, 'R$', '')
+    # RE2's \s is ASCII-only; spreadsheets often export a no-break space after 'R$'
+    text = pc.replace_substring_regex(text, r'[\s\x{a0}%]' if percent else r'[\s\x{a0}]', '')
+    text = pc.replace_substring(text, '.', '')
+    text = pc.replace_substring(text, ',', '.')
+    text = pc.if_else(pc.match_substring_regex(text, PLAIN_NUMBER), text, None)
+    return pc.cast(text, pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _parse_joined(texts, percent=False):
+    table = _CLEAN_PERCENT if percent else _CLEAN
+    # One str.replace and one str.translate over the whole column instead of per value
+    cleaned = '\n'.join(texts).replace('R$', '').translate(table).split('\n')
+    if len(cleaned) != len(texts):
+        # A value contained a newline; fall back to parsing one by one
+        cleaned = [t.replace('R$', '').translate(table) for t in texts]
+    numbers = pd.to_numeric(pd.Series(cleaned, dtype=object), errors='coerce').to_numpy(dtype='float64')
+    valid = np.fromiter((bool(_PLAIN_RE.match(t)) for t in cleaned), dtype=bool, count=len(cleaned))
+    numbers[~valid] = np.nan
+    return numbers
+
+
+def _parse_text(series, percent=False):
+    if pa is not None:
+        try:
+            if isinstance(series.dtype, pd.ArrowDtype) or str(series.dtype) == 'string[pyarrow]':
+                array = pa.array(series)
+            else:
+                array = pa.array(series.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+            return _parse_arrow(array, percent)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    texts = series.astype(object).where(series.notna(), '').astype(str).tolist()
+    numbers = _parse_joined(texts, percent)
+    numbers[series.isna().to_numpy()] = np.nan
+    return numbers
+
+
+def _parse(series, lenient=False, percent=False):
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind in ('string', 'empty'):
+        numbers = _parse_text(series, percent)
+    else:
+        # Mixed cells (e.g. from Excel): numbers pass through, text is parsed
+        is_text = series.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        numbers = pd.to_numeric(series.where(~is_text), errors='coerce').to_numpy(dtype='float64')
+        if is_text.any():
+            numbers[is_text] = _parse_text(series[is_text], percent)
+
+    if lenient:
+        retry = np.isnan(numbers) & series.notna().to_numpy()
+        if retry.any():
+            tokens = series[retry].astype(str).str.extract(AMOUNT_TOKEN, expand=False)
+            numbers[retry] = _parse_text(tokens, percent)
+    return numbers
+
+
+def parse_brl(values, lenient=False):
+    """Vectorized parse of BRL amounts to a float64 Series (NaN when unparseable).
+
+    Accepts 'R$ 1.234,56', '1.234,56', '-R$ 5,00' and plain numbers; '.'
+    is always a thousands separator. Text goes through one pass of Arrow
+    compute kernels (or one join/translate when pyarrow is missing).
+    With lenient=True, values that don't parse are retried with the first
+    amount-like token in them, as the old str.extract chains did.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('float64')
+    return pd.Series(_parse(series, lenient), index=series.index, name=series.name, dtype='float64')
+
+
+def parse_number(values):
+    """Money ('R$ 1.234,56'), percentage ('12,5%') or decimal-comma ('12,5') text as float64.
+
+    Contract sheets repeat the same few PRAZO/DESCONTO values over
+    thousands of rows, so the column is factorized in one hashing pass and
+    only its distinct values are parsed; the result is a single take() by
+    code. Columns whose first values are mostly distinct are parsed
+    directly. Numeric columns are returned as float64 without being touched.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('float64')
+    sample = series.iloc[:FACTORIZE_SAMPLE]
+    if sample.nunique() > len(sample) // 2:
+        # Mostly distinct (e.g. VALOR DO CLIENTE): hashing first would only add a pass
+        return pd.Series(_parse(series, percent=True), index=series.index, name=series.name, dtype='float64')
+    codes, uniques = pd.factorize(series)
+    parsed = _parse(pd.Series(np.asarray(uniques, dtype=object)), percent=True)
+    # Missing cells have code -1, which picks the trailing NaN
+    numbers = np.append(parsed, np.nan).take(codes)
+    return pd.Series(numbers, index=series.index, name=series.name, dtype='float64')
+
+
+def format_currency(value, symbol=True, na_rep=''):
+    """'R$ 1.234,56' for a number, or a Series of them for a Series/array.
+
+    The vectorized form formats with Python's ',' grouping and swaps the
+    separators for the whole column in a single str.translate.
+    """
+    prefix = 'R$ ' if symbol else ''
+    if np.ndim(value) == 0:
+        return f"{prefix}{value:,.2f}".translate(_TO_BRL)
+
+    series = value if isinstance(value, pd.Series) else pd.Series(value)
+    numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64')
+    valid = ~np.isnan(numbers)
+    out = np.full(len(numbers), na_rep, dtype=object)
+    if valid.any():
+        texts = '\n'.join([f"{prefix}{x:,.2f}" for x in numbers[valid]]).translate(_TO_BRL)
+        out[valid] = texts.split('\n')
+    return pd.Series(out, index=series.index, name=series.name)
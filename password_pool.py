@@ -0,0 +1,105 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PoolBusyError(RuntimeError):
+    """Raised when too many password operations are already queued"""
+
+
+class PasswordWorkerPool:
+    """Bounded pool for the slow pbkdf2 password checks and hashes.
+
+    At most `max_workers` hashes run at once (hashlib releases the GIL, so
+    they use other cores without starving the request threads), and at most
+    `max_pending` may be waiting. Beyond that, submit() fails fast with
+    PoolBusyError instead of letting a login burst pile up. With
+    max_workers=0 operations run inline in the caller, as before.
+    """
+
+    def __init__(self, max_workers=2, max_pending=32, timeout=30.0):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="password") if max_workers else None
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _release(self, _future=None):
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def run(self, fn, *args, **kwargs):
+        """Run fn on the pool and wait for its result, or raise PoolBusyError"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            logging.warning("Fila de verificação de senha cheia, recusando requisição")
+            raise PoolBusyError("Servidor ocupado, tente novamente em instantes")
+
+        with self._lock:
+            self.in_flight += 1
+
+        if self._executor is None:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._release()
+
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release)
+        return future.result(timeout=self.timeout)
+
+    def check_password(self, pwhash, password):
+        return self.run(check_password_hash, pwhash, password)
+
+    def hash_password(self, password, **kwargs):
+        return self.run(generate_password_hash, password, **kwargs)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+
+_pool = None
+_pool_lock = threading.RLock()
+
+
+def configure(max_workers=None, max_pending=None):
+    """(Re)create the process-wide pool; defaults come from PASSWORD_WORKERS / PASSWORD_MAX_PENDING"""
+    global _pool
+    if max_workers is None:
+        max_workers = int(os.environ.get('PASSWORD_WORKERS', 2))
+    if max_pending is None:
+        max_pending = int(os.environ.get('PASSWORD_MAX_PENDING', 32))
+    with _pool_lock:
+        old, _pool = _pool, PasswordWorkerPool(max_workers, max_pending)
+    if old:
+        old.shutdown()
+    return _pool
+
+
+def get_pool():
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                return configure()
+    return _pool
@@ -0,0 +1,160 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path("data/login_attempts.db")
+MAX_ATTEMPTS = 3
+WINDOW_SECONDS = 300
+LOCKOUT_SECONDS = 300
+# Expired keys are swept every this many records
+SWEEP_EVERY = 256
+
+
+class MemoryAttemptStore:
+    """Per-process attempt store: an LRU of at most `max_keys` usernames"""
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return list(self._entries.get(key, ()))
+
+    def update(self, key, fn):
+        with self._lock:
+            stamps = fn(list(self._entries.get(key, ())))
+            self._entries[key] = stamps
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+            return stamps
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def evict(self, cutoff):
+        with self._lock:
+            expired = [k for k, stamps in self._entries.items() if not stamps or stamps[-1] < cutoff]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+
+class SQLiteAttemptStore:
+    """Attempt store shared by every process using the same database file.
+
+    One row per username holding its last few timestamps, so a check is a
+    primary-key lookup and a record is a single upsert.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS attempts (key TEXT PRIMARY KEY, stamps TEXT NOT NULL, last REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS attempts_last ON attempts (last)")
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connection().execute("SELECT stamps FROM attempts WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def update(self, key, fn):
+        # IMMEDIATE takes the write lock up front so two workers can't both read the old stamps
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT stamps FROM attempts WHERE key = ?", (key,)).fetchone()
+            stamps = fn(json.loads(row[0]) if row else [])
+            conn.execute(
+                "INSERT INTO attempts (key, stamps, last) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET stamps = excluded.stamps, last = excluded.last",
+                (key, json.dumps(stamps), stamps[-1] if stamps else 0.0)
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return stamps
+
+    def delete(self, key):
+        self._connection().execute("DELETE FROM attempts WHERE key = ?", (key,))
+
+    def evict(self, cutoff):
+        return self._connection().execute("DELETE FROM attempts WHERE last < ?", (cutoff,)).rowcount
+
+
+class LoginRateLimiter:
+    """Sliding-window limiter for failed logins, keyed by username.
+
+    Only the last `max_attempts` failure timestamps are kept per key, so
+    check and record are constant time. A key is locked when it has
+    `max_attempts` failures inside `window` seconds and the latest one is
+    less than `lockout` seconds old. Keys idle for longer than both are
+    swept every SWEEP_EVERY records.
+    """
+
+    def __init__(self, store=None, max_attempts=MAX_ATTEMPTS, window=WINDOW_SECONDS,
+                 lockout=LOCKOUT_SECONDS, clock=time.time):
+        self.store = store if store is not None else SQLiteAttemptStore()
+        self.max_attempts = max_attempts
+        self.window = window
+        self.lockout = lockout
+        self.ttl = max(window, lockout)
+        self.clock = clock
+        self._records = 0
+
+    def _recent(self, stamps, now):
+        return [t for t in stamps if now - t < self.window]
+
+    def retry_after(self, key):
+        """Seconds until `key` may try again; 0 when it isn't locked"""
+        now = self.clock()
+        stamps = self._recent(self.store.get(key), now)
+        if len(stamps) >= self.max_attempts and now - stamps[-1] < self.lockout:
+            return self.lockout - (now - stamps[-1])
+        return 0
+
+    def remaining(self, key):
+        """Failed attempts left before `key` is locked"""
+        if self.retry_after(key):
+            return 0
+        now = self.clock()
+        return max(0, self.max_attempts - len(self._recent(self.store.get(key), now)))
+
+    def record_failure(self, key):
+        now = self.clock()
+
+        def add(old):
+            recent = self._recent(old, now)
+            if len(recent) >= self.max_attempts and now - recent[-1] >= self.lockout:
+                # A served lockout starts a fresh series of attempts
+                recent = []
+            return (recent + [now])[-self.max_attempts:]
+
+        stamps = self.store.update(key, add)
+        self._records += 1
+        if self._records % SWEEP_EVERY == 0:
+            self.store.evict(now - self.ttl)
+        return len(stamps)
+
+    def reset(self, key):
+        self.store.delete(key)
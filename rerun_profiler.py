@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+
+class RerunProfile:
+    """Wall-clock time of each phase of one Streamlit script run, in milliseconds"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = self._last = clock()
+        self.phases = OrderedDict()
+
+    def _add(self, name, start, end):
+        self.phases[name] = self.phases.get(name, 0.0) + (end - start) * 1000
+        self._last = end
+
+    def lap(self, name):
+        """Attribute the time since the previous lap or phase to `name` (for top-level script sections)"""
+        self._add(name, self._last, self.clock())
+
+    @contextmanager
+    def phase(self, name):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            # A phase entered twice (e.g. from two tabs) accumulates
+            self._add(name, start, self.clock())
+
+    def total(self):
+        return (self.clock() - self.started) * 1000
+
+    def as_dict(self):
+        timings = dict(self.phases)
+        timings["total"] = self.total()
+        return timings
+
+
+class RerunStats:
+    """Per-phase timings of the last `window` reruns, shared by every session of the process"""
+
+    def __init__(self, window=200):
+        self.window = window
+        self._timings = {}
+        self._lock = threading.Lock()
+        self.runs = 0
+
+    def record(self, profile):
+        timings = profile.as_dict()
+        with self._lock:
+            self.runs += 1
+            for name, ms in timings.items():
+                self._timings.setdefault(name, deque(maxlen=self.window)).append(ms)
+        return timings
+
+    def summary(self):
+        """One row per phase: runs, last, mean and p95 in ms (slowest phases first, total last)"""
+        with self._lock:
+            snapshot = {name: sorted(values) for name, values in self._timings.items()}
+            last = {name: values[-1] for name, values in self._timings.items()}
+        rows = []
+        for name, values in snapshot.items():
+            rows.append({
+                "fase": name,
+                "execuções": len(values),
+                "último (ms)": round(last[name], 2),
+                "média (ms)": round(sum(values) / len(values), 2),
+                "p95 (ms)": round(values[min(len(values) - 1, int(len(values) * 0.95))], 2)
+            })
+        rows.sort(key=lambda row: (row["fase"] == "total", -row["média (ms)"]))
+        return rows
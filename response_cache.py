@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:  # gzip-only when brotli isn't installed
+    brotli = None
+
+# Bodies smaller than this go out uncompressed; the headers would eat the savings
+MIN_COMPRESS_SIZE = 1024
+
+
+def make_etag(*parts):
+    """Strong ETag value (unquoted) for a fingerprint plus any request variant"""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def representation_etag(etag, content_encoding):
+    """ETag of one content coding of a body; gzip and br bodies must not share the identity body's validator"""
+    return f"{etag}-{content_encoding}" if content_encoding else etag
+
+
+def matching_etag(if_none_match, etag):
+    """The If-None-Match tag that names any content coding of `etag`, or None"""
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        if tag == etag or tag.startswith(etag + '-'):
+            return tag
+    return None
+
+
+def supported_encodings():
+    """Content codings we can produce, in order of preference"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+class CachedBody:
+    """A serialized response body plus its lazily built compressed variants"""
+
+    def __init__(self, etag, payload):
+        self.etag = etag
+        self.body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding):
+        """Return (bytes, content_encoding or None) for the negotiated coding"""
+        if encoding is None or len(self.body) < MIN_COMPRESS_SIZE:
+            return self.body, None
+
+        with self._lock:
+            if encoding not in self._variants:
+                if encoding == 'br':
+                    self._variants[encoding] = brotli.compress(self.body, quality=5)
+                else:
+                    self._variants[encoding] = gzip.compress(self.body, compresslevel=6)
+            return self._variants[encoding], encoding
+
+
+class ResponseCache:
+    """Small LRU of serialized responses keyed by (dataset fingerprint, variant)"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
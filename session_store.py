@@ -0,0 +1,248 @@
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    from flask.sessions import SessionInterface, SessionMixin
+    from werkzeug.datastructures import CallbackDict
+except ImportError:  # Streamlit-only installs use the backends without the Flask interface
+    SessionInterface = None
+
+DEFAULT_DB_PATH = Path("data/sessions.db")
+DEFAULT_TTL = 900  # 15 minutes of inactivity
+# Expired rows are swept from SQLite every this many writes
+SWEEP_EVERY = 256
+
+
+class MemorySessionBackend:
+    """In-process sessions: an LRU of at most `max_entries`, expiring after `ttl` idle seconds.
+
+    Every access moves the session to the end of the OrderedDict and pushes
+    its expiry forward, so the dict stays ordered by expiry and expired
+    sessions are always at the front: get, save and the sweep are O(1)
+    amortized.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=10000, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _sweep(self, now):
+        while self._entries:
+            sid, (_, expires) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            del self._entries[sid]
+            self.expired += 1
+
+    def get(self, sid):
+        """Session data (touching it), or None if unknown or expired"""
+        now = self.clock()
+        with self._lock:
+            self._sweep(now)
+            entry = self._entries.get(sid)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[sid] = (entry[0], now + self.ttl)
+            self._entries.move_to_end(sid)
+            self.hits += 1
+            return entry[0]
+
+    def save(self, sid, data):
+        now = self.clock()
+        with self._lock:
+            self._sweep(now)
+            self._entries[sid] = (data, now + self.ttl)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def metrics(self):
+        with self._lock:
+            self._sweep(self.clock())
+            return {
+                "backend": "memory",
+                "sessions": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evicted": self.evicted
+            }
+
+
+class SQLiteSessionBackend:
+    """Sessions shared by every worker using the same database file.
+
+    Lookups go through the primary key; touching a session is a one-row
+    update of its expiry, and expired rows are swept through the expiry
+    index every SWEEP_EVERY writes. Data must be JSON-serializable.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, ttl=DEFAULT_TTL, clock=time.time):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)")
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count_write(self, now):
+        with self._lock:
+            self._writes += 1
+            due = self._writes % SWEEP_EVERY == 0
+        if due:
+            removed = self._connection().execute("DELETE FROM sessions WHERE expires <= ?", (now,)).rowcount
+            with self._lock:
+                self.expired += removed
+
+    def get(self, sid):
+        now = self.clock()
+        conn = self._connection()
+        row = conn.execute("SELECT data, expires FROM sessions WHERE sid = ?", (sid,)).fetchone()
+        if row is None or row[1] <= now:
+            with self._lock:
+                self.misses += 1
+            return None
+        conn.execute("UPDATE sessions SET expires = ? WHERE sid = ?", (now + self.ttl, sid))
+        with self._lock:
+            self.hits += 1
+        return json.loads(row[0])
+
+    def save(self, sid, data):
+        now = self.clock()
+        self._connection().execute(
+            "INSERT INTO sessions (sid, data, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT(sid) DO UPDATE SET data = excluded.data, expires = excluded.expires",
+            (sid, json.dumps(data, ensure_ascii=False, default=str), now + self.ttl)
+        )
+        self._count_write(now)
+
+    def delete(self, sid):
+        self._connection().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def metrics(self):
+        now = self.clock()
+        sessions = self._connection().execute(
+            "SELECT COUNT(*) FROM sessions WHERE expires > ?", (now,)
+        ).fetchone()[0]
+        with self._lock:
+            return {
+                "backend": "sqlite",
+                "sessions": sessions,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evicted": 0
+            }
+
+
+def make_backend(kind, ttl=DEFAULT_TTL, **kwargs):
+    """'memory' for a single process, 'sqlite' for several workers on one host"""
+    if kind == 'memory':
+        return MemorySessionBackend(ttl=ttl, **kwargs)
+    if kind == 'sqlite':
+        return SQLiteSessionBackend(ttl=ttl, **kwargs)
+    raise ValueError(f"Tipo de sessão desconhecido: {kind}")
+
+
+def new_session_id():
+    return secrets.token_urlsafe(32)
+
+
+if SessionInterface is not None:
+
+    class ServerSideSession(CallbackDict, SessionMixin):
+        def __init__(self, initial=None, sid=None, new=False):
+            def on_update(session):
+                session.modified = True
+
+            super().__init__(initial, on_update)
+            self.sid = sid
+            self.new = new
+            self.modified = False
+
+    class ServerSideSessionInterface(SessionInterface):
+        """Flask session interface keeping only a random session id in the cookie"""
+
+        def __init__(self, backend):
+            self.backend = backend
+
+        def open_session(self, app, request):
+            sid = request.cookies.get(self.get_cookie_name(app))
+            if sid:
+                data = self.backend.get(sid)
+                if data is not None:
+                    return ServerSideSession(data, sid=sid)
+            return ServerSideSession(sid=new_session_id(), new=True)
+
+        def regenerate(self, session):
+            """Move `session` to a fresh id and drop the old id's row.
+
+            Called on login and logout so an id planted before
+            authentication (session fixation) never becomes a logged-in one.
+            """
+            if not session.new:
+                self.backend.delete(session.sid)
+            session.sid = new_session_id()
+            # A new session is always saved and gets the new cookie
+            session.new = True
+            session.modified = True
+
+        def save_session(self, app, session, response):
+            domain = self.get_cookie_domain(app)
+            path = self.get_cookie_path(app)
+            name = self.get_cookie_name(app)
+            if not session:
+                if session.modified:
+                    self.backend.delete(session.sid)
+                    response.delete_cookie(name, domain=domain, path=path)
+                return
+
+            # The backend touched the session on open; only changed data is written back
+            if session.modified or session.new:
+                self.backend.save(session.sid, dict(session))
+            if session.new or self.should_set_cookie(app, session):
+                response.set_cookie(
+                    name,
+                    session.sid,
+                    httponly=self.get_cookie_httponly(app),
+                    secure=self.get_cookie_secure(app),
+                    samesite=self.get_cookie_samesite(app),
+                    domain=domain,
+                    path=path
+                )
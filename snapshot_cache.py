@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+except ImportError:  # Snapshots are an optimization; without pyarrow we just parse the CSV
+    pa = None
+
+# Bump when the cleaning applied before snapshotting changes, so old sidecars are ignored
+SNAPSHOT_VERSION = 3
+# Schema metadata key holding the fingerprint of the CSV the snapshot was parsed from
+SNAPSHOT_METADATA_KEY = b"snapshot_fingerprint"
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_fingerprint(path, with_hash=True):
+    """Return the (size, mtime_ns, content hash) fingerprint of a file"""
+    path = Path(path)
+    stat = path.stat()
+    fingerprint = {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": None
+    }
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        fingerprint["sha256"] = digest.hexdigest()
+    return fingerprint
+
+
+class SnapshotCache:
+    """Typed Arrow IPC sidecar for a parsed CSV, keyed by the source file fingerprint.
+
+    The snapshot lives in a `.cache` directory next to the source file and
+    carries the fingerprint of the CSV it was parsed from in its own schema
+    metadata, so the data and the fingerprint it is checked against are
+    always the pair one writer produced, whatever other writers do. A lookup
+    first compares path, size and mtime; only when the mtime differs is the
+    content hash recomputed, so a touched-but-identical file keeps its
+    snapshot. The new mtime is recorded in a small manifest next to it,
+    bound to the content hash, so the file is hashed only once per touch.
+    """
+
+    def __init__(self, source_path, cache_dir=None):
+        self.source_path = Path(source_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.source_path.parent / ".cache"
+        self.snapshot_path = self.cache_dir / f"{self.source_path.name}.arrow"
+        self.manifest_path = self.cache_dir / f"{self.source_path.name}.snapshot.json"
+
+    @property
+    def enabled(self):
+        return pa is not None
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _replace(self, path, write):
+        """Write through a private temp file and move it into place, so concurrent
+        writers (refresher thread, filtered requests) never share a temp path"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            os.close(fd)
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _write_manifest(self, manifest):
+        def write(tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=4)
+        self._replace(self.manifest_path, write)
+
+    def matches(self, fingerprint):
+        """Check whether a snapshot fingerprint describes the current source file"""
+        if not fingerprint or fingerprint.get("version") != SNAPSHOT_VERSION:
+            return False
+
+        current = file_fingerprint(self.source_path, with_hash=False)
+        if fingerprint["path"] != current["path"] or fingerprint["size"] != current["size"]:
+            return False
+        if fingerprint["mtime_ns"] == current["mtime_ns"]:
+            return True
+
+        # Touched since the parse: the manifest vouches for a content hash at a later mtime
+        touched = self._read_manifest()
+        if touched and touched.get("sha256") == fingerprint["sha256"] and \
+                (touched.get("size"), touched.get("mtime_ns")) == (current["size"], current["mtime_ns"]):
+            return True
+
+        # Same size, different mtime: only the content hash can tell
+        current = file_fingerprint(self.source_path)
+        if current["sha256"] != fingerprint["sha256"]:
+            return False
+        self._write_manifest({key: current[key] for key in ("sha256", "size", "mtime_ns")})
+        return True
+
+    def load(self):
+        """Return the snapshot as a DataFrame, or None if it is missing or stale"""
+        if not self.enabled or not self.snapshot_path.exists():
+            return None
+        try:
+            with pa.memory_map(str(self.snapshot_path), 'r') as source:
+                reader = pa.ipc.open_file(source)
+                metadata = reader.schema.metadata or {}
+                fingerprint = json.loads(metadata.get(SNAPSHOT_METADATA_KEY, b'null'))
+                if not self.matches(fingerprint):
+                    return None
+                table = reader.read_all()
+            return table.to_pandas()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Snapshot ilegível, descartando {self.snapshot_path}: {str(e)}")
+            self.invalidate()
+            return None
+
+    def store(self, df, fingerprint=None):
+        """Write df as the snapshot for the current source file"""
+        if not self.enabled:
+            return False
+        try:
+            fingerprint = fingerprint or file_fingerprint(self.source_path)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[SNAPSHOT_METADATA_KEY] = json.dumps({"version": SNAPSHOT_VERSION, **fingerprint})
+            table = table.replace_schema_metadata(metadata)
+
+            def write(tmp_path):
+                with pa.OSFile(tmp_path, 'wb') as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            self._replace(self.snapshot_path, write)
+            return True
+        except Exception as e:
+            # Mixed-type object columns can't be typed by Arrow; keep using the CSV
+            logging.warning(f"Não foi possível gravar snapshot de {self.source_path}: {str(e)}")
+            return False
+
+    def invalidate(self):
+        for path in (self.snapshot_path, self.manifest_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
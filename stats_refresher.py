@@ -0,0 +1,154 @@
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+
+class StatsRefresher:
+    """Stale-while-revalidate holder for the dashboard statistics.
+
+    A daemon thread recomputes the stats when the source file changes
+    (mtime/size poll every `poll_interval` seconds) or when `refresh_interval`
+    seconds have passed since the last run. Requests read the last good
+    result without waiting; a failed refresh keeps the previous stats.
+    """
+
+    def __init__(self, compute, source_path, poll_interval=2.0, refresh_interval=300.0,
+                 fallback=None, first_result_timeout=30.0, window=1000):
+        self.compute = compute
+        self.source_path = Path(source_path)
+        self.poll_interval = poll_interval
+        self.refresh_interval = refresh_interval
+        self.fallback = fallback
+        self.first_result_timeout = first_result_timeout
+
+        self._stats = None
+        self._generated_at = None
+        self._stats_signature = None
+        self._source_signature = None
+        self._changed_at = None
+        self._ready = threading.Event()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+        # Staleness of the stats handed out, in seconds
+        self._staleness = deque(maxlen=window)
+        self.served = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    def _signature(self):
+        try:
+            stat = self.source_path.stat()
+            return stat.st_size, stat.st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="stats-refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def request_refresh(self):
+        """Ask the background thread to recompute on its next wakeup"""
+        self._source_signature = None
+        self._wakeup.set()
+
+    def _refresh(self):
+        signature = self._signature()
+        started = time.perf_counter()
+        try:
+            stats = self.compute()
+        except Exception as e:
+            self.failures += 1
+            # Don't retry the same broken file on every poll; wait for a change or the interval
+            self._source_signature = signature
+            logging.error(f"Falha ao atualizar estatísticas: {str(e)}\n{traceback.format_exc()}")
+        else:
+            with self._lock:
+                self._stats = stats
+                self._generated_at = datetime.now()
+                self._source_signature = signature
+                self._stats_signature = signature
+                if self._signature() == signature:
+                    self._changed_at = None
+                self.refreshes += 1
+            logging.info(f"Estatísticas atualizadas em {time.perf_counter() - started:.3f}s")
+        finally:
+            # Never leave the first request waiting on a refresh that already ended
+            self._ready.set()
+
+    def _run(self):
+        last_run = None
+        while not self._stop.is_set():
+            signature = self._signature()
+            if signature != self._source_signature and self._changed_at is None:
+                self._changed_at = time.monotonic()
+
+            due = last_run is None or time.monotonic() - last_run >= self.refresh_interval
+            if signature != self._source_signature or due:
+                self._refresh()
+                last_run = time.monotonic()
+
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def get(self):
+        """Return (stats, generated_at) immediately, starting the refresher if needed"""
+        stats, generated_at, _ = self.get_versioned()
+        return stats, generated_at
+
+    def get_versioned(self):
+        """Like get(), plus the (size, mtime_ns) of the source the stats were computed from"""
+        self.start()
+        if not self._ready.is_set():
+            # Only the very first request waits, and only up to first_result_timeout
+            self._ready.wait(self.first_result_timeout)
+
+        with self._lock:
+            stats, generated_at, signature = self._stats, self._generated_at, self._stats_signature
+            staleness = time.monotonic() - self._changed_at if self._changed_at is not None else 0.0
+            self._staleness.append(staleness)
+            self.served += 1
+
+        if stats is None:
+            return self.fallback, None, None
+        return stats, generated_at, signature
+
+    def metrics(self):
+        """Counters and staleness percentiles of the stats served so far"""
+        with self._lock:
+            samples = sorted(self._staleness)
+            generated_at = self._generated_at
+
+        def percentile(p):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p / 100 * len(samples)))]
+
+        return {
+            "generated_at": generated_at.isoformat() if generated_at else None,
+            "served": self.served,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "staleness_seconds": {
+                "p50": percentile(50),
+                "p99": percentile(99),
+                "max": samples[-1] if samples else 0.0
+            }
+        }
@@ -0,0 +1,28 @@
+"""Shared fixtures
+
+dashboard.py builds its DashboardManager (user store, rate limiter, session
+backend, log file) in the working directory at import time, so it is
+imported once from a scratch directory with in-memory sessions.
+"""
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope='session')
+def dashboard_module(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp('dashboard')
+    cwd = os.getcwd()
+    os.environ['SESSION_TYPE'] = 'memory'
+    os.chdir(workdir)
+    try:
+        module = importlib.import_module('dashboard')
+    finally:
+        os.chdir(cwd)
+    module.WORKDIR = workdir
+    return module
@@ -0,0 +1,134 @@
+"""ContractAggregates merge and IncrementalContractStats append handling
+
+Usage: python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from aggregate_store import ContractAggregates, IncrementalContractStats
+from synthetic_data import make_contracts_frame
+
+
+@pytest.fixture
+def contracts(tmp_path, dashboard_module):
+    path = tmp_path / 'contratos.csv'
+    make_contracts_frame(400, seed=3).to_csv(path, index=False, encoding='utf-8')
+    return path, dashboard_module.DataLoader
+
+
+def full_stats(path, loader_class):
+    return ContractAggregates.from_frame(loader_class(path, use_snapshot=False).load_csv()).to_stats()
+
+
+def assert_stats_equal(actual, expected):
+    # Sums are merged in a different order than a single pass adds them
+    assert actual.keys() == expected.keys()
+    for key in ('financial', 'performance'):
+        assert actual[key] == pytest.approx(expected[key]), key
+    assert actual['negotiators'].keys() == expected['negotiators'].keys()
+    for name, partial in expected['negotiators'].items():
+        assert actual['negotiators'][name] == pytest.approx(partial), name
+    for key in expected.keys() - {'financial', 'performance', 'negotiators'}:
+        assert actual[key] == expected[key], key
+
+
+def count_rebuilds(engine, monkeypatch):
+    calls = []
+    rebuild = engine._rebuild
+
+    def counted():
+        calls.append(1)
+        rebuild()
+    monkeypatch.setattr(engine, '_rebuild', counted)
+    return calls
+
+
+def append_rows(path, n_rows, seed):
+    rows = make_contracts_frame(n_rows, seed=seed).to_csv(index=False, header=False)
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write(rows)
+
+
+def test_merge_of_disjoint_parts_equals_whole(contracts):
+    path, loader_class = contracts
+    df = loader_class(path, use_snapshot=False).load_csv()
+    merged = ContractAggregates()
+    for start in range(0, len(df), 97):
+        merged.merge(ContractAggregates.from_frame(df.iloc[start:start + 97]))
+    assert_stats_equal(merged.to_stats(), ContractAggregates.from_frame(df).to_stats())
+
+
+def test_merge_with_empty_keeps_min_max(contracts):
+    path, loader_class = contracts
+    agg = ContractAggregates.from_frame(loader_class(path, use_snapshot=False).load_csv())
+    low, high = agg.value_min, agg.value_max
+    ContractAggregates().merge(agg)
+    agg.merge(ContractAggregates())
+    assert (agg.value_min, agg.value_max) == (low, high)
+
+
+def test_append_parses_only_new_rows(contracts, monkeypatch):
+    path, loader_class = contracts
+    loader = loader_class(path, use_snapshot=False)
+    engine = IncrementalContractStats(loader)
+    engine.refresh()
+
+    append_rows(path, 50, seed=4)
+    rebuilds = count_rebuilds(engine, monkeypatch)
+    stats = engine.refresh()
+    assert not rebuilds
+    assert engine._offset == path.stat().st_size
+    assert_stats_equal(stats, full_stats(path, loader_class))
+
+
+def test_half_written_row_waits_for_next_refresh(contracts):
+    path, loader_class = contracts
+    engine = IncrementalContractStats(loader_class(path, use_snapshot=False))
+    before = engine.refresh()['total_contracts']
+
+    line = make_contracts_frame(1, seed=5).to_csv(index=False, header=False)
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write(line[:20])
+    assert engine.refresh()['total_contracts'] == before
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write(line[20:])
+    assert engine.refresh()['total_contracts'] == before + 1
+    assert_stats_equal(engine.refresh(), full_stats(path, loader_class))
+
+
+def test_edit_before_old_end_triggers_full_rebuild(contracts, monkeypatch):
+    path, loader_class = contracts
+    engine = IncrementalContractStats(loader_class(path, use_snapshot=False))
+    engine.refresh()
+    rebuilds = count_rebuilds(engine, monkeypatch)
+
+    # Same length edit inside the last block, plus an append: the boundary digest no longer matches
+    data = path.read_bytes()
+    at = data.rfind(b'NEGOCIADOR 00')
+    path.write_bytes(data[:at] + b'NEGOCIADOR 99' + data[at + 13:])
+    append_rows(path, 10, seed=6)
+
+    assert_stats_equal(engine.refresh(), full_stats(path, loader_class))
+    assert rebuilds == [1]
+
+
+def test_truncation_triggers_full_rebuild(contracts):
+    path, loader_class = contracts
+    engine = IncrementalContractStats(loader_class(path, use_snapshot=False))
+    engine.refresh()
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b''.join(lines[:100]))
+    assert engine.refresh()['total_contracts'] == 99
+
+
+def test_chunked_rebuild_matches_whole_file(contracts):
+    path, loader_class = contracts
+    chunked = IncrementalContractStats(loader_class(path, use_snapshot=False), chunksize=64)
+    assert_stats_equal(chunked.refresh(), full_stats(path, loader_class))
+    append_rows(path, 30, seed=7)
+    assert_stats_equal(chunked.refresh(), full_stats(path, loader_class))
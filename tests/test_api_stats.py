@@ -0,0 +1,79 @@
+"""/api/stats validators: per-coding ETags, 304 revalidation and Vary
+
+Usage: python -m pytest tests
+"""
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from synthetic_data import write_contracts_csv
+
+
+@pytest.fixture
+def client(dashboard_module):
+    cwd = os.getcwd()
+    # DataLoader and the refresher use the dashboard's relative CSV path
+    os.chdir(dashboard_module.WORKDIR)
+    try:
+        path = dashboard_module.dashboard.data_loader.file_path
+        if not path.exists():
+            write_contracts_csv(path, 400, seed=8)
+        client = dashboard_module.app.test_client()
+        response = client.post('/login', json={'username': 'admin', 'password': 'admin123'})
+        assert response.status_code == 200, response.get_json()
+        yield client
+    finally:
+        dashboard_module.dashboard.stats_refresher.stop()
+        os.chdir(cwd)
+
+
+def get(client, encoding, etag=None, query=''):
+    headers = {'Accept-Encoding': encoding}
+    if etag:
+        headers['If-None-Match'] = etag
+    return client.get(f'/api/stats{query}', headers=headers)
+
+
+@pytest.mark.parametrize('query', ['', '?banco=CAIXA'])
+def test_each_coding_has_its_own_etag(client, query):
+    identity = get(client, 'identity', query=query)
+    gzipped = get(client, 'gzip', query=query)
+    assert identity.status_code == gzipped.status_code == 200
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Encoding' not in identity.headers
+    assert json.loads(gzip.decompress(gzipped.data)) == identity.get_json()
+
+    assert identity.headers['ETag'] != gzipped.headers['ETag']
+    assert gzipped.headers['ETag'] == identity.headers['ETag'][:-1] + '-gzip"'
+    for response in (identity, gzipped):
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+
+@pytest.mark.parametrize('cached, asked', [('identity', 'identity'), ('gzip', 'gzip'), ('gzip', 'identity')])
+def test_any_coding_of_the_current_etag_revalidates(client, cached, asked):
+    etag = get(client, cached).headers['ETag']
+    response = get(client, asked, etag=etag)
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+    assert response.headers['Vary'] == 'Accept-Encoding'
+
+
+def test_etag_of_another_dataset_or_filter_gets_a_body(client):
+    etag = get(client, 'gzip').headers['ETag']
+    assert get(client, 'gzip', etag=etag, query='?banco=CAIXA').status_code == 200
+    assert get(client, 'gzip', etag='"0123456789abcdef-gzip"').status_code == 200
+
+
+def test_changed_file_invalidates_the_etag(client, dashboard_module):
+    etag = get(client, 'gzip', query='?banco=CAIXA').headers['ETag']
+    path = dashboard_module.dashboard.data_loader.file_path
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get(client, 'gzip', etag=etag, query='?banco=CAIXA').status_code == 200
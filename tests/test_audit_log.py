@@ -0,0 +1,217 @@
+"""AuditLogger batching, flush/close and rotation; AuditReader file order, filters and paging
+
+Usage: python -m pytest tests
+"""
+import csv
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import audit_log
+from audit_log import AUDIT_COLUMNS, AuditLogger, AuditReader, audit_files
+
+
+def read_rows(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+@pytest.fixture
+def logger(tmp_path):
+    logger = AuditLogger(tmp_path / 'audit.csv', batch_size=50, flush_interval=0.05)
+    yield logger
+    logger.close()
+
+
+def test_flush_writes_everything_logged_before_it(logger):
+    for i in range(120):
+        logger.log('ana', 'login', f'evento {i}')
+    assert logger.flush()
+    rows = read_rows(logger.path)
+    assert rows[0] == AUDIT_COLUMNS
+    assert [row[3] for row in rows[1:]] == [f'evento {i}' for i in range(120)]
+    assert logger.written == 120
+    # Batches are capped at batch_size
+    assert logger.batches >= 3
+
+
+def test_log_returns_before_the_write(tmp_path):
+    logger = AuditLogger(tmp_path / 'audit.csv', flush_interval=10)
+    try:
+        logger.log('ana', 'login')
+        # The writer is still collecting its batch
+        assert not logger.path.exists()
+        assert logger.flush()
+        assert len(read_rows(logger.path)) == 2
+    finally:
+        logger.close()
+
+
+def test_close_drains_the_queue(tmp_path):
+    logger = AuditLogger(tmp_path / 'audit.csv', flush_interval=10)
+    for i in range(10):
+        logger.log('ana', 'acao', str(i))
+    logger.close()
+    assert len(read_rows(logger.path)) == 11
+
+
+def test_flush_without_events(logger):
+    assert logger.flush()
+    assert not logger.path.exists()
+
+
+def test_fields_with_commas_quotes_and_newlines_round_trip(logger):
+    details = 'valor "alto", revisar\nsegunda linha'
+    logger.log('ana, a gerente', 'edição', details)
+    logger.flush()
+    assert read_rows(logger.path)[1][1:] == ['ana, a gerente', 'edição', details]
+
+
+def test_rotates_past_max_bytes(tmp_path):
+    logger = AuditLogger(tmp_path / 'audit.csv', flush_interval=0.01, max_bytes=200)
+    try:
+        for i in range(30):
+            logger.log('ana', 'login', 'x' * 20)
+            logger.flush()
+    finally:
+        logger.close()
+    files = audit_files(logger.path)
+    assert logger.rotations == len(files) - 1 >= 2
+    rows = []
+    for path in files:
+        file_rows = read_rows(path)
+        # Every file starts with its own header
+        assert file_rows[0] == AUDIT_COLUMNS
+        rows.extend(file_rows[1:])
+    assert len(rows) == 30
+
+
+def test_rotates_when_day_changes(tmp_path):
+    logger = AuditLogger(tmp_path / 'audit.csv', flush_interval=0.01)
+    try:
+        logger.log('ana', 'ontem')
+        logger.flush()
+        yesterday = time.time() - 86400
+        os.utime(logger.path, (yesterday, yesterday))
+        logger.log('ana', 'hoje')
+        logger.flush()
+    finally:
+        logger.close()
+    day = date.today() - timedelta(days=1)
+    rotated = tmp_path / f'audit-{day:%Y%m%d}.csv'
+    assert [row[2] for row in read_rows(rotated)[1:]] == ['ontem']
+    assert [row[2] for row in read_rows(logger.path)[1:]] == ['hoje']
+
+
+def write_events(path, events):
+    new_file = not path.exists()
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if new_file:
+            writer.writerow(AUDIT_COLUMNS)
+        writer.writerows(events)
+
+
+def make_events(day, n, offset=0, hour=0):
+    users = ['ana', 'bia', 'caio, o admin']
+    actions = ['login', 'calculo', 'exportacao']
+    return [
+        (f'2024-05-{day:02d} {hour + i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}',
+         users[(i + offset) % 3], actions[(i + offset) % 7 % 3],
+         f'detalhe {day}-{i}' + ('\n"segunda" linha' if i % 11 == 0 else ''))
+        for i in range(n)
+    ]
+
+
+def test_rotated_files_sort_by_day_then_number(tmp_path):
+    names = ['audit-20240102.csv', 'audit-20240101-10.csv', 'audit-20240101-2.csv',
+             'audit-20240101.csv', 'audit-20240101-1.csv', 'audit.csv']
+    for name in names:
+        (tmp_path / name).write_text('')
+    assert [p.name for p in audit_files(tmp_path / 'audit.csv')] == [
+        'audit-20240101.csv', 'audit-20240101-1.csv', 'audit-20240101-2.csv',
+        'audit-20240101-10.csv', 'audit-20240102.csv', 'audit.csv'
+    ]
+
+
+@pytest.fixture
+def audit_dir(tmp_path, monkeypatch):
+    # Small blocks so a few hundred events span many of them
+    monkeypatch.setattr(audit_log, 'INDEX_BLOCK_BYTES', 1024)
+    write_events(tmp_path / 'audit-20240501.csv', make_events(1, 300))
+    # Second rotation of the same day (size limit)
+    write_events(tmp_path / 'audit-20240501-1.csv', make_events(1, 200, offset=1, hour=12))
+    write_events(tmp_path / 'audit.csv', make_events(2, 250, offset=2))
+    return tmp_path
+
+
+def all_events_newest_first(path):
+    rows = []
+    for file in audit_files(path):
+        rows.extend(read_rows(file)[1:])
+    return rows[::-1]
+
+
+def expected(path, username=None, actions=None, start=None, end=None):
+    lo = f'{start:%Y-%m-%d} 00:00:00' if start else None
+    hi = f'{end:%Y-%m-%d} 23:59:59' if end else None
+    return [row for row in all_events_newest_first(path)
+            if (username is None or row[1] == username)
+            and (actions is None or row[2] in actions)
+            and (lo is None or row[0] >= lo) and (hi is None or row[0] <= hi)]
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'username': 'caio, o admin'},
+    {'actions': ['exportacao']},
+    {'username': 'bia', 'actions': ['login', 'calculo']},
+    {'start': date(2024, 5, 2)},
+    {'end': date(2024, 5, 1), 'actions': ['login']},
+    {'username': 'ninguem'},
+])
+def test_pages_match_a_full_scan(audit_dir, filters):
+    reader = AuditReader(audit_dir / 'audit.csv')
+    rows = expected(audit_dir / 'audit.csv', **filters)
+    page_size = 37
+    first = reader.query(page_size=page_size, **filters)
+    assert first.total == len(rows)
+    assert first.pages == max(1, -(-len(rows) // page_size))
+    got = []
+    for page in range(1, first.pages + 1):
+        got.extend(reader.query(page=page, page_size=page_size, **filters).rows.values.tolist())
+    assert got == rows
+
+
+def test_first_page_reads_few_blocks(audit_dir):
+    reader = AuditReader(audit_dir / 'audit.csv')
+    page = reader.query(page_size=20)
+    blocks = sum(len(index.blocks) for index in reader._indexes.values())
+    assert blocks > 20
+    # Counts come from the index; only the newest block(s) are decoded
+    assert page.blocks_read <= 2
+    assert page.rows['timestamp'].iat[0] == all_events_newest_first(audit_dir / 'audit.csv')[0][0]
+
+
+def test_appends_and_rotation_are_picked_up(audit_dir):
+    path = audit_dir / 'audit.csv'
+    reader = AuditReader(path)
+    total = reader.query().total
+    write_events(path, [('2024-05-02 23:59:59', 'ana', 'logout', 'fim')])
+    page = reader.query(page_size=1)
+    assert page.total == total + 1
+    assert page.rows.values.tolist() == [['2024-05-02 23:59:59', 'ana', 'logout', 'fim']]
+
+    path.rename(audit_dir / 'audit-20240502.csv')
+    write_events(path, [('2024-05-03 00:00:01', 'bia', 'login', '')])
+    page = reader.query(page_size=2)
+    assert page.total == total + 2
+    assert page.rows['action'].tolist() == ['login', 'logout']
+    assert 'logout' in reader.actions()
+    assert reader.users() == ['ana', 'bia', 'caio, o admin']
@@ -0,0 +1,111 @@
+"""Batch discount mode: sheet parsing, vectorized results, summary and history rows
+
+Usage: python -m pytest tests
+"""
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batch_discounts import (BATCH_COLUMNS, compute_discounts, history_records, read_proposals,
+                             summarize, to_csv_bytes)
+from money import format_currency
+
+SHEET = (
+    "Número do Contrato;Valor da Dívida;Valor Proposto;Banco\n"
+    "C1;R$ 1.000,00;800,00;CAIXA\n"
+    "C2;2.000,00;R$ 1.000,00;CAIXA\n"
+    "C3;500,00;450,00;BB\n"
+    "C4;0,00;10,00;BB\n"
+    "C5;abc;10,00;BB\n"
+)
+
+
+def test_reads_semicolon_sheet_with_aliased_accented_headers():
+    df = read_proposals(SHEET.encode('utf-8-sig'), 'propostas.csv')
+    assert list(df.columns) == BATCH_COLUMNS
+    assert list(df['contrato']) == ['C1', 'C2', 'C3', 'C4', 'C5']
+    assert df['valor_original'].iat[0] == 'R$ 1.000,00'
+
+
+def test_reads_latin1_comma_sheet_without_optional_columns():
+    data = "valor_original,valor_proposto\n\"1.000,00\",\"900,00\"\n".encode('latin1')
+    df = read_proposals(data, 'PROPOSTAS.CSV')
+    assert list(df['banco']) == ['']
+    assert list(df['contrato']) == ['']
+
+
+def test_missing_required_column():
+    with pytest.raises(ValueError, match='valor_proposto'):
+        read_proposals(b"valor_original;banco\n1,00;BB\n", 'x.csv')
+
+
+def test_reads_excel():
+    pytest.importorskip('openpyxl')
+    buffer = io.BytesIO()
+    pd.DataFrame({'Valor Original': [1000.0], 'Proposta': [750.5], 'Banco': ['BB']}).to_excel(buffer, index=False)
+    result = compute_discounts(read_proposals(buffer.getvalue(), 'propostas.xlsx'))
+    assert result['desconto_percentual'].iat[0] == pytest.approx(24.95)
+
+
+def test_compute_matches_single_calculation_and_flags_invalid_rows():
+    result = compute_discounts(read_proposals(SHEET.encode('utf-8'), 'propostas.csv'))
+    assert list(result['valido']) == [True, True, True, False, False]
+    assert list(result['desconto_percentual'][:3]) == [20.0, 50.0, 10.0]
+    assert list(result['economia'][:3]) == [200.0, 1000.0, 50.0]
+    assert result['economia'][3:].isna().all()
+    assert result['desconto_percentual'][3:].isna().all()
+
+
+def test_summary_weights_by_debt_and_groups_by_bank():
+    summary, by_bank = summarize(compute_discounts(read_proposals(SHEET.encode('utf-8'), 'p.csv')))
+    assert (summary['linhas'], summary['validas'], summary['invalidas']) == (5, 3, 2)
+    assert summary['economia_total'] == pytest.approx(1250.0)
+    assert summary['desconto_ponderado'] == pytest.approx(1250 / 3500 * 100)
+    assert summary['desconto_medio'] == pytest.approx(80 / 3)
+    assert summary['desconto_maximo'] == 50.0
+
+    assert list(by_bank.index) == ['CAIXA', 'BB']
+    assert list(by_bank['contratos']) == [2, 1]
+    assert by_bank.loc['CAIXA', 'desconto_ponderado'] == pytest.approx(40.0)
+
+
+def test_summary_of_sheet_without_valid_rows():
+    df = pd.DataFrame({'valor_original': ['0'], 'valor_proposto': ['1'], 'banco': ['BB'], 'contrato': ['']})
+    summary, by_bank = summarize(compute_discounts(df))
+    assert summary['validas'] == 0
+    assert summary['desconto_ponderado'] == 0.0
+    assert by_bank.empty
+
+
+def test_csv_download_uses_decimal_commas():
+    result = compute_discounts(read_proposals(SHEET.encode('utf-8'), 'p.csv'))
+    text = to_csv_bytes(result).decode('utf-8-sig')
+    lines = text.splitlines()
+    assert lines[0] == 'valor_original;valor_proposto;banco;contrato;desconto_percentual;economia;valido'
+    assert lines[1] == 'R$ 1.000,00;800,00;CAIXA;C1;20,00;200,00;True'
+
+
+def test_history_records_only_for_valid_rows():
+    result = compute_discounts(read_proposals(SHEET.encode('utf-8'), 'p.csv'))
+    records = history_records(result, format_currency)
+    assert len(records) == 3
+    assert records[1]['valor_original'] == '2.000,00'
+    assert records[1]['valor_proposto'] == '1.000,00'
+    assert records[1]['desconto_percentual'] == '50.00'
+    assert records[1]['economia'] == 'R$ 1.000,00'
+
+
+def test_vectorized_pass_on_many_rows():
+    rng = np.random.default_rng(1)
+    original = rng.uniform(100, 10000, 5000)
+    proposed = original * rng.uniform(0.2, 1.0, 5000)
+    df = pd.DataFrame({'valor_original': original, 'valor_proposto': proposed, 'banco': 'BB', 'contrato': ''})
+    result = compute_discounts(df)
+    assert result['valido'].all()
+    np.testing.assert_allclose(result['desconto_percentual'], np.round((original - proposed) / original * 100, 2))
@@ -0,0 +1,68 @@
+"""Contract frame schema: categoricals, contract numbers and dates
+
+Usage: python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from contract_schema import apply_schema, normalize_categories, read_contracts, to_contract_numbers
+from synthetic_data import make_contracts_frame
+
+
+def test_normalize_categories_merges_labels_that_collapse():
+    series = pd.Series(['sim', ' SIM', 'NÃO', None, 'sim'], dtype='category')
+    result = normalize_categories(series)
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert list(result.cat.categories) == ['SIM', 'NÃO']
+    assert result.astype(object).tolist() == ['SIM', 'SIM', 'NÃO', np.nan, 'SIM']
+
+
+def test_normalize_categories_renames_when_nothing_collapses():
+    series = pd.Series(['aprovado ', 'pendente'], index=[5, 7], name='SITUAÇÃO')
+    result = normalize_categories(series)
+    assert result.tolist() == ['APROVADO', 'PENDENTE']
+    assert list(result.index) == [5, 7] and result.name == 'SITUAÇÃO'
+
+
+def test_contract_numbers_become_int64_unless_free_text():
+    numbers = to_contract_numbers(pd.Series([' 123456', '2000000', '', None]))
+    assert str(numbers.dtype) == 'Int64'
+    assert numbers.tolist()[:2] == [123456, 2000000]
+    assert numbers.isna().tolist() == [False, False, True, True]
+
+    mixed = to_contract_numbers(pd.Series(['123456', ' ABC-9 ']))
+    assert mixed.tolist() == ['123456', 'ABC-9']
+
+
+def test_apply_schema_matches_the_old_string_cleaning():
+    raw = make_contracts_frame(300, seed=12)
+    typed = apply_schema(raw.copy())
+
+    for col in ['SITUAÇÃO', 'CAMPANHA', 'CONTATO', 'NEGOCIAÇÃO', 'BANCO', 'ESCRITÓRIO']:
+        assert isinstance(typed[col].dtype, pd.CategoricalDtype), col
+        assert typed[col].astype(str).tolist() == raw[col].str.upper().str.strip().tolist(), col
+    expected_dates = pd.to_datetime(raw['DATA'], format='%d/%m/%Y')
+    assert typed['DATA'].equals(expected_dates)
+    assert typed['CONTRATO'].astype('int64').tolist() == raw['CONTRATO'].astype(int).tolist()
+
+
+def test_unparseable_dates_become_nat():
+    df = apply_schema(pd.DataFrame({'DATA': ['01/02/2024', 'sem data', '']}))
+    assert df['DATA'].isna().tolist() == [False, True, True]
+
+
+def test_read_contracts_strips_headers_and_types_columns(tmp_path):
+    raw = make_contracts_frame(50, seed=13).rename(columns={'CAMPANHA': 'CAMPANHA '})
+    path = tmp_path / 'contratos.csv'
+    raw.to_csv(path, index=False, encoding='utf-8')
+    df = read_contracts(path)
+    assert 'CAMPANHA' in df.columns
+    assert set(df['CAMPANHA'].cat.categories) <= {'SIM', 'NÃO'}
+    assert pd.api.types.is_datetime64_any_dtype(df['RESOLUÇÃO'])
+    assert str(df['CONTRATO'].dtype) == 'Int64'
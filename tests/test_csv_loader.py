@@ -0,0 +1,109 @@
+"""Encoding sniffing, the per-file encoding memory and the latin1 fallbacks
+
+Usage: python -m pytest tests
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import csv_loader
+from csv_loader import SNIFF_BYTES, detect_encoding, iter_csv_chunks, read_csv, resolve_encoding
+
+HEADER = 'NEGOCIAÇÃO,VALOR\n'
+
+
+def write(path, text, encoding, mtime_ns=None):
+    path.write_bytes(text.encode(encoding))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def memory(path):
+    return json.loads((path.parent / '.cache' / 'encodings.json').read_text(encoding='utf-8'))
+
+
+def test_detects_bom_utf8_and_latin1(tmp_path):
+    path = tmp_path / 'a.csv'
+    write(path, HEADER, 'utf-8-sig')
+    assert detect_encoding(path) == 'utf-8-sig'
+    write(path, HEADER, 'utf-8')
+    assert detect_encoding(path) == 'utf-8'
+    write(path, HEADER, 'latin1')
+    assert detect_encoding(path) == 'latin1'
+
+
+def test_multibyte_character_cut_by_the_sample_is_still_utf8(tmp_path):
+    path = tmp_path / 'a.csv'
+    path.write_bytes(b'x' * (SNIFF_BYTES - 1) + 'Ç'.encode('utf-8'))
+    assert detect_encoding(path) == 'utf-8'
+
+
+def test_encoding_is_remembered_with_the_file_signature(tmp_path):
+    path = tmp_path / 'a.csv'
+    write(path, HEADER + 'João,1\n', 'latin1')
+    assert resolve_encoding(path) == 'latin1'
+    entry = memory(path)['a.csv']
+    assert entry['encoding'] == 'latin1'
+    assert (entry['size'], entry['mtime_ns']) == (path.stat().st_size, path.stat().st_mtime_ns)
+
+
+def test_new_export_under_the_same_name_is_sniffed_again(tmp_path):
+    path = tmp_path / 'a.csv'
+    write(path, HEADER + 'João,1\n', 'latin1', mtime_ns=1_000_000_000)
+    assert list(read_csv(path).columns) == ['NEGOCIAÇÃO', 'VALOR']
+
+    # latin1 decodes anything, so only the changed size/mtime can reveal the new codec
+    write(path, HEADER + 'João,1\n', 'utf-8', mtime_ns=2_000_000_000)
+    df = read_csv(path)
+    assert list(df.columns) == ['NEGOCIAÇÃO', 'VALOR']
+    assert df['NEGOCIAÇÃO'].tolist() == ['João']
+    assert memory(path)['a.csv']['encoding'] == 'utf-8'
+
+
+def test_old_string_entries_are_sniffed_again(tmp_path):
+    path = tmp_path / 'a.csv'
+    write(path, HEADER, 'utf-8')
+    (tmp_path / '.cache').mkdir()
+    (tmp_path / '.cache' / 'encodings.json').write_text(json.dumps({'a.csv': 'latin1'}), encoding='utf-8')
+    assert resolve_encoding(path) == 'utf-8'
+
+
+def test_invalid_byte_after_the_sample_falls_back_to_latin1(tmp_path):
+    path = tmp_path / 'a.csv'
+    rows = ''.join(f'NOME {i},{i}\n' for i in range(SNIFF_BYTES // 8))
+    write(path, 'NOME,VALOR\n' + rows + 'João,1\n', 'latin1')
+    assert resolve_encoding(path) == 'utf-8'
+    df = read_csv(path)
+    assert df['NOME'].iloc[-1] == 'João'
+    assert memory(path)['a.csv']['encoding'] == 'latin1'
+
+
+def test_chunks_continue_as_latin1_without_repeating_rows(tmp_path, monkeypatch):
+    path = tmp_path / 'a.csv'
+    n_rows = 20_000
+    rows = ''.join(f'NOME {i},{i}\n' for i in range(n_rows))
+    write(path, 'NOME,VALOR\n' + rows + 'João,-1\n' + 'FIM,-2\n', 'latin1')
+
+    yielded = []
+    fallback_after = []
+    remember = csv_loader.remember_encoding
+
+    def spy(p, encoding):
+        if encoding == 'latin1':
+            fallback_after.append(sum(yielded))
+        remember(p, encoding)
+    monkeypatch.setattr(csv_loader, 'remember_encoding', spy)
+
+    values = []
+    for chunk in iter_csv_chunks(path, chunksize=1000):
+        assert len(chunk) <= 1000
+        yielded.append(len(chunk))
+        values.extend(chunk['VALOR'])
+
+    # The bad byte is found after whole chunks went out; they are skipped on the latin1 pass
+    assert fallback_after and fallback_after[0] > 0
+    assert values == list(range(n_rows)) + [-1, -2]
+    assert memory(path)['a.csv']['encoding'] == 'latin1'
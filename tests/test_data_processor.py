@@ -0,0 +1,109 @@
+"""DataPreprocessor.load: the analysis schema is pushed into the reader (usecols, dtypes, dates)
+
+Usage: python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import data_processor
+from data_processor import ANALYSIS_SCHEMAS, DataPreprocessor
+
+PRIORITY_CSV = (
+    "BANCO,SITUAÇÃO,PRAZO B,PRAZO 7 ,VALOR DO CLIENTE,DATA,ENTRADA,NOME,CPF\n"
+    'CAIXA,ATIVO,"12,5%",36,"R$ 1.234,56",01/02/2024,15/02/2024,Ana,111\n'
+    'BB,QUITADO,10%,24,"R$ 500,00",31/12/2023,xx,Bia,222\n'
+    'CAIXA,ATIVO,,12,,,,Caio,333\n'
+)
+
+QUITADOS_CSV = (
+    "CTT,SALDO DEVEDOR,DESCONTO,BANCO,CONSULTOR,OBS\n"
+    'C1,"R$ 1.000,00",40%,CAIXA,Ana,x\n'
+    'C2,"2.000,00","12,5%",BB,Bia,y\n'
+)
+
+
+def write(tmp_path, text, name='contratos.csv'):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def processor():
+    return DataPreprocessor()
+
+
+def test_priority_reads_only_schema_columns_with_their_types(tmp_path, processor):
+    df = processor.load(write(tmp_path, PRIORITY_CSV), 'priority')
+    schema = ANALYSIS_SCHEMAS['priority']
+    assert set(df.columns) <= set(schema['required'] + schema['optional'])
+    assert 'NOME' not in df.columns and 'CPF' not in df.columns
+    # The raw header 'PRAZO 7 ' is matched and stripped
+    assert 'PRAZO 7' in df.columns
+
+    assert isinstance(df['BANCO'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['SITUAÇÃO'].dtype, pd.CategoricalDtype)
+    assert df['PRAZO B'].tolist()[:2] == [12.5, 10.0]
+    assert df['PRAZO 7'].tolist() == [36.0, 24.0, 12.0]
+    assert df['VALOR DO CLIENTE'].tolist()[:2] == [1234.56, 500.0]
+    assert df['PRAZO B'].isna().iat[2]
+
+    assert df['DATA'].tolist()[:2] == [pd.Timestamp('2024-02-01'), pd.Timestamp('2023-12-31')]
+    # Unparseable and empty dates become NaT
+    assert df['ENTRADA'].isna().tolist() == [False, True, True]
+
+
+def test_read_options_project_raw_names(tmp_path, processor):
+    options = processor.read_options(write(tmp_path, PRIORITY_CSV), 'priority')
+    assert 'PRAZO 7 ' in options['usecols']
+    assert 'NOME' not in options['usecols']
+    assert options['dtype']['BANCO'] == 'category'
+    assert options['dtype']['PRAZO 7 '] is str
+    assert options['dtype']['DATA'] is str
+
+
+def test_missing_required_column_fails_on_the_header(tmp_path, processor, monkeypatch):
+    calls = []
+    real_read_csv = data_processor.read_csv
+
+    def spy(path, **kwargs):
+        calls.append(kwargs)
+        return real_read_csv(path, **kwargs)
+
+    monkeypatch.setattr(data_processor, 'read_csv', spy)
+    path = write(tmp_path, "BANCO,SITUAÇÃO,PRAZO B\nCAIXA,ATIVO,10\n")
+    with pytest.raises(ValueError, match='priority'):
+        processor.load(path, 'priority')
+    assert [kwargs.get('nrows') for kwargs in calls] == [0]
+
+
+def test_quitados_derived_discount(tmp_path, processor):
+    df = processor.load(write(tmp_path, QUITADOS_CSV), 'quitados')
+    assert 'OBS' not in df.columns
+    assert df['DESCONTO'].tolist() == [40.0, 12.5]
+    assert df['SALDO_DEVEDOR'].tolist() == [1000.0, 2000.0]
+    assert df['VALOR_DESCONTO'].tolist() == [400.0, 250.0]
+
+
+def test_load_matches_process_dataframe(tmp_path, processor):
+    path = write(tmp_path, QUITADOS_CSV)
+    loaded = processor.load(path, 'quitados')
+    full = pd.read_csv(path, dtype=str, keep_default_na=False)
+    processed = processor.process_dataframe(full, 'quitados')
+    for col in ('SALDO DEVEDOR', 'DESCONTO', 'VALOR_DESCONTO'):
+        assert loaded[col].tolist() == processed[col].tolist()
+    # process_dataframe works on a copy of the caller's frame
+    assert full['DESCONTO'].tolist() == ['40%', '12,5%']
+
+
+def test_basic_schema(tmp_path, processor):
+    path = write(tmp_path, "SITUAÇÃO,DATA,RESOLUÇÃO,VALOR\nATIVO,05/03/2024,,10\n")
+    df = processor.load(path, 'basic')
+    assert list(df.columns) == ['SITUAÇÃO', 'DATA', 'RESOLUÇÃO']
+    assert df['DATA'].iat[0] == pd.Timestamp('2024-03-05')
+    assert pd.isna(df['RESOLUÇÃO'].iat[0])
@@ -0,0 +1,178 @@
+"""HistoryLog ops keep pointing at the same row across compactions; HistoryBrowser filters and pages
+
+Usage: python -m pytest tests
+"""
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from history_store import HistoryBrowser, HistoryLog, ops_path_for
+
+
+def record(i):
+    return {
+        'data_calculo': f'2024-01-{i + 1:02d} 10:00:00',
+        'valor_original': f'{(i + 1) * 100},00',
+        'valor_proposto': f'{(i + 1) * 50},00',
+        'desconto_percentual': '50.00',
+        'economia': f'R$ {(i + 1) * 50},00'
+    }
+
+
+def open_history(tmp_path, n=5):
+    path = tmp_path / 'historico_descontos.csv'
+    log = HistoryLog(path, compact_interval=3600)
+    log.append_many([record(i) for i in range(n)])
+    browser = HistoryBrowser(path, log=log)
+    browser.refresh()
+    return path, log, browser
+
+
+def originals(path):
+    return list(pd.read_csv(path, dtype=str, keep_default_na=False)['valor_original'])
+
+
+def test_page_rendered_before_compaction_edits_the_row_it_showed(tmp_path):
+    path, log, browser = open_history(tmp_path)
+    page = browser.query(newest_first=False, page_size=10)
+    ids = list(page.rows.index)
+
+    log.delete(ids[0])
+    log.compact()
+    # Buttons of the stale page still carry the ids rendered before compaction
+    log.edit(ids[2], {'valor_original': '999,00'})
+    log.delete(ids[4])
+    browser.refresh()
+
+    assert list(browser.query(newest_first=False).rows['valor_original']) == ['200,00', '999,00', '400,00']
+    log.compact()
+    assert originals(path) == ['200,00', '999,00', '400,00']
+
+
+def test_ops_for_rows_compacted_away_are_ignored(tmp_path):
+    path, log, browser = open_history(tmp_path)
+    gone = browser.query(newest_first=False).rows.index[1]
+    log.delete(gone)
+    log.compact()
+    log.edit(gone, {'valor_original': '1,00'})
+    log.compact()
+    assert originals(path) == ['100,00', '300,00', '400,00', '500,00']
+
+
+def test_csv_without_ids_is_migrated_with_pending_position_ops(tmp_path):
+    path = tmp_path / 'historico_descontos.csv'
+    pd.DataFrame([record(i) for i in range(4)]).to_csv(path, index=False)
+    with open(ops_path_for(path), 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'delete', 'row': 0}) + '\n')
+        f.write(json.dumps({'op': 'edit', 'row': 2, 'values': {'valor_original': '999,00'}}) + '\n')
+
+    log = HistoryLog(path, compact_interval=3600)
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    assert frame['id'].is_unique and (frame['id'] != '').all()
+    assert list(frame['valor_original']) == ['200,00', '999,00', '400,00']
+    assert not ops_path_for(path).exists()
+
+    log.append(record(9))
+    browser = HistoryBrowser(path, log=log)
+    browser.refresh()
+    assert browser.query().total == 4
+
+
+def brl(value):
+    return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def random_records(n, seed=3):
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n):
+        original = float(rng.uniform(100, 5000))
+        discount = float(rng.uniform(5, 60))
+        records.append({
+            'data_calculo': f'2024-03-{rng.integers(1, 6):02d} {i % 24:02d}:{i % 60:02d}:00',
+            'valor_original': brl(original),
+            'valor_proposto': brl(original * (1 - discount / 100)),
+            'desconto_percentual': f'{discount:.2f}',
+            'economia': 'R$ ' + brl(original * discount / 100)
+        })
+    return records
+
+
+def expected(path, day=None, min_value=None):
+    """Matching rows the slow way, oldest first"""
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    dates = pd.to_datetime(frame['data_calculo'])
+    values = frame['valor_original'].str.replace('.', '').str.replace(',', '.').astype(float)
+    mask = pd.Series(True, index=frame.index)
+    if day is not None:
+        mask &= dates.dt.date == day
+    if min_value:
+        mask &= values >= min_value
+    order = dates[mask].sort_values(kind='stable').index
+    return list(frame.loc[order, 'id'])
+
+
+def test_filters_match_a_full_scan(tmp_path):
+    path = tmp_path / 'historico_descontos.csv'
+    log = HistoryLog(path, compact_interval=3600)
+    log.append_many(random_records(300))
+    browser = HistoryBrowser(path, log=log)
+    assert browser.refresh()
+
+    for day, min_value in [(None, None), (date(2024, 3, 2), None), (None, 2500), (date(2024, 3, 4), 1000)]:
+        ids = expected(path, day, min_value)
+        page = browser.query(day=day, min_value=min_value, page_size=1000, newest_first=False)
+        assert list(page.rows.index) == ids
+        assert page.total == len(ids)
+        newest = browser.query(day=day, min_value=min_value, page_size=1000)
+        assert list(newest.rows.index) == ids[::-1]
+
+
+def test_paging_and_stats(tmp_path):
+    path, log, browser = open_history(tmp_path, n=7)
+    first = browser.query(page=1, page_size=3)
+    assert (first.total, first.pages, first.page) == (7, 3, 1)
+    assert list(first.rows['valor_original']) == ['700,00', '600,00', '500,00']
+    last = browser.query(page=3, page_size=3)
+    assert list(last.rows['valor_original']) == ['100,00']
+    # Out-of-range pages are clamped
+    assert browser.query(page=99, page_size=3).page == 3
+    assert browser.query(page=0, page_size=3).page == 1
+
+    assert first.stats['mean_discount'] == 50.0
+    assert first.stats['max_saving'] == 'R$ 350,00'
+    empty = browser.query(min_value=10000)
+    assert (empty.total, empty.pages, empty.stats) == (0, 1, None)
+
+
+def test_pending_ops_are_applied_without_compaction(tmp_path):
+    path, log, browser = open_history(tmp_path)
+    ids = list(browser.query(newest_first=False).rows.index)
+    log.edit(ids[0], {'valor_original': '9.000,00', 'economia': 'R$ 4.500,00'})
+    log.delete(ids[4])
+    browser.refresh()
+
+    # The edit moved the row in the value index
+    page = browser.query(min_value=450, newest_first=False)
+    assert list(page.rows.index) == [ids[0]]
+    assert browser.query().total == 4
+    assert browser.query().stats['max_saving'] == 'R$ 4.500,00'
+
+
+def test_refresh_picks_up_appends(tmp_path):
+    path, log, browser = open_history(tmp_path, n=2)
+    log.append(record(5))
+    browser.refresh()
+    assert browser.query().rows['valor_original'].iat[0] == '600,00'
+    assert browser.query().total == 3
+
+
+def test_refresh_without_history(tmp_path):
+    browser = HistoryBrowser(tmp_path / 'historico_descontos.csv')
+    assert not browser.refresh()
@@ -0,0 +1,155 @@
+"""ImageCache: offline fallback, memory/disk hits, invalidation of replaced content and LRU eviction
+
+Downloads are replaced by a dict of URL -> bytes, so nothing touches the network.
+
+Usage: python -m pytest tests
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from image_cache import ImageCache, gradient_png
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def png(shade):
+    return gradient_png(64, 36, top=(shade, 0, 0), bottom=(0, 0, shade))
+
+
+def sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def remote():
+    return {}
+
+
+@pytest.fixture
+def make_cache(tmp_path, remote):
+    def make(**kwargs):
+        cache = ImageCache(tmp_path / 'images', thumbnail_size=(32, 18), clock=Clock(), **kwargs)
+
+        def download(url):
+            if url not in remote:
+                raise OSError('offline')
+            return remote[url]
+
+        cache._download = download
+        return cache
+    return make
+
+
+def test_uncached_url_gets_fallback(make_cache):
+    cache = make_cache()
+    assert cache.thumbnail('https://img/a') == cache.fallback()
+    assert cache.thumbnail(None) == cache.fallback()
+    assert cache.image('https://img/a') is None
+    assert cache.metrics()['misses'] == 2
+
+
+def test_failed_fetch_keeps_previous_image(make_cache, remote):
+    cache = make_cache()
+    remote['https://img/a'] = png(10)
+    assert cache.fetch('https://img/a')
+    del remote['https://img/a']
+    assert not cache.fetch('https://img/a')
+    assert cache.image('https://img/a') == png(10)
+
+
+def test_memory_then_disk_hits_across_restarts(make_cache, remote):
+    remote['https://img/a'] = png(10)
+    cache = make_cache()
+    cache.fetch('https://img/a')
+    thumb = cache.thumbnail('https://img/a')
+    assert thumb != cache.fallback()
+    assert cache.metrics()['memory_hits'] == 1
+
+    restarted = make_cache()
+    assert restarted.thumbnail('https://img/a') == thumb
+    assert restarted.thumbnail('https://img/a') == thumb
+    metrics = restarted.metrics()
+    assert (metrics['disk_hits'], metrics['memory_hits'], metrics['downloads']) == (1, 1, 0)
+
+
+def test_new_content_for_url_drops_the_old_blob(make_cache, remote, tmp_path):
+    cache = make_cache()
+    remote['https://img/random'] = png(10)
+    cache.fetch('https://img/random')
+    remote['https://img/random'] = png(20)
+    cache.fetch('https://img/random')
+
+    assert cache.image('https://img/random') == png(20)
+    assert not (tmp_path / 'images' / f'{sha(png(10))}.img').exists()
+    assert not (tmp_path / 'images' / f'{sha(png(10))}.thumb.jpg').exists()
+    assert cache.metrics()['images'] == 1
+
+
+def test_content_shared_by_another_url_is_kept(make_cache, remote):
+    cache = make_cache()
+    remote['https://img/a'] = remote['https://img/b'] = png(10)
+    cache.fetch('https://img/a')
+    cache.fetch('https://img/b')
+    assert cache.metrics()['images'] == 1
+
+    remote['https://img/a'] = png(20)
+    cache.fetch('https://img/a')
+    assert cache.image('https://img/b') == png(10)
+    assert cache.metrics()['images'] == 2
+
+
+def test_files_removed_behind_our_back(make_cache, remote, tmp_path):
+    cache = make_cache()
+    remote['https://img/a'] = png(10)
+    remote['https://img/b'] = png(20)
+    cache.fetch('https://img/a')
+    cache.fetch('https://img/b')
+
+    (tmp_path / 'images' / f'{sha(png(10))}.img').unlink()
+    restarted = make_cache()
+    assert restarted.thumbnail('https://img/a') == restarted.fallback()
+
+    # A missing thumbnail is dropped on first use instead of failing every rerun
+    (tmp_path / 'images' / f'{sha(png(20))}.thumb.jpg').unlink()
+    assert restarted.thumbnail('https://img/b') == restarted.fallback()
+    assert restarted.image('https://img/b') is None
+
+
+def test_evicts_least_recently_shown(make_cache, remote):
+    images = {f'https://img/{i}': png(40 * i + 10) for i in range(3)}
+    remote.update(images)
+    cache = make_cache()
+    cache.fetch('https://img/0')
+    # Room for two images (image plus thumbnail) but not three
+    cache.max_bytes = int(cache.metrics()['bytes'] * 2.5)
+    cache.fetch('https://img/1')
+    # Showing 0 makes 1 the least recently used
+    cache.thumbnail('https://img/0')
+    cache.fetch('https://img/2')
+
+    assert cache.image('https://img/1') is None
+    assert cache.image('https://img/0') == images['https://img/0']
+    assert cache.image('https://img/2') == images['https://img/2']
+    assert cache.metrics()['evicted'] == 1
+
+
+def test_memory_holds_at_most_memory_items(make_cache, remote):
+    cache = make_cache(memory_items=2)
+    for i in range(3):
+        remote[f'https://img/{i}'] = png(40 * i + 10)
+        cache.fetch(f'https://img/{i}')
+    cache.thumbnail('https://img/0')
+    assert cache.metrics()['disk_hits'] == 1
+    assert len(cache._memory) == 2
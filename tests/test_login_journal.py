@@ -0,0 +1,103 @@
+"""LoginJournal keeps logins appended by every process sharing the file
+
+Usage: python -m pytest tests
+"""
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from login_journal import LoginJournal
+
+
+class FakeStore:
+    def __init__(self):
+        self.last_logins = {}
+
+    def update_last_logins(self, last_logins):
+        self.last_logins.update(last_logins)
+        return len(last_logins)
+
+
+def lines(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def user(user_id, name):
+    return {'id': user_id, 'username': name}
+
+
+def test_replay_counts_logins(tmp_path):
+    path = tmp_path / 'logins.jsonl'
+    journal = LoginJournal(FakeStore(), path)
+    journal.record_success(user(1, 'Ana'))
+    journal.record_success(user(1, 'ana'))
+    path.write_text(path.read_text(encoding='utf-8') + '{"t": "torn', encoding='utf-8')
+
+    info = LoginJournal(FakeStore(), path).login_info('ANA')
+    assert info['login_count'] == 2
+
+
+def test_compact_keeps_other_instances_appends(tmp_path):
+    path = tmp_path / 'logins.jsonl'
+    store = FakeStore()
+    first = LoginJournal(store, path)
+    second = LoginJournal(store, path)
+    first.record_success(user(1, 'ana'))
+    second.record_success(user(2, 'bia'))
+    second.record_success(user(2, 'bia'))
+
+    first.compact()
+    summary = {entry['u']: entry for entry in lines(path)}
+    assert all(entry['e'] == 'state' for entry in summary.values())
+    assert summary['ana']['login_count'] == 1
+    assert summary['bia']['login_count'] == 2
+    assert set(store.last_logins) == {1, 2}
+    # The compacting instance also learns about the other's logins
+    assert first.login_info('bia')['login_count'] == 2
+
+    # A later compaction by the stale instance does not roll the file back
+    first.record_success(user(1, 'ana'))
+    second.compact()
+    summary = {entry['u']: entry for entry in lines(path)}
+    assert summary['ana']['login_count'] == 2
+    assert summary['bia']['login_count'] == 2
+
+
+def test_compact_at_exit_of_another_process_keeps_our_appends(tmp_path):
+    path = tmp_path / 'logins.jsonl'
+    journal = LoginJournal(FakeStore(), path)
+    journal.record_success(user(1, 'ana'))
+
+    code = textwrap.dedent("""
+        import sys
+        sys.path.insert(0, {root!r})
+        from login_journal import LoginJournal
+
+        class Store:
+            def update_last_logins(self, last_logins):
+                return len(last_logins)
+
+        LoginJournal(Store(), {path!r}).record_success({{'id': 2, 'username': 'bia'}})
+    """).format(root=str(ROOT), path=str(path))
+    # The child compacts in its atexit hook
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert all(entry['e'] == 'state' for entry in lines(path))
+
+    journal.record_success(user(1, 'ana'))
+    journal.compact()
+    summary = {entry['u']: entry for entry in lines(path)}
+    assert summary['ana']['login_count'] == 2
+    assert summary['bia']['login_count'] == 1
+
+
+def test_nothing_to_compact_leaves_file_alone(tmp_path):
+    path = tmp_path / 'logins.jsonl'
+    journal = LoginJournal(FakeStore(), path)
+    journal.compact()
+    assert not path.exists()
@@ -0,0 +1,170 @@
+"""money.parse_brl / parse_brl_value / format_currency against a corpus of real-world values,
+with pyarrow and through the standard-library fallback; parse_number's factorized path
+
+benchmarks/bench_money.py runs check_corpus before timing.
+
+Usage: python -m pytest tests
+"""
+import math
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import money
+from money import format_currency, parse_brl, parse_brl_value, parse_number
+
+NAN = float('nan')
+
+# (input, strict result, lenient result)
+PARSE_CORPUS = [
+    ('R$ 1.234,56', 1234.56, 1234.56),
+    ('1.234,56', 1234.56, 1234.56),
+    ('R$ 0,99', 0.99, 0.99),
+    ('R$ 1.000.000,00', 1000000.0, 1000000.0),
+    ('R$ 12,5', 12.5, 12.5),
+    ('-R$ 5,00', -5.0, -5.0),
+    ('R$ -5,00', -5.0, -5.0),
+    ('R$\xa01.234,56', 1234.56, 1234.56),
+    (' 47.687,85 ', 47687.85, 47687.85),
+    ('1234', 1234.0, 1234.0),
+    # '.' is always a thousands separator in these files
+    ('1.234', 1234.0, 1234.0),
+    ('R$ 1.234,56 (parcelado)', NAN, 1234.56),
+    ('aprox. 2.500,00', NAN, 2500.0),
+    ('', NAN, NAN),
+    ('R$', NAN, NAN),
+    ('abc', NAN, NAN),
+    ('1,2,3', NAN, 1.2),
+    (None, NAN, NAN),
+]
+
+FORMAT_CORPUS = [
+    (1234.56, 'R$ 1.234,56'),
+    (0.0, 'R$ 0,00'),
+    (0.005, 'R$ 0,01'),
+    (1000000, 'R$ 1.000.000,00'),
+    (-5.5, 'R$ -5,50'),
+    (47687.85, 'R$ 47.687,85'),
+]
+
+
+def same(a, b):
+    return (math.isnan(a) and math.isnan(b)) or abs(a - b) < 1e-9
+
+
+def check_corpus():
+    inputs = pd.Series([case[0] for case in PARSE_CORPUS], dtype=object)
+    for lenient, column in ((False, 1), (True, 2)):
+        parsed = parse_brl(inputs, lenient=lenient)
+        for (text, *expected), got in zip(PARSE_CORPUS, parsed):
+            assert same(got, expected[column - 1]), f"parse_brl({text!r}, lenient={lenient}) = {got}"
+
+    for text, expected, _ in PARSE_CORPUS:
+        try:
+            got = parse_brl_value(text)
+        except ValueError:
+            got = NAN
+        assert same(got, expected), f"parse_brl_value({text!r}) = {got}"
+
+    mixed = pd.Series([1234.5, 'R$ 1.000,00', None, 7], dtype=object)
+    assert np.allclose(parse_brl(mixed).to_numpy(), [1234.5, 1000.0, NAN, 7.0], equal_nan=True)
+
+    numbers = pd.Series([case[0] for case in FORMAT_CORPUS] + [NAN])
+    formatted = format_currency(numbers)
+    for (number, expected), got in zip(FORMAT_CORPUS, formatted):
+        assert got == expected, f"format_currency({number}) = {got!r}"
+        assert format_currency(number) == expected
+    assert formatted.iloc[-1] == ''
+
+    # Round trip
+    values = pd.Series(np.round(np.random.default_rng(0).uniform(-1e6, 1e6, 1000), 2))
+    assert np.allclose(parse_brl(format_currency(values)), values)
+
+
+@contextmanager
+def without_pyarrow():
+    """Run money's join/translate path even when pyarrow is installed"""
+    arrow, money.pa = money.pa, None
+    try:
+        yield
+    finally:
+        money.pa = arrow
+
+
+def test_corpus():
+    check_corpus()
+
+
+def test_corpus_without_pyarrow():
+    with without_pyarrow():
+        check_corpus()
+
+
+# (input, parse_number result): money, percentages and decimal commas as in PRAZO/DESCONTO
+NUMBER_CORPUS = [
+    ('R$ 1.234,56', 1234.56),
+    ('12,5%', 12.5),
+    ('12,5 %', 12.5),
+    ('40%', 40.0),
+    ('12,5', 12.5),
+    ('36', 36.0),
+    ('-3,5%', -3.5),
+    ('', NAN),
+    ('sem desconto', NAN),
+    (None, NAN),
+]
+
+
+@pytest.fixture(params=['arrow', 'stdlib'])
+def parse_path(request):
+    if request.param == 'arrow':
+        yield
+    else:
+        with without_pyarrow():
+            yield
+
+
+def check_numbers(got, expected):
+    assert len(got) == len(expected)
+    for value, want in zip(got, expected):
+        assert same(value, want), f"{value} != {want}"
+
+
+@pytest.mark.parametrize('repeat', [1, 500])
+def test_parse_number_corpus(parse_path, repeat):
+    # repeat=1 is mostly distinct and parsed directly; repeat=500 goes through factorize
+    texts = [text for text, _ in NUMBER_CORPUS] * repeat
+    series = pd.Series(texts, dtype=object, index=range(100, 100 + len(texts)), name='DESCONTO')
+    got = parse_number(series)
+    assert got.dtype == 'float64'
+    assert got.name == 'DESCONTO'
+    assert list(got.index) == list(series.index)
+    check_numbers(got, [number for _, number in NUMBER_CORPUS] * repeat)
+
+
+def test_parse_number_factorized_matches_direct(monkeypatch):
+    rng = np.random.default_rng(2)
+    texts = pd.Series(rng.choice(['10%', '12,5%', 'R$ 1.000,00', '', None, '36'], 20000), dtype=object)
+    factorized = parse_number(texts)
+    monkeypatch.setattr(money, 'FACTORIZE_SAMPLE', 1)
+    direct = parse_number(texts)
+    assert np.array_equal(factorized.to_numpy(), direct.to_numpy(), equal_nan=True)
+
+
+def test_parse_number_passes_numbers_through():
+    values = pd.Series([1, 2, 3], dtype='int64')
+    got = parse_number(values)
+    assert got.dtype == 'float64'
+    assert list(got) == [1.0, 2.0, 3.0]
+    mixed = pd.Series([12.5, '7,5%', None], dtype=object)
+    check_numbers(parse_number(mixed), [12.5, 7.5, NAN])
+
+
+def test_parse_number_accepts_plain_lists():
+    check_numbers(parse_number(['1,5%', '2']), [1.5, 2.0])
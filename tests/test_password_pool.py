@@ -0,0 +1,90 @@
+"""PasswordWorkerPool runs hashes off the caller's thread and sheds load when full
+
+Usage: python -m pytest tests
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import password_pool
+from password_pool import PasswordWorkerPool, PoolBusyError
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordWorkerPool(max_workers=2, max_pending=1, timeout=5)
+    yield pool
+    pool.shutdown()
+
+
+def test_check_and_hash_round_trip(pool):
+    pwhash = pool.hash_password('segredo', method='pbkdf2:sha256:1000')
+    assert pool.check_password(pwhash, 'segredo')
+    assert not pool.check_password(pwhash, 'errada')
+    assert pool.metrics()['completed'] == 3
+
+
+def test_runs_on_a_worker_thread(pool):
+    assert pool.run(threading.current_thread) is not threading.current_thread()
+
+
+def test_rejects_beyond_workers_plus_pending(pool):
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def slow():
+        started.release()
+        release.wait(5)
+        return True
+
+    with ThreadPoolExecutor(3) as callers:
+        # Two running and one queued fill max_workers + max_pending
+        futures = [callers.submit(pool.run, slow) for _ in range(3)]
+        for _ in range(2):
+            assert started.acquire(timeout=5)
+        deadline = time.monotonic() + 5
+        while pool.metrics()['in_flight'] < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        with pytest.raises(PoolBusyError):
+            pool.run(slow)
+        assert pool.metrics()['rejected'] == 1
+        release.set()
+        assert all(f.result(timeout=5) for f in futures)
+
+    # Slots come back once the work is done
+    assert pool.run(lambda: 'ok') == 'ok'
+    metrics = pool.metrics()
+    assert metrics['in_flight'] == 0 and metrics['completed'] == 4
+
+
+def test_errors_release_the_slot(pool):
+    def broken():
+        raise ValueError('hash inválido')
+
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            pool.run(broken)
+    assert pool.metrics()['in_flight'] == 0
+
+
+def test_inline_mode_runs_in_the_caller():
+    pool = PasswordWorkerPool(max_workers=0, max_pending=1)
+    assert pool.run(threading.current_thread) is threading.current_thread()
+
+
+def test_configure_replaces_the_process_pool(monkeypatch):
+    monkeypatch.setenv('PASSWORD_WORKERS', '1')
+    monkeypatch.setenv('PASSWORD_MAX_PENDING', '4')
+    try:
+        pool = password_pool.configure()
+        assert password_pool.get_pool() is pool
+        assert (pool.max_workers, pool.max_pending) == (1, 4)
+    finally:
+        password_pool.configure(2, 32)
@@ -0,0 +1,129 @@
+"""LoginRateLimiter sliding window, lockout and sweep of idle keys
+
+Usage: python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import rate_limiter
+from rate_limiter import LoginRateLimiter, MemoryAttemptStore, SQLiteAttemptStore
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryAttemptStore()
+    return SQLiteAttemptStore(tmp_path / 'attempts.db')
+
+
+def make_limiter(store, clock):
+    return LoginRateLimiter(store, max_attempts=3, window=60, lockout=30, clock=clock)
+
+
+def test_locks_after_max_attempts_inside_window(store):
+    clock = Clock()
+    limiter = make_limiter(store, clock)
+    assert limiter.remaining('ana') == 3
+    for left in (2, 1):
+        limiter.record_failure('ana')
+        assert limiter.remaining('ana') == left
+        assert limiter.retry_after('ana') == 0
+    clock.now += 5
+    limiter.record_failure('ana')
+    assert limiter.retry_after('ana') == pytest.approx(30)
+    assert limiter.remaining('ana') == 0
+    # Other keys are unaffected
+    assert limiter.remaining('bia') == 3
+
+    clock.now += 29
+    assert limiter.retry_after('ana') == pytest.approx(1)
+    clock.now += 1
+    assert limiter.retry_after('ana') == 0
+
+
+def test_failures_outside_window_do_not_count(store):
+    clock = Clock()
+    limiter = make_limiter(store, clock)
+    limiter.record_failure('ana')
+    limiter.record_failure('ana')
+    clock.now += 61
+    assert limiter.remaining('ana') == 3
+    limiter.record_failure('ana')
+    assert limiter.retry_after('ana') == 0
+    assert limiter.remaining('ana') == 2
+
+
+def test_served_lockout_starts_fresh_series(store):
+    clock = Clock()
+    limiter = make_limiter(store, clock)
+    for _ in range(3):
+        limiter.record_failure('ana')
+    clock.now += 30
+    # Still inside the window, but the lockout was served
+    assert limiter.record_failure('ana') == 1
+    assert limiter.remaining('ana') == 2
+
+
+def test_keeps_only_last_max_attempts_stamps(store):
+    clock = Clock()
+    limiter = make_limiter(store, clock)
+    for _ in range(10):
+        limiter.record_failure('ana')
+        clock.now += 1
+    assert len(store.get('ana')) == 3
+
+
+def test_reset_clears_key(store):
+    limiter = make_limiter(store, Clock())
+    for _ in range(3):
+        limiter.record_failure('ana')
+    limiter.reset('ana')
+    assert limiter.remaining('ana') == 3
+    assert store.get('ana') == []
+
+
+def test_sweep_evicts_idle_keys(store, monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'SWEEP_EVERY', 4)
+    clock = Clock()
+    limiter = make_limiter(store, clock)
+    limiter.record_failure('idle1')
+    limiter.record_failure('idle2')
+    clock.now += 61
+    limiter.record_failure('recent')
+    assert store.get('idle1')
+    # Fourth record triggers the sweep of keys idle longer than the window and lockout
+    limiter.record_failure('recent')
+    assert store.get('idle1') == []
+    assert store.get('idle2') == []
+    assert len(store.get('recent')) == 2
+
+
+def test_sqlite_store_is_shared_between_limiters(tmp_path):
+    clock = Clock()
+    first = make_limiter(SQLiteAttemptStore(tmp_path / 'attempts.db'), clock)
+    second = make_limiter(SQLiteAttemptStore(tmp_path / 'attempts.db'), clock)
+    first.record_failure('ana')
+    second.record_failure('ana')
+    first.record_failure('ana')
+    assert second.retry_after('ana') > 0
+
+
+def test_memory_store_is_bounded():
+    store = MemoryAttemptStore(max_keys=2)
+    limiter = make_limiter(store, Clock())
+    for key in ('a', 'b', 'c'):
+        limiter.record_failure(key)
+    assert store.get('a') == []
+    assert store.get('b') and store.get('c')
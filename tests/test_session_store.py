@@ -0,0 +1,186 @@
+"""Server-side session backends (LRU/TTL, touch on access, metrics) and id regeneration
+
+Usage: python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask, session
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import session_store
+from session_store import MemorySessionBackend, ServerSideSessionInterface, SQLiteSessionBackend
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend_and_clock(request, tmp_path):
+    clock = Clock()
+    if request.param == 'memory':
+        return MemorySessionBackend(ttl=60, clock=clock), clock
+    return SQLiteSessionBackend(tmp_path / 'sessions.db', ttl=60, clock=clock), clock
+
+
+def test_expires_after_ttl_idle(backend_and_clock):
+    backend, clock = backend_and_clock
+    backend.save('a', {'user': 1})
+    clock.now += 59
+    assert backend.get('a') == {'user': 1}
+    clock.now += 61
+    assert backend.get('a') is None
+    metrics = backend.metrics()
+    assert (metrics['hits'], metrics['misses'], metrics['sessions']) == (1, 1, 0)
+
+
+def test_access_pushes_expiry_forward(backend_and_clock):
+    backend, clock = backend_and_clock
+    backend.save('a', {'user': 1})
+    for _ in range(5):
+        clock.now += 50
+        assert backend.get('a') == {'user': 1}
+    assert backend.metrics()['sessions'] == 1
+
+
+def test_delete(backend_and_clock):
+    backend, _ = backend_and_clock
+    backend.save('a', {'user': 1})
+    backend.delete('a')
+    assert backend.get('a') is None
+
+
+def test_memory_lru_evicts_least_recently_used():
+    clock = Clock()
+    backend = MemorySessionBackend(ttl=60, max_entries=2, clock=clock)
+    backend.save('a', {})
+    backend.save('b', {})
+    # Touching a makes b the least recently used
+    assert backend.get('a') == {}
+    backend.save('c', {})
+    assert backend.get('b') is None
+    assert backend.get('a') == {} and backend.get('c') == {}
+    assert backend.metrics()['evicted'] == 1
+
+
+def test_memory_sweep_counts_expired():
+    clock = Clock()
+    backend = MemorySessionBackend(ttl=60, clock=clock)
+    for sid in ('a', 'b', 'c'):
+        backend.save(sid, {})
+    clock.now += 30
+    backend.get('c')
+    clock.now += 31
+    metrics = backend.metrics()
+    assert metrics['sessions'] == 1
+    assert metrics['expired'] == 2
+
+
+def test_sqlite_sweep_removes_expired_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, 'SWEEP_EVERY', 3)
+    clock = Clock()
+    backend = SQLiteSessionBackend(tmp_path / 'sessions.db', ttl=60, clock=clock)
+    backend.save('old1', {})
+    backend.save('old2', {})
+    clock.now += 61
+    backend.save('new', {})
+    assert backend.metrics()['expired'] == 2
+    rows = backend._connection().execute("SELECT sid FROM sessions").fetchall()
+    assert rows == [('new',)]
+
+
+def test_sqlite_sessions_shared_between_workers(tmp_path):
+    clock = Clock()
+    first = SQLiteSessionBackend(tmp_path / 'sessions.db', ttl=60, clock=clock)
+    second = SQLiteSessionBackend(tmp_path / 'sessions.db', ttl=60, clock=clock)
+    first.save('a', {'user': 1})
+    assert second.get('a') == {'user': 1}
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.session_interface = ServerSideSessionInterface(MemorySessionBackend(ttl=60))
+
+    @app.route('/set/<value>')
+    def set_value(value):
+        session['value'] = value
+        return ''
+
+    @app.route('/get')
+    def get_value():
+        return session.get('value', '')
+
+    @app.route('/regenerate')
+    def regenerate():
+        app.session_interface.regenerate(session)
+        return ''
+
+    @app.route('/clear')
+    def clear():
+        session.clear()
+        app.session_interface.regenerate(session)
+        return ''
+
+    return app
+
+
+def sid(client):
+    cookie = client.get_cookie('session')
+    return cookie.value if cookie else None
+
+
+def test_cookie_holds_only_the_id(app):
+    client = app.test_client()
+    client.get('/set/segredo')
+    assert 'segredo' not in sid(client)
+    assert client.get('/get').text == 'segredo'
+
+
+def test_regenerate_moves_data_to_new_id(app):
+    backend = app.session_interface.backend
+    client = app.test_client()
+    client.get('/set/x')
+    old = sid(client)
+    client.get('/regenerate')
+    new = sid(client)
+    assert new != old
+    assert backend.get(old) is None
+    assert backend.get(new) == {'value': 'x'}
+    assert client.get('/get').text == 'x'
+
+
+def test_regenerate_on_empty_session_drops_cookie(app):
+    backend = app.session_interface.backend
+    client = app.test_client()
+    client.get('/set/x')
+    old = sid(client)
+    client.get('/clear')
+    assert sid(client) is None
+    assert backend.get(old) is None
+
+
+def test_login_and_logout_issue_new_session_ids(dashboard_module):
+    app = dashboard_module.app
+    backend = app.session_interface.backend
+    client = app.test_client()
+    # An id planted before authentication must not become the logged-in one
+    backend.save('planted', {})
+    client.set_cookie('session', 'planted')
+    response = client.post('/login', json={'username': 'admin', 'password': 'admin123'})
+    assert response.status_code == 200, response.get_json()
+    logged_in = sid(client)
+    assert logged_in != 'planted'
+    assert backend.get('planted') is None
+    assert backend.get(logged_in)['_user_id'] == '1'
+
+    client.get('/logout')
+    assert backend.get(logged_in) is None
+    assert sid(client) != logged_in
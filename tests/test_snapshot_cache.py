@@ -0,0 +1,76 @@
+"""SnapshotCache serves a snapshot only for the CSV it was parsed from
+
+Usage: python -m pytest tests
+"""
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from snapshot_cache import SnapshotCache, file_fingerprint
+
+pytest.importorskip("pyarrow")
+
+
+def write_source(path, value, mtime_ns=None):
+    path.write_text(f"a,b\n{value},x\n", encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return pd.DataFrame({"a": [value], "b": ["x"]}), file_fingerprint(path)
+
+
+def test_round_trip(tmp_path):
+    source = tmp_path / "contratos.csv"
+    df, fingerprint = write_source(source, 1)
+    cache = SnapshotCache(source)
+    assert cache.load() is None
+    assert cache.store(df, fingerprint)
+    pd.testing.assert_frame_equal(cache.load(), df)
+
+
+def test_snapshot_from_an_older_parse_is_never_served(tmp_path):
+    # Refresher parses v1, a request parses v2; the v1 writer finishes last
+    source = tmp_path / "contratos.csv"
+    old_df, old_fingerprint = write_source(source, 1, mtime_ns=1_000_000_000)
+    new_df, new_fingerprint = write_source(source, 2, mtime_ns=2_000_000_000)
+    cache = SnapshotCache(source)
+
+    cache.store(new_df, new_fingerprint)
+    cache.store(old_df, old_fingerprint)
+    assert cache.load() is None
+    # Whatever sidecar the other writer leaves behind can't vouch for the v1 data
+    cache._write_manifest({key: new_fingerprint[key] for key in ("sha256", "size", "mtime_ns")})
+    assert cache.load() is None
+
+    cache.store(new_df, new_fingerprint)
+    pd.testing.assert_frame_equal(cache.load(), new_df)
+
+
+def test_touched_file_keeps_snapshot_until_content_changes(tmp_path):
+    source = tmp_path / "contratos.csv"
+    df, fingerprint = write_source(source, 1, mtime_ns=1_000_000_000)
+    cache = SnapshotCache(source)
+    cache.store(df, fingerprint)
+
+    os.utime(source, ns=(3_000_000_000, 3_000_000_000))
+    pd.testing.assert_frame_equal(cache.load(), df)
+    assert cache.manifest_path.exists()
+    pd.testing.assert_frame_equal(cache.load(), df)
+
+    # Same size, new bytes: the manifest vouches for the old hash only
+    write_source(source, 7, mtime_ns=4_000_000_000)
+    assert cache.load() is None
+
+
+def test_unreadable_snapshot_is_discarded(tmp_path):
+    source = tmp_path / "contratos.csv"
+    df, fingerprint = write_source(source, 1)
+    cache = SnapshotCache(source)
+    cache.store(df, fingerprint)
+    cache.snapshot_path.write_bytes(b"not arrow")
+    assert cache.load() is None
+    assert not cache.snapshot_path.exists()
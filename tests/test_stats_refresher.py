@@ -0,0 +1,136 @@
+"""StatsRefresher serves the last good stats and swaps in new ones in the background
+
+Usage: python -m pytest tests
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stats_refresher import StatsRefresher
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condição não atingida"
+        time.sleep(0.01)
+
+
+class Source:
+    def __init__(self, path):
+        self.path = path
+        self.version = 0
+        self.calls = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+        path.write_text('0', encoding='utf-8')
+
+    def change(self):
+        self.version += 1
+        self.path.write_text(str(self.version) * (self.version + 1), encoding='utf-8')
+
+    def compute(self):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise ValueError("arquivo quebrado")
+        return {'version': int(self.path.read_text(encoding='utf-8')[0])}
+
+
+def make_refresher(tmp_path, **kwargs):
+    source = Source(tmp_path / 'contratos.csv')
+    options = dict(poll_interval=0.02, refresh_interval=3600, fallback={'version': None})
+    options.update(kwargs)
+    return source, StatsRefresher(source.compute, source.path, **options)
+
+
+def test_first_request_waits_then_gets_the_result(tmp_path):
+    source, refresher = make_refresher(tmp_path)
+    try:
+        stats, generated_at = refresher.get()
+        assert stats == {'version': 0}
+        assert generated_at is not None
+    finally:
+        refresher.stop()
+
+
+def test_fallback_when_first_result_takes_too_long(tmp_path):
+    source, refresher = make_refresher(tmp_path, first_result_timeout=0.05)
+    source.release.clear()
+    try:
+        assert refresher.get() == ({'version': None}, None)
+    finally:
+        source.release.set()
+        refresher.stop()
+
+
+def test_change_is_swapped_in_while_requests_keep_the_old_stats(tmp_path):
+    source, refresher = make_refresher(tmp_path)
+    try:
+        assert refresher.get()[0] == {'version': 0}
+        source.release.clear()
+        source.change()
+        calls = source.calls
+        wait_for(lambda: source.calls > calls)
+        # The recompute is blocked: requests get the previous stats without waiting
+        start = time.monotonic()
+        assert refresher.get()[0] == {'version': 0}
+        assert time.monotonic() - start < 0.5
+        source.release.set()
+        wait_for(lambda: refresher.get()[0] == {'version': 1})
+    finally:
+        source.release.set()
+        refresher.stop()
+
+
+def test_versioned_signature_matches_the_file_the_stats_came_from(tmp_path):
+    source, refresher = make_refresher(tmp_path)
+    try:
+        _, _, signature = refresher.get_versioned()
+        stat = source.path.stat()
+        assert signature == (stat.st_size, stat.st_mtime_ns)
+    finally:
+        refresher.stop()
+
+
+def test_failed_refresh_keeps_the_last_good_stats(tmp_path):
+    source, refresher = make_refresher(tmp_path)
+    try:
+        assert refresher.get()[0] == {'version': 0}
+        source.fail = True
+        source.change()
+        wait_for(lambda: refresher.failures >= 1)
+        assert refresher.get()[0] == {'version': 0}
+        # The broken file isn't retried on every poll
+        calls = source.calls
+        time.sleep(0.2)
+        assert source.calls == calls
+    finally:
+        refresher.stop()
+
+
+def test_staleness_is_measured_from_the_change(tmp_path):
+    source, refresher = make_refresher(tmp_path)
+    try:
+        refresher.get()
+        assert refresher.metrics()['staleness_seconds']['max'] == 0.0
+        source.release.clear()
+        source.change()
+        calls = source.calls
+        wait_for(lambda: source.calls > calls)
+        time.sleep(0.1)
+        refresher.get()
+        assert refresher.metrics()['staleness_seconds']['max'] >= 0.1
+        source.release.set()
+        wait_for(lambda: refresher.get()[0] == {'version': 1})
+        refresher.get()
+        metrics = refresher.metrics()
+        assert metrics['staleness_seconds']['p50'] == 0.0
+        assert metrics['refreshes'] == 2 and metrics['served'] >= 3
+    finally:
+        source.release.set()
+        refresher.stop()
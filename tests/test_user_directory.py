@@ -0,0 +1,87 @@
+"""UserStore's cached directory picks up changes made by other processes
+
+Usage: python -m pytest tests
+"""
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import user_store
+from user_store import UserStore
+
+
+class Clock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def add_in_other_process(db_path, username):
+    code = textwrap.dedent("""
+        import sys
+        sys.path.insert(0, {root!r})
+        from user_store import UserStore
+        UserStore({db!r}, legacy_files=[]).add_user({{'username': {name!r}, 'password': 'x'}})
+    """).format(root=str(ROOT), db=str(db_path), name=username)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_other_process_change_visible_after_interval(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(user_store.time, 'monotonic', clock)
+    db_path = tmp_path / 'users.db'
+    store = UserStore(db_path, legacy_files=[], reload_interval=5)
+    store.add_user({'username': 'ana', 'password': 'x'})
+    assert store.get_by_username('ana') is not None
+    reloads = store.reloads
+
+    add_in_other_process(db_path, 'bia')
+    # Inside the interval the cached copy is served without touching the files
+    clock.now += 4
+    assert store.get_by_username('bia') is None
+    assert store.reloads == reloads
+
+    clock.now += 1
+    assert store.get_by_username('BIA')['username'] == 'bia'
+    assert store.count() == 2
+    assert store.reloads == reloads + 1
+
+
+def test_unchanged_files_do_not_reload(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(user_store.time, 'monotonic', clock)
+    store = UserStore(tmp_path / 'users.db', legacy_files=[], reload_interval=1)
+    store.add_user({'username': 'ana', 'password': 'x'})
+    store.list_users()
+    reloads = store.reloads
+    for _ in range(5):
+        clock.now += 2
+        assert store.get_by_username('ana') is not None
+    assert store.reloads == reloads
+
+
+def test_own_mutation_visible_at_once(tmp_path):
+    store = UserStore(tmp_path / 'users.db', legacy_files=[], reload_interval=3600)
+    assert store.count() == 0
+    user = store.add_user({'username': 'ana', 'password': 'x'})
+    assert store.count() == 1
+    store.update_user(user['id'], name='Ana')
+    assert store.get_by_id(user['id'])['name'] == 'Ana'
+    store.delete_user(user['id'])
+    assert store.get_by_username('ana') is None
+
+
+def test_readers_get_copies(tmp_path):
+    store = UserStore(tmp_path / 'users.db', legacy_files=[])
+    user = store.add_user({'username': 'ana', 'password': 'x'})
+    store.get_by_id(user['id'])['name'] = 'alterado'
+    store.list_users()[0]['role'] = 'admin'
+    assert store.get_by_id(user['id'])['name'] is None
+    assert store.get_by_username('ana')['role'] == 'user'
@@ -0,0 +1,98 @@
+"""Crash safety of UserStore writes
+
+Each test runs a child process that mutates the store and then dies with
+os._exit (no atexit, no cleanup), and reopens the database afterwards.
+
+Usage: python -m pytest tests
+"""
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from user_store import UserStore
+
+N = 50
+
+
+def crash_after(db_path, body):
+    """Run `body` against a fresh store in a child process that then exits without cleanup"""
+    code = textwrap.dedent("""
+        import os, sys
+        sys.path.insert(0, {root!r})
+        from user_store import UserStore
+        store = UserStore({db!r}, legacy_files=[])
+    """).format(root=str(ROOT), db=str(db_path))
+    code += textwrap.dedent(body) + "\nos._exit(1)\n"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.returncode == 1, result.stderr
+    return UserStore(db_path, legacy_files=[])
+
+
+def usernames(store):
+    return {user['username'] for user in store.list_users()}
+
+
+def test_acknowledged_mutations_survive_crash(tmp_path):
+    store = crash_after(tmp_path / 'users.db', f"""
+        for i in range({N}):
+            assert store.add_user({{'username': 'acked%d' % i, 'password': 'x'}})
+        assert store.update_user(1, name='renomeado')
+        assert store.delete_user(2)
+    """)
+    assert usernames(store) == {f'acked{i}' for i in range(N)} - {'acked1'}
+    assert store.get_by_id(1)['name'] == 'renomeado'
+
+
+def test_completed_batch_survives_crash(tmp_path):
+    store = crash_after(tmp_path / 'users.db', f"""
+        with store.batch():
+            for i in range({N}):
+                store.add_user({{'username': 'batch%d' % i, 'password': 'x'}})
+            store.update_user(1, name='renomeado')
+    """)
+    assert usernames(store) == {f'batch{i}' for i in range(N)}
+    assert store.get_by_id(1)['name'] == 'renomeado'
+
+
+def test_crash_inside_open_batch_drops_whole_block(tmp_path):
+    store = crash_after(tmp_path / 'users.db', f"""
+        for i in range({N}):
+            store.add_user({{'username': 'acked%d' % i, 'password': 'x'}})
+        with store.batch():
+            for i in range({N}):
+                store.add_user({{'username': 'pending%d' % i, 'password': 'x'}})
+                store.update_user(1, name='pending%d' % i)
+            store.delete_user(2)
+            # Reads inside the block see its rows
+            assert store.count() == {2 * N - 1}
+            os._exit(1)
+    """)
+    # Nothing returned from batch(), so nothing of it may survive
+    assert usernames(store) == {f'acked{i}' for i in range(N)}
+    assert store.get_by_id(1)['name'] is None
+
+
+def test_exception_rolls_back_batch(tmp_path):
+    store = UserStore(tmp_path / 'users.db', legacy_files=[])
+    store.add_user({'username': 'antes', 'password': 'x'})
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.add_user({'username': 'dentro', 'password': 'x'})
+            raise RuntimeError('falhou')
+    assert usernames(store) == {'antes'}
+
+
+def test_batch_is_invisible_to_other_connections_until_it_exits(tmp_path):
+    store = UserStore(tmp_path / 'users.db', legacy_files=[])
+    other = UserStore(tmp_path / 'users.db', legacy_files=[], reload_interval=0)
+    with store.batch():
+        store.add_user({'username': 'novo', 'password': 'x'})
+        assert store.get_by_username('NOVO') is not None
+        assert other.get_by_username('novo') is None
+    assert other.get_by_username('novo') is not None
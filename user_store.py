@@ -0,0 +1,316 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path("data/users.db")
+# Earlier file-based stores: calculator.py's UserManager and dashboard.py
+LEGACY_JSON_FILES = [Path("data/users.json"), Path("users.json")]
+USER_COLUMNS = ('id', 'username', 'password', 'name', 'role', 'created_at', 'last_login')
+# Longest a process may serve its cached directory after another process changed it
+DEFAULT_RELOAD_INTERVAL = float(os.environ.get('USER_RELOAD_INTERVAL', 1.0))
+
+
+class UserStore:
+    """SQLite user directory shared by dashboard.py and UserManager.
+
+    Lookups by id use the primary key and lookups by username use a
+    case-insensitive unique index, so login cost doesn't grow with the
+    number of users. The database runs in WAL mode: readers in other
+    processes are never blocked by a write, and a write touches only the
+    affected row.
+
+    Every mutation is committed before it returns, so a caller that
+    reports success never reports a change a crash can undo, and the
+    SQLite write lock is held only for the statement. Code that makes
+    several mutations in a row wraps them in batch() to pay for one
+    commit; the block is committed when it exits and a crash or an
+    exception inside it rolls the whole block back, never part of it.
+
+    Reads are served from an in-process copy of the directory. At most
+    every `reload_interval` seconds it stats the database and its WAL;
+    a commit from any process changes one of them and the copy is
+    reloaded. Mutations made through this store drop the copy at once.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, legacy_files=LEGACY_JSON_FILES,
+                 reload_interval=DEFAULT_RELOAD_INTERVAL):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.reload_interval = reload_interval
+        self._cache = None
+        self._cache_signature = None
+        self._checked_at = 0.0
+        self._cache_lock = threading.Lock()
+        self.reloads = 0
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._create_schema()
+        self.migrate_from_json(legacy_files)
+
+    def _open(self, **kwargs):
+        conn = sqlite3.connect(self.db_path, timeout=10, **kwargs)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self):
+        # sqlite3 connections can't be shared between threads; keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    def _in_batch(self):
+        return getattr(self._local, 'in_batch', False)
+
+    @contextmanager
+    def _write(self):
+        """Connection for one mutation, committed on exit unless inside batch()"""
+        with self._write_lock:
+            conn = self._connection()
+            if self._in_batch():
+                conn.execute("SAVEPOINT mutation")
+                try:
+                    yield conn
+                except BaseException:
+                    # Undo only this mutation; the caller decides about the rest of the block
+                    conn.execute("ROLLBACK TO mutation")
+                    conn.execute("RELEASE mutation")
+                    raise
+                conn.execute("RELEASE mutation")
+            else:
+                with conn:
+                    yield conn
+        self.invalidate()
+
+    @contextmanager
+    def batch(self):
+        """Run the mutations of the block in one transaction, committed when it exits.
+
+        Until then nothing is visible to other threads or processes and
+        other writers wait, so keep the block short. Reads inside the block
+        see its rows. Nested blocks join the outer one.
+        """
+        if self._in_batch():
+            yield self
+            return
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.in_batch = True
+            try:
+                yield self
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                try:
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logging.error(f"Erro ao gravar alterações de usuários: {str(e)}")
+                    conn.rollback()
+                    raise
+            finally:
+                self._local.in_batch = False
+                self.invalidate()
+
+    def _file_signature(self):
+        signature = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + '-wal')):
+            try:
+                stat = path.stat()
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def invalidate(self):
+        with self._cache_lock:
+            self._cache = None
+
+    def _directory(self):
+        """Cached {'by_id', 'by_username', 'users'}, or None inside this thread's batch()"""
+        if self._in_batch():
+            return None
+
+        with self._cache_lock:
+            now = time.monotonic()
+            if self._cache is not None and now - self._checked_at < self.reload_interval:
+                return self._cache
+
+            # Stat before reading so a commit racing the reload is caught by the next check
+            signature = self._file_signature()
+            self._checked_at = now
+            if self._cache is None or signature != self._cache_signature:
+                rows = self._query("SELECT * FROM users ORDER BY id")
+                users = [self._to_dict(row) for row in rows]
+                self._cache = {
+                    'by_id': {user['id']: user for user in users},
+                    'by_username': {user['username'].lower(): user for user in users},
+                    'users': users
+                }
+                self._cache_signature = signature
+                self.reloads += 1
+            return self._cache
+
+    def _query(self, sql, params=()):
+        # Inside batch() this is the connection holding the open transaction
+        return self._connection().execute(sql, params).fetchall()
+
+    def _create_schema(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY,
+                    username TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                    password TEXT NOT NULL,
+                    name TEXT,
+                    role TEXT NOT NULL DEFAULT 'user',
+                    created_at TEXT,
+                    last_login TEXT,
+                    extra TEXT
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    @staticmethod
+    def _to_dict(row):
+        if row is None:
+            return None
+        user = {col: row[col] for col in USER_COLUMNS}
+        if row['extra']:
+            user.update(json.loads(row['extra']))
+        return user
+
+    def migrate_from_json(self, paths):
+        """Import the legacy users.json files once; later calls are no-ops.
+
+        Files are read in order and the first occurrence of a username
+        (case-insensitive) wins. Ids are kept unless already taken.
+        """
+        conn = self._connection()
+        with conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+                return 0
+
+            imported = 0
+            for path in map(Path, paths):
+                if not path.exists():
+                    continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        users = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logging.error(f"Não foi possível migrar {path}: {str(e)}")
+                    continue
+
+                for user in users:
+                    if self._insert(conn, user) is not None:
+                        imported += 1
+
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (datetime.now().isoformat(),)
+            )
+        if imported:
+            logging.info(f"{imported} usuários migrados dos arquivos JSON para {self.db_path}")
+        return imported
+
+    def _insert(self, conn, user):
+        extra = {k: v for k, v in user.items() if k not in USER_COLUMNS}
+        user_id = user.get('id')
+        if user_id is not None and conn.execute("SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone():
+            user_id = None
+        try:
+            cursor = conn.execute(
+                "INSERT INTO users (id, username, password, name, role, created_at, last_login, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    user['username'],
+                    user['password'],
+                    user.get('name'),
+                    user.get('role', 'user'),
+                    user.get('created_at'),
+                    user.get('last_login'),
+                    json.dumps(extra, ensure_ascii=False) if extra else None
+                )
+            )
+        except sqlite3.IntegrityError:
+            return None
+        return cursor.lastrowid
+
+    # Readers get copies: callers such as UserManager.authenticate modify the dict
+
+    def get_by_id(self, user_id):
+        directory = self._directory()
+        if directory is not None:
+            user = directory['by_id'].get(user_id)
+            return dict(user) if user else None
+        rows = self._query("SELECT * FROM users WHERE id = ?", (user_id,))
+        return self._to_dict(rows[0] if rows else None)
+
+    def get_by_username(self, username):
+        """Case-insensitive lookup through the username index"""
+        directory = self._directory()
+        if directory is not None:
+            user = directory['by_username'].get(str(username).lower())
+            return dict(user) if user else None
+        rows = self._query("SELECT * FROM users WHERE username = ?", (username,))
+        return self._to_dict(rows[0] if rows else None)
+
+    def list_users(self):
+        directory = self._directory()
+        if directory is not None:
+            return [dict(user) for user in directory['users']]
+        rows = self._query("SELECT * FROM users ORDER BY id")
+        return [self._to_dict(row) for row in rows]
+
+    def count(self):
+        directory = self._directory()
+        if directory is not None:
+            return len(directory['users'])
+        return self._query("SELECT COUNT(*) FROM users")[0][0]
+
+    def add_user(self, user):
+        """Insert a user dict; returns the stored user, or None if the username is taken"""
+        with self._write() as conn:
+            user_id = self._insert(conn, user)
+        return self.get_by_id(user_id) if user_id is not None else None
+
+    def update_user(self, user_id, **fields):
+        """Update columns of one user; returns False if it doesn't exist"""
+        fields = {k: v for k, v in fields.items() if k in USER_COLUMNS and k != 'id'}
+        if not fields:
+            return self.get_by_id(user_id) is not None
+        assignments = ", ".join(f"{col} = ?" for col in fields)
+        with self._write() as conn:
+            cursor = conn.execute(
+                f"UPDATE users SET {assignments} WHERE id = ?",
+                (*fields.values(), user_id)
+            )
+        return cursor.rowcount > 0
+
+    def update_last_logins(self, last_logins):
+        """Set last_login for many users ({id: iso timestamp}) in one transaction"""
+        if not last_logins:
+            return 0
+        with self._write() as conn:
+            cursor = conn.executemany(
+                "UPDATE users SET last_login = ? WHERE id = ?",
+                [(ts, user_id) for user_id, ts in last_logins.items()]
+            )
+        return cursor.rowcount
+
+    def delete_user(self, user_id):
+        with self._write() as conn:
+            cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        return cursor.rowcount > 0